@@ -17,7 +17,7 @@ def parse_args() -> argparse.Namespace:
 
 async def run(url: str) -> None:
     data = await fetch_wcr_data(base_url=url)
-    units = data.get("units")
+    units = data.get("units") or []
     if isinstance(units, dict) and "units" in units:
         units = units["units"]
     print(f"Fetched {len(units)} units.")
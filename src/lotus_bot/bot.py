@@ -8,6 +8,7 @@ from discord.ext import commands
 from dotenv import load_dotenv
 
 from lotus_bot.log_setup import setup_logging, get_logger
+from lotus_bot.utils.compute import get_compute_pool
 from lotus_bot.cogs.quiz.question_state import QuestionStateManager
 from lotus_bot.cogs.quiz.question_generator import QuestionGenerator
 from lotus_bot.cogs.quiz.quiz_config import QuizAreaConfig
@@ -254,6 +255,7 @@ class MyBot(commands.Bot):
         """Entlade alle Cogs, bevor der Bot beendet wird."""
         for cog_name in list(self.cogs.keys()):
             await self.remove_cog(cog_name)
+        get_compute_pool().shutdown()
         await super().close()
 
 
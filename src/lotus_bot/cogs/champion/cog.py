@@ -1,17 +1,33 @@
 import discord
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from discord.ext import commands
 from typing import Optional, List
 import os
 import aiosqlite
 
 from lotus_bot.log_setup import get_logger
+from lotus_bot.utils.coalescing_queue import CoalescingQueue
 from lotus_bot.utils.managed_cog import ManagedTaskCog
 from .data import ChampionData
 
 logger = get_logger(__name__)
 
+# Pause zwischen zwei Rollen-Requests beim Massenabgleich (Sekunden)
+ROLE_SYNC_INTERVAL = 0.5
+# Nach so vielen Nutzern wird der Fortschritt gespeichert
+ROLE_SYNC_CHECKPOINT = 25
+# Rollen-Updates pro Durchlauf des Workers
+UPDATE_BATCH_SIZE = 50
+# Wartezeit, damit Punkte-Bursts pro Nutzer zusammenfallen (Sekunden)
+UPDATE_COALESCE_DELAY = 0.25
+# Ab so vielen ausstehenden Nutzern wird eine Warnung geloggt
+UPDATE_QUEUE_WARN_SIZE = 1000
+# Roh-Historie älter als so viele Tage wandert ins Archiv
+HISTORY_RETENTION_DAYS = 365
+# Abstand zwischen zwei Archivierungsläufen (Sekunden)
+ARCHIVE_INTERVAL = 24 * 60 * 60
+
 
 @dataclass
 class ChampionRole:
@@ -22,14 +38,32 @@ class ChampionRole:
     threshold: int
 
 
+@dataclass
+class RoleChange:
+    """Nötige Rollenänderungen für ein Mitglied."""
+
+    member: discord.Member
+    add: list[discord.Role] = field(default_factory=list)
+    remove: list[discord.Role] = field(default_factory=list)
+
+
+@dataclass
+class RoleSyncResult:
+    """Zusammenfassung eines Rollenabgleichs."""
+
+    checked: int = 0
+    changed: int = 0
+    missing: int = 0
+    failed: int = 0
+
+
 class ChampionCog(ManagedTaskCog):
     def __init__(self, bot: commands.Bot) -> None:
         """Initialisiert das Cog und lädt die Rollenkonfiguration.
 
         Der Pfad zur Punkte-Datenbank kann \u00fcber die Environment-Variable
         ``CHAMPION_DB_PATH`` angepasst werden. Die Warteschlange für
-        Rollen-Updates fasst maximal ``1000`` Einträge. Ist sie voll, wird
-        beim nächsten Punkteeintrag ein ``RuntimeError`` ausgelöst.
+        Rollen-Updates hält pro Nutzer nur den neuesten Punktestand.
         """
         super().__init__()
         self.bot = bot
@@ -38,11 +72,17 @@ class ChampionCog(ManagedTaskCog):
         self.data = ChampionData(db_path)
 
         self.roles: List[ChampionRole] = self._load_roles_config()
+        # (ChampionData.version, gerenderter Text) der letzten Bestenliste
+        self._leaderboard_cache: tuple[int, str] | None = None
 
-        self.create_task(self.sync_all_roles())
+        self._sync_lock = asyncio.Lock()
+        self.create_task(self._startup_sync())
 
-        self.update_queue: asyncio.Queue[tuple[str, int]] = asyncio.Queue(maxsize=1000)
+        self.update_queue: CoalescingQueue[str, int] = CoalescingQueue(
+            warn_size=UPDATE_QUEUE_WARN_SIZE
+        )
         self.worker_task = self.create_task(self._worker())
+        self.create_task(self._archive_loop())
 
     def _load_roles_config(self) -> list[ChampionRole]:
         """Gibt die Rollenschwellen absteigend sortiert zurück."""
@@ -58,6 +98,17 @@ class ChampionCog(ManagedTaskCog):
         roles.sort(key=lambda r: -r.threshold)
         return roles
 
+    def cached_leaderboard(self) -> str | None:
+        """Gibt die gerenderte Bestenliste zurück, solange sich keine Punkte änderten."""
+        cache = self._leaderboard_cache
+        if cache and cache[0] == self.data.version:
+            return cache[1]
+        return None
+
+    def cache_leaderboard(self, version: int, text: str) -> None:
+        """Merkt sich ``text`` für den Datenstand ``version``."""
+        self._leaderboard_cache = (version, text)
+
     def get_current_role(self, score: int) -> Optional[ChampionRole]:
         """Ermittelt die höchste Rolle, für die ein Nutzer genug Punkte hat."""
         for role in self.roles:
@@ -72,7 +123,7 @@ class ChampionCog(ManagedTaskCog):
         ------
         RuntimeError
             Wenn die Punkte aufgrund eines Datenbankfehlers nicht gespeichert
-            werden können oder die Update-Warteschlange voll ist.
+            werden können.
         """
         user_id_str = str(user_id)
         try:
@@ -84,43 +135,115 @@ class ChampionCog(ManagedTaskCog):
             )
             raise RuntimeError("Fehler beim Speichern der Punkte.") from exc
 
-        try:
-            self.update_queue.put_nowait((user_id_str, new_total))
-        except asyncio.QueueFull as exc:
-            logger.error("[ChampionCog] update_queue full", exc_info=exc)
-            raise RuntimeError("Update-Warteschlange ist voll.") from exc
-
+        self.update_queue.put(user_id_str, new_total)
         return new_total
 
-    async def sync_all_roles(self) -> None:
-        """Synchronisiert die Champion-Rollen aller gespeicherten Nutzer."""
-        user_ids = await self.data.get_all_user_ids()
-        for user_id_str in user_ids:
-            total = await self.data.get_total(user_id_str)
-            await self._apply_champion_role(user_id_str, total)
+    @property
+    def role_sync_running(self) -> bool:
+        return self._sync_lock.locked()
+
+    async def _startup_sync(self) -> None:
+        await self.bot.wait_until_ready()
+        await self.sync_all_roles()
+
+    async def _archive_loop(self) -> None:
+        """Archiviert alte Historie einmal täglich."""
+        await self.bot.wait_until_ready()
+        while True:
+            try:
+                await self.data.archive_history(HISTORY_RETENTION_DAYS)
+            except aiosqlite.Error as exc:
+                logger.error(
+                    f"[ChampionCog] History archival failed: {exc}", exc_info=True
+                )
+            await asyncio.sleep(ARCHIVE_INTERVAL)
+
+    async def sync_all_roles(self) -> RoleSyncResult:
+        """Gleicht die Champion-Rollen aller gespeicherten Nutzer ab.
+
+        Alle Punktestände kommen aus einer Abfrage, die Zielrollen werden gegen
+        die gecachten Mitgliederrollen verglichen (fehlende Mitglieder werden
+        nachgeladen) und nur nötige Änderungen gedrosselt gesendet. Ein abgebrochener Lauf setzt beim gespeicherten
+        Fortschritt fort.
+        """
+        result = RoleSyncResult()
+        async with self._sync_lock:
+            guild = self.bot.main_guild
+            if not isinstance(guild, discord.Guild):
+                logger.warning("[ChampionCog] Guild not found, role sync skipped.")
+                return result
+
+            totals = await self.data.get_all_totals()
+            cursor = await self.data.get_sync_cursor()
+            if cursor is not None:
+                totals = [(uid, total) for uid, total in totals if uid > cursor]
+                logger.info(
+                    f"[ChampionCog] Resuming role sync after {cursor} "
+                    f"({len(totals)} users left)."
+                )
+
+            for user_id_str, total in totals:
+                result.checked += 1
+                member = guild.get_member(int(user_id_str))
+                if member is None:
+                    member = await self._fetch_member(guild, int(user_id_str), result)
+                if member is not None:
+                    change = self.plan_role_change(guild, member, total)
+                    if change is not None:
+                        if await self._apply_role_change(change, total, paced=True):
+                            result.changed += 1
+                        else:
+                            result.failed += 1
+                if result.checked % ROLE_SYNC_CHECKPOINT == 0:
+                    await self.data.set_sync_cursor(user_id_str)
+
+            await self.data.set_sync_cursor(None)
+
+        logger.info(
+            f"[ChampionCog] Role sync finished: {result.checked} checked, "
+            f"{result.changed} changed, {result.missing} not in guild, "
+            f"{result.failed} failed."
+        )
+        return result
+
+    async def _fetch_member(
+        self, guild: discord.Guild, user_id: int, result: RoleSyncResult
+    ) -> discord.Member | None:
+        """Lädt ein nicht gecachtes Mitglied gedrosselt per API nach."""
+        try:
+            return await guild.fetch_member(user_id)
+        except discord.NotFound:
+            result.missing += 1
+            logger.info(f"[ChampionCog] {user_id} not in guild, role sync skipped.")
+        except discord.HTTPException as exc:
+            result.failed += 1
+            logger.warning(f"[ChampionCog] Could not fetch member {user_id}: {exc}")
+        finally:
+            await asyncio.sleep(ROLE_SYNC_INTERVAL)
+        return None
 
     async def _worker(self) -> None:
-        """Apply queued score updates sequentially in the background."""
+        """Apply queued score updates in batches in the background."""
 
         # This long running task processes the ``update_queue`` until the cog is
-        # unloaded. It ensures that role updates happen in order and catches
-        # ``CancelledError`` when the bot shuts down.
+        # unloaded. Several pending updates for one user collapse into a single
+        # role evaluation with the latest total. ``CancelledError`` is caught
+        # when the bot shuts down.
         try:
             while True:
-                user_id_str, total = await self.update_queue.get()
-                try:
-                    await self._apply_champion_role(user_id_str, total)
-                finally:
-                    self.update_queue.task_done()
+                batch = await self.update_queue.get_batch(
+                    UPDATE_BATCH_SIZE, delay=UPDATE_COALESCE_DELAY
+                )
+                for user_id_str, total in batch:
+                    try:
+                        await self._apply_champion_role(user_id_str, total)
+                    finally:
+                        self.update_queue.task_done()
         except asyncio.CancelledError:
             pass
 
     async def _apply_champion_role(self, user_id_str: str, score: int) -> None:
-        """Vergibt anhand der Punkte die passende Champion-Rolle.
-
-        Existiert die im Config definierte Rollen-ID nicht, wird keine Rolle
-        vergeben und ein Hinweis geloggt.
-        """
+        """Vergibt anhand der Punkte die passende Champion-Rolle."""
         # Zugriff auf Guild NUR noch über self.bot.main_guild (Zentral, wie in bot.py gesetzt)
         guild = self.bot.main_guild
         if not isinstance(guild, discord.Guild):
@@ -143,11 +266,23 @@ class ChampionCog(ManagedTaskCog):
             )
             return
 
-        target_role = self.get_current_role(score)
+        change = self.plan_role_change(guild, member, score)
+        if change is not None:
+            await self._apply_role_change(change, score)
 
-        current_role_ids = [r.id for r in member.roles]
+    def plan_role_change(
+        self, guild: discord.Guild, member: discord.Member, score: int
+    ) -> Optional[RoleChange]:
+        """Vergleicht die Rollen von ``member`` mit der Zielrolle für ``score``.
+
+        Existiert die im Config definierte Rollen-ID nicht, wird keine Rolle
+        vergeben und ein Hinweis geloggt. Gibt ``None`` zurück, wenn nichts zu
+        tun ist.
+        """
+        target_role = self.get_current_role(score)
+        current_role_ids = {r.id for r in member.roles}
+        change = RoleChange(member)
 
-        roles_to_remove = []
         for role in self.roles:
             if role.id in current_role_ids and role != target_role:
                 role_obj = guild.get_role(role.id)
@@ -156,44 +291,73 @@ class ChampionCog(ManagedTaskCog):
                         f"[ChampionCog] Role '{role.name}' with ID {role.id} does not exist."
                     )
                 else:
-                    roles_to_remove.append(role_obj)
+                    change.remove.append(role_obj)
+
+        if target_role and target_role.id not in current_role_ids:
+            target_role_obj = guild.get_role(target_role.id)
+            if target_role_obj is None:
+                logger.warning(
+                    f"[ChampionCog] Role '{target_role.name}' with ID {target_role.id} does not exist."
+                )
+            else:
+                change.add.append(target_role_obj)
 
-        if roles_to_remove:
+        if not change.add and not change.remove:
+            return None
+        return change
+
+    async def _apply_role_change(
+        self, change: RoleChange, score: int, paced: bool = False
+    ) -> bool:
+        """Sendet die Änderungen aus ``change``; ``paced`` drosselt die Requests."""
+        member = change.member
+        ok = True
+        if change.remove:
             try:
-                await member.remove_roles(*roles_to_remove)
+                await self._role_request(member.remove_roles, change.remove, paced)
             except discord.Forbidden:
                 logger.warning(
                     f"[ChampionCog] No permission to remove roles from {member.display_name}."
                 )
+                ok = False
             except Exception as e:
                 logger.error(
                     f"[ChampionCog] Error removing roles: {e}",
                     exc_info=True,
                 )
+                ok = False
 
-        if not target_role or target_role.id in current_role_ids:
-            return
-
-        target_role_obj = guild.get_role(target_role.id)
-        if target_role_obj is None:
-            logger.warning(
-                f"[ChampionCog] Role '{target_role.name}' with ID {target_role.id} does not exist."
-            )
-        else:
+        for role in change.add:
             try:
-                await member.add_roles(target_role_obj)
+                await self._role_request(member.add_roles, [role], paced)
                 logger.info(
-                    f"[ChampionCog] Assigned role '{target_role.name}' to {member.display_name} (score {score})."
+                    f"[ChampionCog] Assigned role '{role.name}' to {member.display_name} (score {score})."
                 )
             except discord.Forbidden:
                 logger.warning(
-                    f"[ChampionCog] No permission to add role '{target_role.name}'."
+                    f"[ChampionCog] No permission to add role '{role.name}'."
                 )
+                ok = False
             except Exception as e:
                 logger.error(
                     f"[ChampionCog] Error adding role: {e}",
                     exc_info=True,
                 )
+                ok = False
+        return ok
+
+    async def _role_request(self, func, roles: list[discord.Role], paced: bool) -> None:
+        """Führt einen Rollen-Request aus und wartet bei Rate-Limits einmal ab."""
+        try:
+            await func(*roles)
+        except discord.RateLimited as exc:
+            logger.warning(
+                f"[ChampionCog] Rate limited, retrying in {exc.retry_after:.1f}s."
+            )
+            await asyncio.sleep(exc.retry_after)
+            await func(*roles)
+        if paced:
+            await asyncio.sleep(ROLE_SYNC_INTERVAL)
 
     async def cog_unload(self) -> None:
         """Schließt die Datenbank und wartet auf alle Hintergrund-Tasks."""
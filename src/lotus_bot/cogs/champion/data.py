@@ -1,88 +1,160 @@
 import asyncio
 import aiosqlite
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from typing import Optional
-import os
 
 from lotus_bot.log_setup import get_logger
+from lotus_bot.utils.sqlite_pool import SQLitePool
 
 logger = get_logger(__name__)
 
 
+# Zeiträume für Perioden-Bestenlisten; eine Saison entspricht einem Quartal
+PERIODS = ("week", "month", "season")
+
+
+def period_start(period: str, today: date | None = None) -> date:
+    """Erster Tag der laufenden Woche, des Monats oder der Saison."""
+    today = today or datetime.utcnow().date()
+    if period == "week":
+        return today - timedelta(days=today.weekday())
+    if period == "month":
+        return today.replace(day=1)
+    if period == "season":
+        return today.replace(month=(today.month - 1) // 3 * 3 + 1, day=1)
+    raise ValueError(f"unknown period: {period}")
+
+
+@dataclass(frozen=True)
+class LeaderboardEntry:
+    """Eine Zeile der Bestenliste."""
+
+    rank: int
+    user_id: str
+    total: int
+
+    @property
+    def key(self) -> tuple[int, str]:
+        """Keyset-Cursor für die nächste Seite."""
+        return self.total, self.user_id
+
+
 class ChampionData:
     """Verwaltet die SQLite-Datenbank für Champion-Punkte und Historie."""
 
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self.db: aiosqlite.Connection | None = None
+        self._pool = SQLitePool(db_path)
         self._init_done = False
         self._lock = asyncio.Lock()
+        # Wird bei jeder Punktänderung erhöht (Cache-Invalidierung)
+        self.version = 0
 
     async def _get_db(self) -> aiosqlite.Connection:
-        if self.db is None:
-            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-            self.db = await aiosqlite.connect(self.db_path)
-            await self.db.execute("PRAGMA journal_mode=WAL")
-        return self.db
+        return await self._pool.writer()
 
     async def init_db(self):
         """Legt Tabellen an, falls sie noch nicht existieren."""
         async with self._lock:
             if self._init_done:
                 return
-            db = await self._get_db()
-            await db.execute("""
-            CREATE TABLE IF NOT EXISTS points (
-                user_id TEXT PRIMARY KEY,
-                total INTEGER NOT NULL
-            );
-            """)
-            await db.execute("""
-            CREATE TABLE IF NOT EXISTS history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                delta INTEGER NOT NULL,
-                reason TEXT NOT NULL,
-                date TEXT NOT NULL
-            );
-            """)
-            await db.execute("""
-            CREATE TABLE IF NOT EXISTS duel_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                result TEXT NOT NULL,
-                date TEXT NOT NULL
-            );
-            """)
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_points_total ON points(total)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_history_user ON history(user_id)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_duel_user ON duel_history(user_id)"
-            )
-            await db.commit()
-            self._init_done = True
+            async with self._pool.writing() as db:
+                await db.execute("""
+                CREATE TABLE IF NOT EXISTS points (
+                    user_id TEXT PRIMARY KEY,
+                    total INTEGER NOT NULL
+                );
+                """)
+                await db.execute("""
+                CREATE TABLE IF NOT EXISTS history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id TEXT NOT NULL,
+                    delta INTEGER NOT NULL,
+                    reason TEXT NOT NULL,
+                    date TEXT NOT NULL
+                );
+                """)
+                # Ausgelagerte Roh-Einträge, siehe ``archive_history``
+                await db.execute("""
+                CREATE TABLE IF NOT EXISTS history_archive (
+                    id INTEGER PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    delta INTEGER NOT NULL,
+                    reason TEXT NOT NULL,
+                    date TEXT NOT NULL
+                );
+                """)
+                # Tagessummen pro Nutzer für Perioden-Auswertungen
+                await db.execute("""
+                CREATE TABLE IF NOT EXISTS history_daily (
+                    user_id TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    points INTEGER NOT NULL,
+                    entries INTEGER NOT NULL,
+                    PRIMARY KEY (user_id, day)
+                ) WITHOUT ROWID;
+                """)
+                await db.execute("""
+                CREATE TABLE IF NOT EXISTS duel_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    date TEXT NOT NULL
+                );
+                """)
+                # Abdeckender Index für Bestenliste, Keyset-Seiten und Rang-Zählung;
+                # rückwärts gelesen liefert er ``total DESC, user_id DESC``.
+                await db.execute("DROP INDEX IF EXISTS idx_points_total")
+                await db.execute("DROP INDEX IF EXISTS idx_points_rank")
+                await db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_points_keyset "
+                    "ON points(total, user_id)"
+                )
+                await db.execute("""
+                CREATE TABLE IF NOT EXISTS role_sync (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    cursor TEXT
+                );
+                """)
+                await db.execute("DROP INDEX IF EXISTS idx_history_user")
+                await db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_history_user_date "
+                    "ON history(user_id, date)"
+                )
+                await db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_history_date ON history(date)"
+                )
+                await db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_archive_user_date "
+                    "ON history_archive(user_id, date)"
+                )
+                await db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_daily_day "
+                    "ON history_daily(day, user_id, points)"
+                )
+                await db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_duel_user ON duel_history(user_id)"
+                )
+                cur = await db.execute("SELECT 1 FROM history_daily LIMIT 1")
+                if await cur.fetchone() is None:
+                    await self._rebuild_rollups(db)
+                await db.commit()
+                self._init_done = True
 
         logger.info("[ChampionData] SQLite database initialized.")
 
     async def close(self) -> None:
         """Schließt die Datenbankverbindung."""
-        if self.db is not None:
-            await self.db.close()
-            self.db = None
-            self._init_done = False
+        await self._pool.close()
+        self._init_done = False
 
     async def get_total(self, user_id: str) -> int:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        row = await self._pool.fetchone(
             "SELECT total FROM points WHERE user_id = ?",
             (user_id,),
         )
-        row = await cur.fetchone()
         return row[0] if row else 0
 
     async def add_delta(self, user_id: str, delta: int, reason: str) -> int:
@@ -96,32 +168,43 @@ class ChampionData:
         async with self._lock:
             now = datetime.utcnow().isoformat()
 
-            db = await self._get_db()
-            cur = await db.execute(
-                "SELECT total FROM points WHERE user_id = ?",
-                (user_id,),
-            )
-            row = await cur.fetchone()
-            current_total = row[0] if row else 0
+            async with self._pool.writing() as db:
+                cur = await db.execute(
+                    "SELECT total FROM points WHERE user_id = ?",
+                    (user_id,),
+                )
+                row = await cur.fetchone()
+                current_total = row[0] if row else 0
+
+                new_total = max(0, current_total + delta)
+                if row:
+                    await db.execute(
+                        "UPDATE points SET total = ? WHERE user_id = ?",
+                        (new_total, user_id),
+                    )
+                else:
+                    await db.execute(
+                        "INSERT INTO points(user_id, total) VALUES (?, ?)",
+                        (user_id, new_total),
+                    )
 
-            new_total = max(0, current_total + delta)
-            if row:
                 await db.execute(
-                    "UPDATE points SET total = ? WHERE user_id = ?",
-                    (new_total, user_id),
+                    "INSERT INTO history(user_id, delta, reason, date) VALUES (?, ?, ?, ?)",
+                    (user_id, delta, reason, now),
                 )
-            else:
                 await db.execute(
-                    "INSERT INTO points(user_id, total) VALUES (?, ?)",
-                    (user_id, new_total),
+                    """
+                    INSERT INTO history_daily(user_id, day, points, entries)
+                    VALUES (?, ?, ?, 1)
+                    ON CONFLICT(user_id, day) DO UPDATE
+                       SET points = points + excluded.points,
+                           entries = entries + 1
+                    """,
+                    (user_id, now[:10], delta),
                 )
 
-            await db.execute(
-                "INSERT INTO history(user_id, delta, reason, date) VALUES (?, ?, ?, ?)",
-                (user_id, delta, reason, now),
-            )
-
-            await db.commit()
+                await db.commit()
+                self.version += 1
 
         logger.info(
             f"[ChampionData] Updated {user_id} by {delta} ({reason}). "
@@ -130,19 +213,20 @@ class ChampionData:
         return new_total
 
     async def get_history(self, user_id: str, limit: int = 10) -> list[dict]:
+        """Neueste Einträge von ``user_id``, inklusive archivierter."""
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
-            SELECT delta, reason, date
-              FROM history
-             WHERE user_id = ?
+            SELECT delta, reason, date FROM (
+                SELECT delta, reason, date FROM history WHERE user_id = ?
+                UNION ALL
+                SELECT delta, reason, date FROM history_archive WHERE user_id = ?
+            )
              ORDER BY date DESC
              LIMIT ?
             """,
-            (user_id, limit),
+            (user_id, user_id, limit),
         )
-        rows = await cur.fetchall()
 
         return [{"delta": r[0], "reason": r[1], "date": r[2]} for r in rows]
 
@@ -150,59 +234,217 @@ class ChampionData:
         self, limit: int = 10, offset: int = 0
     ) -> list[tuple[str, int]]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT user_id, total
               FROM points
-             ORDER BY total DESC
+             ORDER BY total DESC, user_id DESC
              LIMIT ? OFFSET ?
             """,
             (limit, offset),
         )
-        rows = await cur.fetchall()
 
         return [(r[0], r[1]) for r in rows]
 
+    async def _ranked(self, rows: list[tuple[str, int]]) -> list[LeaderboardEntry]:
+        """Versieht zusammenhängende Bestenlisten-Zeilen mit ihrem Rang.
+
+        Nur die erste Zeile wird gezählt (zwei Index-Suchen); die übrigen
+        Ränge ergeben sich aus ihrer Position, Gleichstände teilen den Rang.
+        """
+        if not rows:
+            return []
+        first_user, first_total = rows[0]
+        higher, ahead = await self._pool.fetchone(
+            """
+            SELECT (SELECT COUNT(*) FROM points WHERE total > ?),
+                   (SELECT COUNT(*) FROM points WHERE total = ? AND user_id > ?)
+            """,
+            (first_total, first_total, first_user),
+        )
+        entries = []
+        rank = higher + 1
+        for offset, (user_id, total) in enumerate(rows):
+            if total != first_total and total != entries[-1].total:
+                rank = higher + ahead + offset + 1
+            entries.append(LeaderboardEntry(rank, user_id, total))
+        return entries
+
+    async def get_leaderboard_page(
+        self, limit: int = 10, after: tuple[int, str] | None = None
+    ) -> list[LeaderboardEntry]:
+        """Liefert eine Seite der Bestenliste inklusive Rang.
+
+        ``after`` ist der ``key`` des letzten Eintrags der vorherigen Seite
+        (Keyset-Pagination statt ``OFFSET``).
+        """
+        await self.init_db()
+        if after is None:
+            rows = await self._pool.fetchall(
+                "SELECT user_id, total FROM points "
+                "ORDER BY total DESC, user_id DESC LIMIT ?",
+                (limit,),
+            )
+        else:
+            rows = await self._pool.fetchall(
+                "SELECT user_id, total FROM points WHERE (total, user_id) < (?, ?) "
+                "ORDER BY total DESC, user_id DESC LIMIT ?",
+                (*after, limit),
+            )
+        return await self._ranked(rows)
+
+    async def get_rank_context(
+        self, user_id: str, neighbors: int = 2
+    ) -> list[LeaderboardEntry]:
+        """Liefert ``user_id`` samt ``neighbors`` Plätzen davor und danach."""
+        await self.init_db()
+        row = await self._pool.fetchone(
+            "SELECT total FROM points WHERE user_id = ?", (user_id,)
+        )
+        if row is None:
+            return []
+        key = (row[0], user_id)
+        before = await self._pool.fetchall(
+            "SELECT user_id, total FROM points WHERE (total, user_id) > (?, ?) "
+            "ORDER BY total, user_id LIMIT ?",
+            (*key, neighbors),
+        )
+        after = await self._pool.fetchall(
+            "SELECT user_id, total FROM points WHERE (total, user_id) < (?, ?) "
+            "ORDER BY total DESC, user_id DESC LIMIT ?",
+            (*key, neighbors),
+        )
+        return await self._ranked([*reversed(before), (user_id, row[0]), *after])
+
     async def get_rank(self, user_id: str) -> Optional[tuple[int, int]]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            "SELECT total FROM points WHERE user_id = ?",
-            (user_id,),
+        row = await self._pool.fetchone(
+            "SELECT total FROM points WHERE user_id = ?", (user_id,)
         )
-        row = await cur.fetchone()
-        if not row:
+        if row is None:
             return None
-        total = row[0]
-
-        cur = await db.execute(
-            "SELECT COUNT(*) FROM points WHERE total > ?",
-            (total,),
+        higher = await self._pool.fetchone(
+            "SELECT COUNT(*) FROM points WHERE total > ?", (row[0],)
         )
-        count_row = await cur.fetchone()
-        rank = count_row[0] + 1
-
-        return rank, total
+        return higher[0] + 1, row[0]
 
     async def delete_user(self, user_id: str) -> None:
         """Entfernt alle Daten von ``user_id`` aus der Datenbank."""
         await self.init_db()
         async with self._lock:
-            db = await self._get_db()
-            await db.execute("DELETE FROM points WHERE user_id = ?", (user_id,))
-            await db.execute("DELETE FROM history WHERE user_id = ?", (user_id,))
-            await db.commit()
+            async with self._pool.writing() as db:
+                await db.execute("DELETE FROM points WHERE user_id = ?", (user_id,))
+                for table in ("history", "history_archive", "history_daily"):
+                    await db.execute(
+                        f"DELETE FROM {table} WHERE user_id = ?", (user_id,)
+                    )
+                await db.commit()
+                self.version += 1
         logger.info(f"[ChampionData] Removed entry {user_id}.")
 
+    async def _rebuild_rollups(self, db: aiosqlite.Connection) -> None:
+        """Berechnet ``history_daily`` aus allen Roh-Einträgen neu."""
+        await db.execute("DELETE FROM history_daily")
+        await db.execute("""
+            INSERT INTO history_daily(user_id, day, points, entries)
+            SELECT user_id, substr(date, 1, 10), SUM(delta), COUNT(*)
+              FROM (SELECT user_id, delta, date FROM history
+                    UNION ALL
+                    SELECT user_id, delta, date FROM history_archive)
+             GROUP BY user_id, substr(date, 1, 10)
+            """)
+
+    async def rebuild_rollups(self) -> None:
+        """Baut die Tagessummen neu auf, z. B. nach manuellen DB-Eingriffen."""
+        await self.init_db()
+        async with self._lock:
+            async with self._pool.writing() as db:
+                await self._rebuild_rollups(db)
+                await db.commit()
+
+    async def archive_history(self, older_than_days: int) -> int:
+        """Verschiebt Roh-Einträge älter als ``older_than_days`` ins Archiv.
+
+        Die Tagessummen bleiben erhalten. Gibt die Anzahl verschobener Zeilen
+        zurück.
+        """
+        await self.init_db()
+        cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat()
+        async with self._lock:
+            async with self._pool.writing() as db:
+                cur = await db.execute(
+                    "INSERT OR REPLACE INTO history_archive(id, user_id, delta, reason, date) "
+                    "SELECT id, user_id, delta, reason, date FROM history WHERE date < ?",
+                    (cutoff,),
+                )
+                moved = cur.rowcount
+                await db.execute("DELETE FROM history WHERE date < ?", (cutoff,))
+                await db.commit()
+        if moved:
+            logger.info(f"[ChampionData] Archived {moved} history entries.")
+        return moved
+
+    async def get_period_leaderboard(
+        self, since: date, limit: int = 10
+    ) -> list[LeaderboardEntry]:
+        """Bestenliste der seit ``since`` verdienten Punkte (aus den Tagessummen)."""
+        await self.init_db()
+        rows = await self._pool.fetchall(
+            """
+            SELECT RANK() OVER (ORDER BY SUM(points) DESC), user_id, SUM(points) AS earned
+              FROM history_daily
+             WHERE day >= ?
+             GROUP BY user_id
+            HAVING earned > 0
+             ORDER BY earned DESC, user_id
+             LIMIT ?
+            """,
+            (since.isoformat(), limit),
+        )
+        return [LeaderboardEntry(r[0], r[1], r[2]) for r in rows]
+
+    async def get_period_points(self, user_id: str, since: date) -> int:
+        """Summe der seit ``since`` verdienten Punkte von ``user_id``."""
+        await self.init_db()
+        row = await self._pool.fetchone(
+            "SELECT COALESCE(SUM(points), 0) FROM history_daily "
+            "WHERE user_id = ? AND day >= ?",
+            (user_id, since.isoformat()),
+        )
+        return row[0]
+
     async def get_all_user_ids(self) -> list[str]:
         """Liefert eine Liste aller gespeicherten Nutzer-IDs."""
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("SELECT user_id FROM points")
-        rows = await cur.fetchall()
+        rows = await self._pool.fetchall("SELECT user_id FROM points")
         return [r[0] for r in rows]
 
+    async def get_all_totals(self) -> list[tuple[str, int]]:
+        """Liefert alle ``(user_id, total)``-Paare nach ``user_id`` sortiert."""
+        await self.init_db()
+        rows = await self._pool.fetchall(
+            "SELECT user_id, total FROM points ORDER BY user_id"
+        )
+        return [(r[0], r[1]) for r in rows]
+
+    async def get_sync_cursor(self) -> str | None:
+        """Letzte vollständig synchronisierte ``user_id`` eines abgebrochenen Laufs."""
+        await self.init_db()
+        row = await self._pool.fetchone("SELECT cursor FROM role_sync WHERE id = 1")
+        return row[0] if row else None
+
+    async def set_sync_cursor(self, cursor: str | None) -> None:
+        """Speichert den Fortschritt der Rollen-Synchronisierung (``None`` = fertig)."""
+        await self.init_db()
+        async with self._lock:
+            async with self._pool.writing() as db:
+                await db.execute(
+                    "INSERT INTO role_sync(id, cursor) VALUES (1, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET cursor = excluded.cursor",
+                    (cursor,),
+                )
+                await db.commit()
+
     async def record_duel_result(self, user_id: str, result: str) -> None:
         """Fügt einen Duell-Eintrag für ``user_id`` hinzu.
 
@@ -218,22 +460,20 @@ class ChampionData:
             if result not in {"win", "loss", "tie"}:
                 raise ValueError("invalid result")
             now = datetime.utcnow().isoformat()
-            db = await self._get_db()
-            await db.execute(
-                "INSERT INTO duel_history(user_id, result, date) VALUES (?, ?, ?)",
-                (user_id, result, now),
-            )
-            await db.commit()
+            async with self._pool.writing() as db:
+                await db.execute(
+                    "INSERT INTO duel_history(user_id, result, date) VALUES (?, ?, ?)",
+                    (user_id, result, now),
+                )
+                await db.commit()
 
     async def get_duel_stats(self, user_id: str) -> dict:
         """Gibt Sieg‑, Niederlagen‑ und Unentschieden‑Zahlen zurück."""
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             "SELECT result, COUNT(*) FROM duel_history WHERE user_id = ? GROUP BY result",
             (user_id,),
         )
-        rows = await cur.fetchall()
         stats = {"win": 0, "loss": 0, "tie": 0}
         for res, cnt in rows:
             stats[res] = cnt
@@ -244,8 +484,7 @@ class ChampionData:
     ) -> list[tuple[str, int, int, int]]:
         """Liefert ein Leaderboard nach Siegen sortiert."""
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT user_id,
                    SUM(CASE WHEN result='win' THEN 1 ELSE 0 END) AS wins,
@@ -258,5 +497,4 @@ class ChampionData:
             """,
             (limit,),
         )
-        rows = await cur.fetchall()
         return [(r[0], r[1], r[2], r[3]) for r in rows]
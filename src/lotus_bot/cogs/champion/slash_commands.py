@@ -1,9 +1,13 @@
+import asyncio
+from typing import Literal
+
 import discord
 from discord import app_commands
 
 from lotus_bot.log_setup import get_logger
 from lotus_bot.permissions import moderator_only
 from .cog import ChampionCog
+from .data import period_start
 
 logger = get_logger(__name__)
 
@@ -245,14 +249,96 @@ async def leaderboard(interaction: discord.Interaction):
     await interaction.response.defer(thinking=True)
 
     cog: ChampionCog = interaction.client.get_cog("ChampionCog")
-    top = await cog.data.get_leaderboard(limit=30)
+    text = cog.cached_leaderboard()
+    if text is None:
+        version = cog.data.version
+        top = await cog.data.get_leaderboard_page(limit=30)
+        if not top:
+            await interaction.followup.send("🤷 Keine Einträge im Leaderboard.")
+            return
+        emoji_data = interaction.client.data.get("emojis", {})
+        text = await _render_leaderboard(cog, interaction.guild, top, emoji_data)
+        cog.cache_leaderboard(version, text)
+
+    await interaction.followup.send(text)
+
+
+PERIOD_LABELS = {
+    "week": "dieser Woche",
+    "month": "diesem Monat",
+    "season": "dieser Saison",
+}
+
 
-    if not top:
-        await interaction.followup.send("🤷 Keine Einträge im Leaderboard.")
+@champion_group.command(
+    name="top",
+    description="Zeigt die meisten Punkte der Woche, des Monats oder der Saison",
+)
+@app_commands.describe(zeitraum="Auswertungszeitraum")
+async def top(
+    interaction: discord.Interaction,
+    zeitraum: Literal["week", "month", "season"] = "week",
+):
+    """Zeigt die Bestenliste der im Zeitraum verdienten Punkte."""
+    logger.info(f"/champion top {zeitraum} requested by {interaction.user}")
+    await interaction.response.defer(thinking=True)
+
+    cog: ChampionCog = interaction.client.get_cog("ChampionCog")
+    since = period_start(zeitraum)
+    entries = await cog.data.get_period_leaderboard(since, limit=15)
+    label = PERIOD_LABELS[zeitraum]
+    if not entries:
+        await interaction.followup.send(
+            f"🤷 In {label} wurden noch keine Punkte vergeben."
+        )
         return
 
-    # Emojis laden. ``emoji_data`` ist ein Dict {name: syntax}
-    emoji_data = interaction.client.data.get("emojis", {})
+    names = await _resolve_names(interaction.guild, [e.user_id for e in entries])
+    lines = [
+        f"📈 **Top-Punkte in {label}** (seit {since:%d.%m.%Y})",
+        "```text",
+        "Rang Name                 Punkte",
+        "---- -------------------- ------",
+    ]
+    for entry in entries:
+        name = names.get(entry.user_id, f"Unbekannt ({entry.user_id})")
+        lines.append(f"{entry.rank:>4} {name:<20} {entry.total:>6}")
+    lines.append("```")
+    await interaction.followup.send("\n".join(lines))
+
+
+async def _resolve_names(guild: discord.Guild, user_ids: list[str]) -> dict[str, str]:
+    """Löst Anzeigenamen auf; nur nicht gecachte Mitglieder werden parallel geladen."""
+    names: dict[str, str] = {}
+    missing: list[str] = []
+    for user_id_str in user_ids:
+        member = guild.get_member(int(user_id_str))
+        if member is None:
+            missing.append(user_id_str)
+        else:
+            names[user_id_str] = member.display_name
+
+    async def fetch(user_id_str: str) -> None:
+        try:
+            member = await guild.fetch_member(int(user_id_str))
+        except discord.NotFound:
+            return
+        except discord.HTTPException as e:
+            logger.warning(
+                f"[ChampionCog] Error loading member {user_id_str}: {e}",
+                exc_info=True,
+            )
+            return
+        if member is not None:
+            names[user_id_str] = member.display_name
+
+    if missing:
+        await asyncio.gather(*(fetch(uid) for uid in missing))
+    return names
+
+
+async def _render_leaderboard(cog, guild, top, emoji_data: dict) -> str:
+    """Rendert die Bestenliste gruppiert nach Champion-Rolle."""
     icon_map = {
         "Ultimate Champion": emoji_data.get("challenger_5", ""),
         "Epic Champion": emoji_data.get("challenger_4", ""),
@@ -262,28 +348,13 @@ async def leaderboard(interaction: discord.Interaction):
         "Champion": emoji_data.get("challenger_0", ""),
     }
 
+    names = await _resolve_names(guild, [entry.user_id for entry in top])
     grouped: dict[str, list[tuple[int, str, int]]] = {}
-    rank = 1
-
-    for user_id_str, total in top:
-        member = interaction.guild.get_member(int(user_id_str))
-        if member is None:
-            try:
-                member = await interaction.guild.fetch_member(int(user_id_str))
-            except discord.NotFound:
-                member = None
-            except discord.HTTPException as e:
-                logger.warning(
-                    f"[ChampionCog] Error loading member {user_id_str}: {e}",
-                    exc_info=True,
-                )
-                member = None
-
-        name = member.display_name if member else f"Unbekannt ({user_id_str})"
-        role_obj = cog.get_current_role(total)
+    for entry in top:
+        name = names.get(entry.user_id, f"Unbekannt ({entry.user_id})")
+        role_obj = cog.get_current_role(entry.total)
         role_name = role_obj.name if role_obj else "Champion"
-        grouped.setdefault(role_name, []).append((rank, name, total))
-        rank += 1
+        grouped.setdefault(role_name, []).append((entry.rank, name, entry.total))
 
     role_order = [r.name for r in cog.roles] + ["Champion"]
 
@@ -305,7 +376,7 @@ async def leaderboard(interaction: discord.Interaction):
         lines.append("```")
         output.append("\n".join(lines))
 
-    await interaction.followup.send("\n".join(output))
+    return "\n".join(output)
 
 
 @champion_group.command(
@@ -403,14 +474,16 @@ async def syncroles(interaction: discord.Interaction):
     await interaction.response.defer(thinking=True)
 
     cog: ChampionCog = interaction.client.get_cog("ChampionCog")
-    user_ids = await cog.data.get_all_user_ids()
-    processed = 0
-    for user_id_str in user_ids:
-        total = await cog.data.get_total(user_id_str)
-        await cog._apply_champion_role(user_id_str, total)
-        processed += 1
+    if cog.role_sync_running:
+        await interaction.followup.send(
+            "⏳ Eine Rollen-Synchronisierung läuft bereits.", ephemeral=True
+        )
+        return
+
+    result = await cog.sync_all_roles()
 
     await interaction.followup.send(
-        f"🔄 Synchronisierte Rollen für {processed} Nutzer.",
+        f"🔄 Rollen für {result.checked} Nutzer geprüft, {result.changed} angepasst"
+        f" ({result.missing} nicht im Server, {result.failed} Fehler).",
         ephemeral=True,
     )
@@ -1,8 +1,7 @@
-import os
-
 import aiosqlite
 
 from lotus_bot.log_setup import get_logger
+from lotus_bot.utils.sqlite_pool import SQLitePool
 
 logger = get_logger(__name__)
 
@@ -10,50 +9,44 @@ logger = get_logger(__name__)
 class CommunityData:
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
-        self.db: aiosqlite.Connection | None = None
+        self._pool = SQLitePool(db_path)
         self._init_done = False
 
     async def _get_db(self) -> aiosqlite.Connection:
-        if self.db is None:
-            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-            self.db = await aiosqlite.connect(self.db_path)
-            await self.db.execute("PRAGMA journal_mode=WAL")
-        return self.db
+        return await self._pool.writer()
 
     async def init_db(self) -> None:
         if self._init_done:
             return
-        db = await self._get_db()
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS settings (
-                key   TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            )
-            """)
-        await db.commit()
-        self._init_done = True
+        async with self._pool.writing() as db:
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS settings (
+                    key   TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+                """)
+            await db.commit()
+            self._init_done = True
 
     async def get_setting(self, key: str) -> str | None:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        row = await cur.fetchone()
+        row = await self._pool.fetchone(
+            "SELECT value FROM settings WHERE key = ?", (key,)
+        )
         return row[0] if row else None
 
     async def set_setting(self, key: str, value: str) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            INSERT INTO settings(key, value) VALUES(?, ?)
-            ON CONFLICT(key) DO UPDATE SET value = excluded.value
-            """,
-            (key, value),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                INSERT INTO settings(key, value) VALUES(?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """,
+                (key, value),
+            )
+            await db.commit()
 
     async def close(self) -> None:
-        if self.db is not None:
-            await self.db.close()
-            self.db = None
-            self._init_done = False
+        await self._pool.close()
+        self._init_done = False
@@ -1,30 +1,87 @@
+import asyncio
 import aiohttp
 import os
+from typing import AsyncIterator
 
 from lotus_bot.log_setup import get_logger
 
 logger = get_logger(__name__)
 
+CARDS_URL = "https://api.tcgdex.dev/v2/tcg-pocket/{language}/cards?page={page}"
+# Sprachen, die bei ``/ptcgp update`` synchronisiert werden
+LANGUAGES = ("en", "de")
+# Maximal gleichzeitig laufende Seitenabrufe (über alle Sprachen)
+PAGE_CONCURRENCY = 4
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Session mit Connection-Pool passend zu ``PAGE_CONCURRENCY``."""
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=PAGE_CONCURRENCY))
+
+
+async def fetch_page(
+    session: aiohttp.ClientSession,
+    language: str,
+    page: int,
+    semaphore: asyncio.Semaphore,
+) -> list[dict]:
+    """Lädt eine Kartenseite; eine leere Liste markiert das Ende.
+
+    Seiten hinter der letzten (HTTP 404) gelten ebenfalls als leer.
+    """
+    url = CARDS_URL.format(language=language, page=page)
+    ssl_disabled = os.getenv("PTCGP_SKIP_SSL_VERIFY") == "1"
+    async with semaphore:
+        async with session.get(url, ssl=False if ssl_disabled else None) as resp:
+            if resp.status == 404:
+                return []
+            if resp.status != 200:
+                raise RuntimeError(f"HTTP {resp.status} while loading {url}")
+            data = await resp.json()
+    if isinstance(data, dict) and "data" in data:
+        items = data.get("data")
+    else:
+        items = data
+    return items or []
+
+
+async def iter_card_pages(
+    session: aiohttp.ClientSession,
+    language: str,
+    semaphore: asyncio.Semaphore | None = None,
+) -> AsyncIterator[list[dict]]:
+    """Liefert die Kartenseiten einer Sprache der Reihe nach.
+
+    Jeweils ``PAGE_CONCURRENCY`` Seiten werden parallel angefragt; nach der
+    ersten leeren Seite endet die Iteration. Fehler auf Seiten dahinter werden
+    ignoriert, weil sie außerhalb des Datenbestands liegen.
+    """
+    semaphore = semaphore or asyncio.Semaphore(PAGE_CONCURRENCY)
+    page = 1
+    total = 0
+    while True:
+        pages = await asyncio.gather(
+            *(
+                fetch_page(session, language, page + offset, semaphore)
+                for offset in range(PAGE_CONCURRENCY)
+            ),
+            return_exceptions=True,
+        )
+        for items in pages:
+            if isinstance(items, BaseException):
+                raise items
+            if not items:
+                logger.info(f"[PTCGP API] Loaded {total} cards for {language}")
+                return
+            total += len(items)
+            yield items
+        page += PAGE_CONCURRENCY
+
 
 async def fetch_all_cards(language: str) -> list[dict]:
     """Lade alle Karten für die angegebene Sprache über die REST-API."""
     cards: list[dict] = []
-    ssl_disabled = os.getenv("PTCGP_SKIP_SSL_VERIFY") == "1"
-    async with aiohttp.ClientSession() as session:
-        page = 1
-        while True:
-            url = f"https://api.tcgdex.dev/v2/tcg-pocket/{language}/cards?page={page}"
-            async with session.get(url, ssl=False if ssl_disabled else None) as resp:
-                if resp.status != 200:
-                    raise RuntimeError(f"HTTP {resp.status} while loading {url}")
-                data = await resp.json()
-                if isinstance(data, dict) and "data" in data:
-                    items = data.get("data")
-                else:
-                    items = data
-                if not items:
-                    break
-                cards.extend(items)
-                page += 1
-    logger.info(f"[PTCGP API] Loaded {len(cards)} cards for {language}")
+    async with create_session() as session:
+        async for items in iter_card_pages(session, language):
+            cards.extend(items)
     return cards
@@ -1,10 +1,11 @@
 import asyncio
+import aiosqlite
 from discord.ext import commands
 
 from lotus_bot.log_setup import get_logger
 from lotus_bot.utils.managed_cog import ManagedTaskCog
 from .data import PTCGPData
-from .api import fetch_all_cards
+from .api import LANGUAGES, PAGE_CONCURRENCY, create_session, iter_card_pages
 
 logger = get_logger(__name__)
 
@@ -17,20 +18,37 @@ class PTCGPCog(ManagedTaskCog):
         self._lock = asyncio.Lock()
 
     async def update_database(self) -> dict[str, int]:
-        """Lädt Kartendaten neu und speichert sie in der Datenbank."""
+        """Lädt Kartendaten neu und speichert sie in der Datenbank.
+
+        Beide Sprachen werden parallel seitenweise geladen und direkt in eine
+        Staging-Tabelle geschrieben. Erst wenn alles geladen ist, ersetzt sie
+        die bestehenden Karten; bei Fehlern bleibt der alte Stand erhalten.
+        """
         async with self._lock:
+            counts = {lang: 0 for lang in LANGUAGES}
+            semaphore = asyncio.Semaphore(PAGE_CONCURRENCY)
+
+            async def sync_language(session, lang: str) -> None:
+                async for items in iter_card_pages(session, lang, semaphore):
+                    await self.data.stage_cards(items, lang)
+                    counts[lang] += len(items)
+
             try:
-                cards_en = await fetch_all_cards("en")
-                cards_de = await fetch_all_cards("de")
+                await self.data.begin_staging()
+                async with create_session() as session:
+                    await asyncio.gather(
+                        *(sync_language(session, lang) for lang in LANGUAGES)
+                    )
+                await self.data.commit_staging()
+            except aiosqlite.Error as e:
+                logger.error(f"[PTCGP] Error saving to DB: {e}", exc_info=True)
+                await self.data.discard_staging()
+                raise RuntimeError("Fehler beim Speichern der Daten.") from e
             except Exception as e:
                 logger.error(f"[PTCGP] Error loading API data: {e}", exc_info=True)
+                await self.data.discard_staging()
                 raise RuntimeError("Fehler beim Laden der Kartendaten.") from e
-            try:
-                await self.data.replace_all(cards_en, cards_de)
-            except Exception as e:
-                logger.error(f"[PTCGP] Error saving to DB: {e}", exc_info=True)
-                raise RuntimeError("Fehler beim Speichern der Daten.") from e
-            return {"en": len(cards_en), "de": len(cards_de)}
+            return counts
 
     async def get_card(self, card_id: str) -> dict:
         """Hole eine Karte mit allen Sprachvarianten."""
@@ -1,33 +1,95 @@
-import os
+import copy
 import json
+from collections import OrderedDict
+
 import aiosqlite
 
 from lotus_bot.log_setup import get_logger
+from lotus_bot.utils.sqlite_pool import SQLitePool
 
 logger = get_logger(__name__)
 
+# Neue Kartendaten landen hier und werden erst am Ende gegen ``cards`` getauscht
+STAGING_TABLE = "cards_staging"
+# Anzahl dekodierter Karten im LRU-Cache von ``get_card``
+CARD_CACHE_SIZE = 512
+# Maximale Trefferzahl für Suche und Autocomplete
+SEARCH_LIMIT = 25
+
+CARD_COLUMNS = (
+    "c.id, c.lang, c.name, c.hp, c.types, c.image, c.attacks, c.rarity, c.set_name"
+)
+
+# Volltextindex über Namen sowie Attackennamen und -texte aller Sprachen
+REBUILD_FTS = """
+    INSERT INTO cards_fts(id, lang, name, attacks)
+    SELECT id, lang, COALESCE(name, ''),
+           COALESCE((
+               SELECT group_concat(
+                   COALESCE(json_extract(a.value, '$.name'), '') || ' ' ||
+                   COALESCE(json_extract(a.value, '$.effect'), ''), ' ')
+                 FROM json_each(
+                     CASE WHEN json_valid(cards.attacks) THEN cards.attacks ELSE '[]' END
+                 ) a
+           ), '')
+      FROM cards
+"""
+
+
+def _card_row(card: dict, lang: str) -> tuple:
+    set_info = card.get("set")
+    return (
+        card.get("id"),
+        lang,
+        card.get("name"),
+        str(card.get("hp", "")),
+        json.dumps(card.get("types", []), ensure_ascii=False),
+        card.get("image", ""),
+        json.dumps(card.get("attacks", []), ensure_ascii=False),
+        card.get("rarity", ""),
+        set_info.get("name") if isinstance(set_info, dict) else set_info,
+    )
+
+
+def _decode_row(row) -> dict:
+    card_id, lang, name, hp, types, image, attacks, rarity, set_name = row
+    return {
+        "id": card_id,
+        "lang": lang,
+        "name": name,
+        "hp": hp,
+        "types": json.loads(types) if types else [],
+        "image": image,
+        "attacks": json.loads(attacks) if attacks else [],
+        "rarity": rarity,
+        "set": set_name,
+    }
+
+
+def fts_query(text: str, column: str | None = None) -> str:
+    """Wandelt Nutzereingaben in eine FTS5-Präfixsuche um."""
+    terms = ['"' + token.replace('"', '""') + '"*' for token in text.split()]
+    query = " ".join(terms)
+    if column and query:
+        return f"{column} : ({query})"
+    return query
+
 
 class PTCGPData:
     """Verwaltet die SQLite-Datenbank für Pokémon TCG Pocket Karten."""
 
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self.db: aiosqlite.Connection | None = None
+        self._pool = SQLitePool(db_path)
         self._init_done = False
+        self._card_cache: OrderedDict[str, dict] = OrderedDict()
 
     async def _get_db(self) -> aiosqlite.Connection:
-        if self.db is None:
-            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-            self.db = await aiosqlite.connect(self.db_path)
-            await self.db.execute("PRAGMA journal_mode=WAL")
-        return self.db
+        return await self._pool.writer()
 
-    async def init_db(self):
-        if self._init_done:
-            return
-        db = await self._get_db()
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS cards (
+    async def _create_cards_table(self, db: aiosqlite.Connection, name: str) -> None:
+        await db.execute(f"""
+            CREATE TABLE IF NOT EXISTS {name} (
                 id TEXT NOT NULL,
                 lang TEXT NOT NULL,
                 name TEXT,
@@ -40,77 +102,184 @@ class PTCGPData:
                 PRIMARY KEY(id, lang)
             );
             """)
-        await db.commit()
-        self._init_done = True
-        logger.info("[PTCGPData] SQLite database initialized.")
+
+    async def init_db(self):
+        if self._init_done:
+            return
+        async with self._pool.writing() as db:
+            await self._create_cards_table(db, "cards")
+            # Reste eines abgebrochenen Updates verwerfen
+            await db.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+            await db.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(
+                    id UNINDEXED,
+                    lang UNINDEXED,
+                    name,
+                    attacks,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                );
+                """)
+            cur = await db.execute("SELECT 1 FROM cards_fts LIMIT 1")
+            if await cur.fetchone() is None:
+                await db.execute(REBUILD_FTS)
+            await db.commit()
+            self._init_done = True
+            logger.info("[PTCGPData] SQLite database initialized.")
 
     async def close(self) -> None:
-        if self.db is not None:
-            await self.db.close()
-            self.db = None
-            self._init_done = False
+        await self._pool.close()
+        self._init_done = False
+
+    async def begin_staging(self) -> None:
+        """Legt eine leere Staging-Tabelle für ein neues Update an."""
+        await self.init_db()
+        async with self._pool.writing() as db:
+            await db.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+            await self._create_cards_table(db, STAGING_TABLE)
+            await db.commit()
+
+    async def stage_cards(self, cards: list[dict], lang: str) -> None:
+        """Schreibt eine Kartenseite per ``executemany`` in die Staging-Tabelle."""
+        async with self._pool.writing() as db:
+            await db.executemany(
+                f"""
+                INSERT OR REPLACE INTO {STAGING_TABLE}
+                    (id, lang, name, hp, types, image, attacks, rarity, set_name)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [_card_row(card, lang) for card in cards],
+            )
+            await db.commit()
+
+    async def commit_staging(self) -> None:
+        """Ersetzt ``cards`` atomar durch die Staging-Tabelle."""
+        async with self._pool.writing() as db:
+            await db.execute("BEGIN IMMEDIATE")
+            await db.execute("DROP TABLE cards")
+            await db.execute(f"ALTER TABLE {STAGING_TABLE} RENAME TO cards")
+            await db.execute("DELETE FROM cards_fts")
+            await db.execute(REBUILD_FTS)
+            await db.commit()
+            self._card_cache.clear()
+
+    async def discard_staging(self) -> None:
+        """Verwirft ein abgebrochenes Update, ``cards`` bleibt unverändert."""
+        async with self._pool.writing() as db:
+            await db.rollback()
+            await db.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+            await db.commit()
 
     async def replace_all(self, cards_en: list[dict], cards_de: list[dict]):
         """Überschreibt die Datenbank mit den angegebenen Karten."""
-        await self.init_db()
-        db = await self._get_db()
-        await db.execute("DELETE FROM cards")
-        for card in cards_en:
-            await self._insert_card(db, card, "en")
-        for card in cards_de:
-            await self._insert_card(db, card, "de")
-        await db.commit()
-
-    async def _insert_card(self, db: aiosqlite.Connection, card: dict, lang: str):
-        await db.execute(
-            """
-            INSERT INTO cards(id, lang, name, hp, types, image, attacks, rarity, set_name)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                card.get("id"),
-                lang,
-                card.get("name"),
-                str(card.get("hp", "")),
-                json.dumps(card.get("types", []), ensure_ascii=False),
-                card.get("image", ""),
-                json.dumps(card.get("attacks", []), ensure_ascii=False),
-                card.get("rarity", ""),
-                (
-                    card.get("set", {}).get("name")
-                    if isinstance(card.get("set"), dict)
-                    else card.get("set")
-                ),
-            ),
-        )
+        await self.begin_staging()
+        await self.stage_cards(cards_en, "en")
+        await self.stage_cards(cards_de, "de")
+        await self.commit_staging()
 
     async def get_card(self, card_id: str) -> dict:
-        """Liefert eine Karte mit allen verfügbaren Sprachen."""
+        """Liefert eine Karte mit allen verfügbaren Sprachen.
+
+        Dekodierte Karten kommen aus einem LRU-Cache; Aufrufer erhalten eine
+        Kopie und dürfen sie verändern.
+        """
+        cached = self._card_cache.get(card_id)
+        if cached is not None:
+            self._card_cache.move_to_end(card_id)
+            return copy.deepcopy(cached)
+
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            "SELECT lang, name, hp, types, image, attacks, rarity, set_name FROM cards WHERE id = ?",
+        rows = await self._pool.fetchall(
+            f"SELECT {CARD_COLUMNS} FROM cards c WHERE c.id = ?",
             (card_id,),
         )
-        rows = await cur.fetchall()
         result = {}
         for row in rows:
-            lang, name, hp, types, image, attacks, rarity, set_name = row
-            result[lang] = {
-                "id": card_id,
-                "name": name,
-                "hp": hp,
-                "types": json.loads(types) if types else [],
-                "image": image,
-                "attacks": json.loads(attacks) if attacks else [],
-                "rarity": rarity,
-                "set": set_name,
-            }
+            card = _decode_row(row)
+            del card["lang"]
+            result[row[1]] = card
+        if result:
+            self._card_cache[card_id] = result
+            if len(self._card_cache) > CARD_CACHE_SIZE:
+                self._card_cache.popitem(last=False)
+            return copy.deepcopy(result)
         return result
 
+    async def search_cards(
+        self,
+        query: str = "",
+        lang: str = "de",
+        *,
+        card_type: str | None = None,
+        hp_min: int | None = None,
+        hp_max: int | None = None,
+        set_name: str | None = None,
+        rarity: str | None = None,
+        limit: int = SEARCH_LIMIT,
+    ) -> list[dict]:
+        """Sucht Karten per Volltext (Name, Attacken) und optionalen Filtern."""
+        await self.init_db()
+        clauses = ["c.lang = ?"]
+        params: list = [lang]
+        if card_type:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM json_each(c.types) t "
+                "WHERE lower(t.value) = lower(?))"
+            )
+            params.append(card_type)
+        if hp_min is not None:
+            clauses.append("CAST(c.hp AS INTEGER) >= ?")
+            params.append(hp_min)
+        if hp_max is not None:
+            clauses.append("CAST(c.hp AS INTEGER) <= ?")
+            params.append(hp_max)
+        if set_name:
+            clauses.append("lower(c.set_name) = lower(?)")
+            params.append(set_name)
+        if rarity:
+            clauses.append("lower(c.rarity) = lower(?)")
+            params.append(rarity)
+
+        match = fts_query(query)
+        if match:
+            sql = (
+                f"SELECT {CARD_COLUMNS} FROM cards_fts f "
+                "JOIN cards c ON c.id = f.id AND c.lang = f.lang "
+                f"WHERE cards_fts MATCH ? AND {' AND '.join(clauses)} "
+                "ORDER BY f.rank LIMIT ?"
+            )
+            params = [match, *params]
+        else:
+            sql = (
+                f"SELECT {CARD_COLUMNS} FROM cards c "
+                f"WHERE {' AND '.join(clauses)} ORDER BY c.name, c.id LIMIT ?"
+            )
+        rows = await self._pool.fetchall(sql, (*params, limit))
+        return [_decode_row(row) for row in rows]
+
+    async def suggest_names(
+        self, prefix: str, lang: str = "de", limit: int = SEARCH_LIMIT
+    ) -> list[tuple[str, str, str | None]]:
+        """``(id, name, set)`` für das Autocomplete, per Präfix auf den Namen."""
+        await self.init_db()
+        match = fts_query(prefix, column="name")
+        if match:
+            rows = await self._pool.fetchall(
+                "SELECT c.id, c.name, c.set_name FROM cards_fts f "
+                "JOIN cards c ON c.id = f.id AND c.lang = f.lang "
+                "WHERE cards_fts MATCH ? AND f.lang = ? ORDER BY f.rank LIMIT ?",
+                (match, lang, limit),
+            )
+        else:
+            rows = await self._pool.fetchall(
+                "SELECT id, name, set_name FROM cards WHERE lang = ? "
+                "ORDER BY name, id LIMIT ?",
+                (lang, limit),
+            )
+        return [(r[0], r[1], r[2]) for r in rows]
+
     async def count_cards(self) -> dict[str, int]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("SELECT lang, COUNT(*) FROM cards GROUP BY lang")
-        rows = await cur.fetchall()
+        rows = await self._pool.fetchall(
+            "SELECT lang, COUNT(*) FROM cards GROUP BY lang"
+        )
         return {row[0]: row[1] for row in rows}
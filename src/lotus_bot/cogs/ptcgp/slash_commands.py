@@ -1,3 +1,5 @@
+from typing import Literal
+
 import discord
 from discord import app_commands
 
@@ -42,3 +44,117 @@ async def stats(interaction: discord.Interaction):
         f"In der Datenbank sind {counts.get('en', 0)} Karten auf Englisch und {counts.get('de', 0)} Karten auf Deutsch gespeichert.",
         ephemeral=True,
     )
+
+
+def _card_embed(card: dict) -> discord.Embed:
+    """Baut ein Embed für eine dekodierte Karte."""
+    embed = discord.Embed(title=card.get("name") or card["id"])
+    if card.get("hp"):
+        embed.add_field(name="KP", value=card["hp"])
+    if card.get("types"):
+        embed.add_field(name="Typ", value=", ".join(card["types"]))
+    if card.get("rarity"):
+        embed.add_field(name="Seltenheit", value=card["rarity"])
+    if card.get("set"):
+        embed.add_field(name="Set", value=card["set"])
+    attacks = [
+        a.get("name", "") for a in card.get("attacks", []) if isinstance(a, dict)
+    ]
+    if attacks:
+        embed.add_field(name="Attacken", value="\n".join(attacks), inline=False)
+    image = card.get("image")
+    if image:
+        # tcgdex liefert Bild-URLs ohne Endung
+        if not image.endswith((".png", ".jpg", ".webp")):
+            image = f"{image}/high.png"
+        embed.set_image(url=image)
+    embed.set_footer(text=card["id"])
+    return embed
+
+
+async def card_autocomplete(
+    interaction: discord.Interaction, current: str
+) -> list[app_commands.Choice[str]]:
+    cog: PTCGPCog | None = interaction.client.get_cog("PTCGPCog")
+    if cog is None:
+        return []
+    lang = getattr(interaction.namespace, "sprache", None) or "de"
+    suggestions = await cog.data.suggest_names(current, lang)
+    return [
+        app_commands.Choice(
+            name=(f"{name} ({set_name})" if set_name else name)[:100], value=card_id
+        )
+        for card_id, name, set_name in suggestions
+    ]
+
+
+@ptcgp_group.command(name="card", description="Zeigt eine Karte")
+@app_commands.describe(karte="Name der Karte", sprache="de oder en")
+@app_commands.autocomplete(karte=card_autocomplete)
+async def card(
+    interaction: discord.Interaction,
+    karte: str,
+    sprache: Literal["de", "en"] = "de",
+):
+    logger.info(f"/ptcgp card {karte} by {interaction.user}")
+    cog: PTCGPCog = interaction.client.get_cog("PTCGPCog")
+    variants = await cog.get_card(karte)
+    if not variants:
+        matches = await cog.data.search_cards(karte, sprache, limit=1)
+        variants = {sprache: matches[0]} if matches else {}
+    data = variants.get(sprache) or next(iter(variants.values()), None)
+    if data is None:
+        await interaction.response.send_message(
+            "🤷 Keine passende Karte gefunden.", ephemeral=True
+        )
+        return
+    await interaction.response.send_message(embed=_card_embed(data))
+
+
+@ptcgp_group.command(
+    name="search", description="Durchsucht Karten nach Name, Attacke und Filtern"
+)
+@app_commands.describe(
+    suche="Suchbegriff für Name oder Attacke",
+    typ="Energietyp, z. B. Feuer",
+    kp_min="Mindest-KP",
+    kp_max="Höchst-KP",
+    set_name="Set-Name",
+    seltenheit="Seltenheit",
+    sprache="de oder en",
+)
+@app_commands.rename(set_name="set")
+async def search(
+    interaction: discord.Interaction,
+    suche: str = "",
+    typ: str | None = None,
+    kp_min: int | None = None,
+    kp_max: int | None = None,
+    set_name: str | None = None,
+    seltenheit: str | None = None,
+    sprache: Literal["de", "en"] = "de",
+):
+    logger.info(f"/ptcgp search '{suche}' by {interaction.user}")
+    cog: PTCGPCog = interaction.client.get_cog("PTCGPCog")
+    results = await cog.data.search_cards(
+        suche,
+        sprache,
+        card_type=typ,
+        hp_min=kp_min,
+        hp_max=kp_max,
+        set_name=set_name,
+        rarity=seltenheit,
+    )
+    if not results:
+        await interaction.response.send_message(
+            "🤷 Keine passenden Karten gefunden.", ephemeral=True
+        )
+        return
+    lines = [
+        f"`{c['id']}` **{c['name']}** – {c['hp'] or '-'} KP"
+        + (f" – {c['set']}" if c["set"] else "")
+        for c in results
+    ]
+    await interaction.response.send_message(
+        f"🔎 {len(results)} Treffer:\n" + "\n".join(lines), ephemeral=True
+    )
@@ -25,7 +25,7 @@ class WCRQuestionProvider(DynamicQuestionProvider):
         if isinstance(units_data, dict) and "units" in units_data:
             units_data = units_data["units"]
         self.units = units_data
-        self.locals = bot.data["wcr"]["locals"]
+        self.locals = bot.data["wcr"].get("locals", {})
         self.categories = bot.data["wcr"].get("categories", {})
         self.templates = bot.data.get("quiz", {}).get("templates", {}).get("wcr", {})
         self.language = language
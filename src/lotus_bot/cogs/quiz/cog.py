@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 from collections import defaultdict
 
 import discord
@@ -11,9 +12,10 @@ from lotus_bot.utils.managed_cog import ManagedTaskCog
 from .message_tracker import MessageTracker
 from .question_closer import QuestionCloser
 from .question_manager import QuestionManager
+from .question_prefetch import QuestionPrefetcher
 from .question_restorer import QuestionRestorer
 from .question_state import QuestionInfo, QuestionStateManager
-from .scheduler import QuizScheduler
+from .scheduler import QuizScheduler, TimerWheel
 from .stats import QuizStats
 
 logger = get_logger(__name__)
@@ -51,9 +53,17 @@ class QuizCog(ManagedTaskCog):
             state = QuestionStateManager("data/pers/quiz/question_state.json")
         self.state: QuestionStateManager = state
 
+        # One timer wheel drives post/window/close events of every area and
+        # duel instead of a sleeper task per area and per open question.
+        self.timers = TimerWheel(create_task=self._track_task)
+        self.timers.task = self._track_task(self._run_timers())
+
+        self.prefetch = QuestionPrefetcher(self.bot, create_task=self._track_task)
         self.manager = QuestionManager(self)
-        self.tracker = MessageTracker(self.bot, self.manager.ask_question)
-        self.closer = QuestionCloser(bot=self.bot, state=self.state)
+        self.tracker = MessageTracker(
+            self.bot, self.manager.ask_question, timers=self.timers
+        )
+        self.closer = QuestionCloser(bot=self.bot, state=self.state, timers=self.timers)
 
         self._track_task(self.tracker.initialize())
 
@@ -71,16 +81,43 @@ class QuizCog(ManagedTaskCog):
                 post_time, window_end = sched_info
             else:
                 post_time = window_end = None
-            scheduler = QuizScheduler(
-                bot=self.bot,
-                area=area,
-                prepare_question_callback=self.manager.prepare_question,
-                close_question_callback=self.closer.close_question,
-                post_time=post_time,
-                window_end=window_end,
-            )
-            scheduler.task = self._track_task(scheduler.run())
-            self.schedulers[area] = scheduler
+            self.start_scheduler(area, post_time, window_end)
+
+    async def _run_timers(self) -> None:
+        """Drive the shared timer wheel once the bot is ready."""
+        await self.bot.wait_until_ready()
+        self.prefetch.warm(list(self.schedulers))
+        await self.timers.run()
+
+    def start_scheduler(
+        self,
+        area: str,
+        post_time: datetime.datetime | None = None,
+        window_end: datetime.datetime | None = None,
+    ) -> QuizScheduler:
+        """Register ``area`` on the timer wheel unless already scheduled."""
+        if area in self.schedulers:
+            return self.schedulers[area]
+        scheduler = QuizScheduler(
+            bot=self.bot,
+            area=area,
+            prepare_question_callback=self.manager.prepare_question,
+            close_question_callback=self.closer.close_question,
+            timers=self.timers,
+            post_time=post_time,
+            window_end=window_end,
+        )
+        scheduler.start()
+        self.schedulers[area] = scheduler
+        return scheduler
+
+    def stop_scheduler(self, area: str) -> bool:
+        """Cancel the pending window events of ``area``."""
+        scheduler = self.schedulers.pop(area, None)
+        if scheduler is None:
+            return False
+        scheduler.stop()
+        return True
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
@@ -91,5 +128,6 @@ class QuizCog(ManagedTaskCog):
     def cog_unload(self) -> None:
         """Remove background tasks and clear ``bot.quiz_cog`` reference."""
         super().cog_unload()
+        self.tracker.flush_summary()
         if hasattr(self.bot, "quiz_cog"):
             del self.bot.quiz_cog
@@ -3,9 +3,11 @@ from discord.ui import View, button, Modal, TextInput, Button
 from dataclasses import dataclass
 import datetime
 
-from .utils import check_answer
+from .utils import check_answer_async
 import inspect
 from .question_generator import QuestionGenerator
+from .question_prefetch import PreparedQuestion
+from .scheduler import TimerWheel
 from lotus_bot.log_setup import get_logger
 
 logger = get_logger(__name__)
@@ -30,9 +32,14 @@ class DuelQuestionView(View):
         *,
         source_url: str | None = None,
         source_label: str | None = None,
+        timers: TimerWheel | None = None,
     ) -> None:
-        """View handling question answers of a duel round."""
-        super().__init__(timeout=timeout)
+        """View handling question answers of a duel round.
+
+        With ``timers`` the round expiry runs on the shared quiz timer wheel
+        instead of the view's own timeout task.
+        """
+        super().__init__(timeout=None if timers else timeout)
         self.challenger = challenger
         self.opponent = opponent
         self.players = {challenger.id, opponent.id}
@@ -42,6 +49,15 @@ class DuelQuestionView(View):
         self.message: discord.Message | None = None
         self.source_url = source_url
         self.source_label = source_label
+        self.timers = timers
+        self.timer_key = f"duel:{id(self)}:round"
+        if timers is not None:
+            timers.schedule(
+                self.timer_key,
+                datetime.datetime.utcnow() + datetime.timedelta(seconds=timeout),
+                self.on_timeout,
+                kind="duel_round",
+            )
         logger.debug(
             f"[DuelQuestionView] init challenger={challenger.id} opponent={opponent.id}"
         )
@@ -76,9 +92,11 @@ class DuelQuestionView(View):
 
     async def _finish(self, timed_out: bool = False) -> None:
         """Disable buttons, show results and stop the view."""
+        if self.timers is not None:
+            self.timers.cancel(self.timer_key)
         for child in self.children:
             child.disabled = True
-        self._determine_winner()
+        await self._determine_winner()
         if self.message:
             embed = (
                 self.message.embeds[0]
@@ -121,11 +139,11 @@ class DuelQuestionView(View):
         )
         self.stop()
 
-    def _determine_winner(self) -> None:
+    async def _determine_winner(self) -> None:
         """Evaluate all answers and store the winner ID."""
         results: list[tuple[datetime.datetime, int]] = []
         for uid, (answer, ts) in self.responses.items():
-            if check_answer(answer, self.correct_answers):
+            if await check_answer_async(answer, self.correct_answers):
                 results.append((ts, uid))
         results.sort()
         self.winner_id = results[0][1] if results else None
@@ -161,12 +179,22 @@ class _DuelAnswerModal(Modal, title="Antwort eingeben"):
 class DuelInviteView(View):
     def __init__(self, challenger: discord.Member, cfg: DuelConfig, cog) -> None:
         """View representing a duel invitation with accept button."""
-        super().__init__(timeout=60)
+        timers: TimerWheel | None = getattr(cog, "timers", None)
+        super().__init__(timeout=None if timers else 60)
         self.challenger = challenger
         self.cfg = cfg
         self.cog = cog
         self.message: discord.Message | None = None
         self.accepted = False
+        self.timers = timers
+        self.timer_key = f"duel:{id(self)}:invite"
+        if timers is not None:
+            timers.schedule(
+                self.timer_key,
+                datetime.datetime.utcnow() + datetime.timedelta(seconds=60),
+                self._expire,
+                kind="duel_invite",
+            )
         logger.info(
             f"[DuelInviteView] created by {challenger.display_name} area={cfg.area} points={cfg.points} mode={cfg.mode}"
         )
@@ -180,6 +208,17 @@ class DuelInviteView(View):
                 f"{self.challenger.mention}, deine Duellanfrage ist abgelaufen."
             )
 
+    async def _expire(self) -> None:
+        """Timer wheel callback replacing the view timeout."""
+        self.stop()
+        await self.on_timeout()
+
+    def stop(self) -> None:
+        """Stop the view and drop its pending invite timer."""
+        if self.timers is not None:
+            self.timers.cancel(self.timer_key)
+        super().stop()
+
     @button(label="Annehmen", style=discord.ButtonStyle.success)
     async def accept(self, interaction: discord.Interaction, _: Button) -> None:
         """Start the duel if the invitee accepts."""
@@ -200,6 +239,8 @@ class DuelInviteView(View):
             )
             return
         self.accepted = True
+        if self.timers is not None:
+            self.timers.cancel(self.timer_key)
         logger.info(f"Duel accepted by {interaction.user} against {self.challenger}")
         await interaction.response.defer()
         await self.start_duel(interaction)
@@ -384,27 +425,25 @@ class QuizDuelGame:
             )
         return str(user_id)
 
-    async def _ask_question(self, question: dict, title: str) -> DuelQuestionView:
+    async def _ask_question(
+        self, question: dict | PreparedQuestion, title: str
+    ) -> DuelQuestionView:
         """Send a question to the thread and wait for responses."""
-        answers = (
-            question["antwort"]
-            if isinstance(question["antwort"], list)
-            else [question["antwort"]]
+        prepared = (
+            question
+            if isinstance(question, PreparedQuestion)
+            else PreparedQuestion.build(question, "duel")
         )
-        logger.debug(f"[QuizDuelGame] {title}: {question['frage']}")
-        embed = discord.Embed(
-            title=title, description=question["frage"], color=discord.Color.blue()
-        )
-        difficulty = question.get("difficulty")
-        if difficulty:
-            embed.add_field(name="Schwierigkeit", value=difficulty, inline=False)
+        logger.debug(f"[QuizDuelGame] {title}: {prepared.question['frage']}")
+        embed = prepared.embed(title)
         view = DuelQuestionView(
             self.challenger,
             self.opponent,
-            answers,
+            prepared.answers,
             self.timeout,
-            source_url=question.get("source_url"),
-            source_label=question.get("source_label"),
+            source_url=prepared.question.get("source_url"),
+            source_label=prepared.question.get("source_label"),
+            timers=getattr(self.cog, "timers", None),
         )
         msg = await self.thread.send(embed=embed, view=view)
         view.message = msg
@@ -462,11 +501,20 @@ class QuizDuelGame:
 
             state_manager = qg.state_manager
 
-            try:
-                questions = provider.generate_all_types(context="duel")
-            except TypeError:
-                questions = provider.generate_all_types()
-            questions = state_manager.filter_unasked_questions(self.area, questions)
+            prefetch = getattr(self.cog, "prefetch", None)
+            if prefetch is not None:
+                questions = await prefetch.take_duel_set(self.area)
+            else:
+                try:
+                    questions = provider.generate_all_types(context="duel")
+                except TypeError:
+                    questions = provider.generate_all_types()
+                questions = [
+                    PreparedQuestion.build(q, "duel")
+                    for q in state_manager.filter_unasked_questions(
+                        self.area, questions
+                    )
+                ]
             logger.debug(
                 f"[QuizDuelGame] dynamic questions generated: {len(questions)}"
             )
@@ -491,9 +539,8 @@ class QuizDuelGame:
 
             for idx, question in enumerate(questions, start=1):
                 view = await self._ask_question(question, f"Frage {idx}")
-                question_id = question.get("id")
-                if question_id is not None:
-                    await state_manager.mark_question_as_asked(self.area, question_id)
+                if question.id is not None:
+                    await state_manager.mark_question_as_asked(self.area, question.id)
                 await self._process_result(view, idx, last_correct)
 
             c_score = self.scores[self.challenger.id]
@@ -521,13 +568,17 @@ class QuizDuelGame:
         logger.info(
             f"QuizDuelGame started between {self.challenger} and {self.opponent} mode=box rounds={total_rounds}"
         )
+        prefetch = getattr(self.cog, "prefetch", None)
         for rnd in range(1, total_rounds + 1):
-            try:
-                question = qg.generate(self.area, context="duel")
-            except TypeError:
-                question = qg.generate(self.area)
-            if inspect.isawaitable(question):
-                question = await question
+            if prefetch is not None:
+                question = await prefetch.take(self.area, "duel")
+            else:
+                try:
+                    question = qg.generate(self.area, context="duel")
+                except TypeError:
+                    question = qg.generate(self.area)
+                if inspect.isawaitable(question):
+                    question = await question
             if not question:
                 state_manager = getattr(qg, "state_manager", None)
                 remaining = "?"
@@ -1,21 +1,55 @@
 # cogs/quiz/message_tracker.py
 
-import discord
+import asyncio
+import datetime
 import time
 
+import discord
+
 from lotus_bot.log_setup import get_logger, create_logged_task
 
+from .scheduler import TimerWheel
+from .utils import resolve_channel
+
 logger = get_logger(__name__)
 
+# Channels warmed up in parallel during ``initialize``.
+WARMUP_CONCURRENCY = 5
+# Discord returns at most 100 messages per history request.
+HISTORY_PAGE_SIZE = 100
+
+# Seconds between aggregated activity log lines.
+SUMMARY_INTERVAL = 60.0
+# Timer wheel key of the pending summary flush.
+SUMMARY_TIMER_KEY = "tracker:summary"
+
 
 class MessageTracker:
-    def __init__(self, bot, on_threshold) -> None:
-        """Track message activity in quiz channels."""
+    def __init__(
+        self,
+        bot,
+        on_threshold,
+        summary_interval: float = SUMMARY_INTERVAL,
+        timers: TimerWheel | None = None,
+    ) -> None:
+        """Track message activity in quiz channels.
+
+        ``register_message`` runs for every message on the server, so it only
+        does a frozenset membership test for unrelated channels and folds
+        per-message logging into one summary line every ``summary_interval``
+        seconds. With ``timers`` the summary is flushed by the timer wheel, so
+        the last batch is logged even when the channel goes quiet.
+        """
         self.bot = bot
         self.on_threshold = on_threshold
         self.message_counter: dict[int, int] = {}
         self.channel_initialized: dict[int, bool] = {}
         self.channel_to_area: dict[int, str] = {}
+        self.watched: frozenset[int] = frozenset()
+        self.summary_interval = summary_interval
+        self.timers = timers
+        self._pending_counts: dict[int, int] = {}
+        self._last_summary = time.monotonic()
         self.update_mapping()
 
     def update_mapping(self) -> None:
@@ -25,6 +59,7 @@ class MessageTracker:
             for area, cfg in self.bot.quiz_data.items()
             if cfg.channel_id is not None
         }
+        self.watched = frozenset(self.channel_to_area)
 
         # Remove counters of channels no longer used
         active_channels = set(self.channel_to_area)
@@ -34,57 +69,77 @@ class MessageTracker:
             if cid not in active_channels:
                 self.message_counter.pop(cid, None)
                 self.channel_initialized.pop(cid, None)
+                self._pending_counts.pop(cid, None)
 
     async def initialize(self) -> None:
-        """Warm up counters based on recent channel history."""
+        """Warm up counters based on recent channel history.
+
+        All areas are warmed up concurrently (bounded by
+        ``WARMUP_CONCURRENCY``) and each channel reads a single history page.
+        """
         logger.info("[Tracker] Initialisierung gestartet.")
         await self.bot.wait_until_ready()
 
-        for area, cfg in self.bot.quiz_data.items():
-            channel_id = cfg.channel_id
-            try:
-                start = time.time()
-                channel = await self.bot.fetch_channel(channel_id)
-                if not isinstance(channel, discord.TextChannel):
-                    logger.warning(
-                        f"[Tracker] Channel {channel_id} ist kein TextChannel."
-                    )
-                    continue
-
-                messages = [
-                    msg
-                    async for msg in channel.history(
-                        limit=max(20, cfg.activity_threshold)
-                    )
-                ]
-                quiz_index = next(
-                    (
-                        i
-                        for i, msg in enumerate(messages)
-                        if msg.author.id == self.bot.user.id
-                        and msg.embeds
-                        and msg.embeds[0].title.startswith(f"Quiz für {area.upper()}")
-                    ),
-                    None,
-                )
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(WARMUP_CONCURRENCY)
 
-                threshold = cfg.activity_threshold
-                if quiz_index is not None:
-                    count = len([m for m in messages[:quiz_index] if not m.author.bot])
-                    self.message_counter[channel.id] = count
-                else:
-                    self.message_counter[channel.id] = threshold
+        async def warm_up(area: str, cfg) -> bool:
+            async with semaphore:
+                return await self._initialize_area(area, cfg)
 
-                self.channel_initialized[channel.id] = True
-                logger.info(
-                    f"[Tracker] Initialized '{area}' (channel {channel.id}) – counter: {self.message_counter[channel.id]} ({round(time.time()-start, 2)}s)"
-                )
+        areas = [
+            (area, cfg)
+            for area, cfg in self.bot.quiz_data.items()
+            if cfg.channel_id is not None
+        ]
+        results = await asyncio.gather(*(warm_up(area, cfg) for area, cfg in areas))
+        logger.info(
+            f"[Tracker] Initialisierung abgeschlossen: {sum(results)}/{len(areas)} "
+            f"Channels in {time.perf_counter() - start:.2f}s"
+        )
+
+    async def _initialize_area(self, area: str, cfg) -> bool:
+        """Warm up the counter of one area; return whether it succeeded."""
+        channel_id = cfg.channel_id
+        try:
+            start = time.perf_counter()
+            channel = await resolve_channel(self.bot, channel_id)
+            if not isinstance(channel, discord.TextChannel):
+                logger.warning(f"[Tracker] Channel {channel_id} ist kein TextChannel.")
+                return False
+
+            limit = min(max(20, cfg.activity_threshold), HISTORY_PAGE_SIZE)
+            messages = [msg async for msg in channel.history(limit=limit)]
+            quiz_index = next(
+                (
+                    i
+                    for i, msg in enumerate(messages)
+                    if msg.author.id == self.bot.user.id
+                    and msg.embeds
+                    and msg.embeds[0].title.startswith(f"Quiz für {area.upper()}")
+                ),
+                None,
+            )
 
-            except Exception as e:
-                logger.error(
-                    f"[Tracker] Error initializing '{area}' (channel ID {channel_id}): {e}",
-                    exc_info=True,
-                )
+            threshold = cfg.activity_threshold
+            if quiz_index is not None:
+                count = len([m for m in messages[:quiz_index] if not m.author.bot])
+                self.message_counter[channel.id] = count
+            else:
+                self.message_counter[channel.id] = threshold
+
+            self.channel_initialized[channel.id] = True
+            logger.info(
+                f"[Tracker] Initialized '{area}' (channel {channel.id}) – counter: {self.message_counter[channel.id]} ({time.perf_counter() - start:.2f}s)"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"[Tracker] Error initializing '{area}' (channel ID {channel_id}): {e}",
+                exc_info=True,
+            )
+            return False
 
     def register_message(self, message: discord.Message) -> str | None:
         """Count a message and trigger a question if threshold is reached."""
@@ -92,40 +147,69 @@ class MessageTracker:
             return None
 
         cid = message.channel.id
-        area = self.channel_to_area.get(cid)
-        waiting = cid in self.bot.quiz_cog.awaiting_activity
-        if not area and not waiting:
-            # Remove stale counters for unrelated channels
-            self.message_counter.pop(cid, None)
-            self.channel_initialized.pop(cid, None)
-            return None
-
-        before = self.message_counter.get(cid, 0)
-        self.message_counter[cid] = after = before + 1
-
-        if area:
-            logger.info(
-                f"[Tracker] Nachrichtenzähler für '{area}' (Channel {cid}): {before} → {after}"
-            )
-
-        if cid in self.bot.quiz_cog.awaiting_activity:
+        if cid not in self.watched:
+            # Hot path: the vast majority of server messages end here.
+            awaiting = self.bot.quiz_cog.awaiting_activity
+            if cid not in awaiting:
+                return None
+            area = None
+        else:
+            area = self.channel_to_area[cid]
+            awaiting = self.bot.quiz_cog.awaiting_activity
+
+        counter = self.message_counter
+        counter[cid] = after = counter.get(cid, 0) + 1
+        pending = self._pending_counts
+        if not pending and self.timers is not None:
+            self._arm_summary()
+        pending[cid] = pending.get(cid, 0) + 1
+
+        waiting = awaiting.get(cid)
+        if waiting is not None:
             cfg_obj = self.bot.quiz_data.get(area) if area else None
             threshold = cfg_obj.activity_threshold if cfg_obj else 10
             if after >= threshold:
                 if area is None:
-                    area, _ = self.bot.quiz_cog.awaiting_activity[cid]
+                    area = waiting[0]
                 logger.info(
                     f"[Tracker] Aktivität erreicht in '{area}' ({after}/{threshold}) – Frage wird gestellt."
                 )
-                create_logged_task(
-                    self.on_threshold(
-                        area, self.bot.quiz_cog.awaiting_activity[cid][1]
-                    ),
-                    logger,
-                )
+                create_logged_task(self.on_threshold(area, waiting[1]), logger)
+
+        if time.monotonic() - self._last_summary >= self.summary_interval:
+            self.flush_summary()
 
         return area
 
+    def _arm_summary(self) -> None:
+        """Schedule a flush for the batch that is just being started."""
+        due = self.summary_interval - (time.monotonic() - self._last_summary)
+        self.timers.schedule(
+            SUMMARY_TIMER_KEY,
+            datetime.datetime.utcnow() + datetime.timedelta(seconds=max(due, 0)),
+            self._flush_due,
+            kind="tracker",
+        )
+
+    async def _flush_due(self) -> None:
+        """Timer wheel callback for :meth:`flush_summary`."""
+        self.flush_summary()
+
+    def flush_summary(self) -> dict[int, int]:
+        """Log messages counted since the last summary and reset the batch."""
+        pending = self._pending_counts
+        self._pending_counts = {}
+        if self.timers is not None:
+            self.timers.cancel(SUMMARY_TIMER_KEY)
+        self._last_summary = time.monotonic()
+        if pending:
+            parts = ", ".join(
+                f"{self.channel_to_area.get(cid, cid)}: +{n} ({self.message_counter.get(cid, 0)})"
+                for cid, n in pending.items()
+            )
+            logger.info(f"[Tracker] Nachrichtenzähler-Zusammenfassung: {parts}")
+        return pending
+
     def get(self, channel_id: int) -> int:
         """Return the current counter value for a channel."""
         return self.message_counter.get(channel_id, 0)
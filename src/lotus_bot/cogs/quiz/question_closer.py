@@ -1,15 +1,18 @@
+import datetime
+
 import discord
-import asyncio
 
 from lotus_bot.log_setup import get_logger
 from .question_state import QuestionInfo
+from .scheduler import TimerWheel
 
 
 class QuestionCloser:
-    def __init__(self, bot, state) -> None:
+    def __init__(self, bot, state, timers: TimerWheel | None = None) -> None:
         """Handle closing of quiz questions and cleaning up state."""
         self.bot = bot
         self.state = state
+        self.timers = timers
 
     async def close_question(
         self,
@@ -21,7 +24,7 @@ class QuestionCloser:
     ) -> None:
         """Mark a question as closed and update the original message.
 
-        Idempotent: concurrent callers (``auto_close``, scheduler trailing
+        Idempotent: concurrent callers (timer expiry, scheduler trailing
         close, winner callback) all converge at ``qinfo.end_time``. The
         atomic ``dict.pop`` at the top guarantees that exactly one caller
         edits the embed — every other call is a no-op. This kills the
@@ -29,6 +32,8 @@ class QuestionCloser:
         appear twice in the closed embed.
         """
         logger = get_logger(__name__, area=area)
+        if self.timers is not None:
+            self.timers.cancel(f"{area}:close")
         if self.bot.quiz_cog.current_questions.pop(area, None) is None:
             logger.debug(f"[Closer] Question for '{area}' already closed.")
             return
@@ -75,9 +80,18 @@ class QuestionCloser:
         await self.state.clear_active_question(area)
         self.bot.quiz_cog.tracker.set_initialized(cfg.channel_id)
 
-    async def auto_close(self, area: str, delay: float) -> None:
-        """Automatically close ``area`` after ``delay`` seconds."""
-        await asyncio.sleep(delay)
+    def schedule_close(self, area: str, end_time: datetime.datetime) -> None:
+        """Arm the timeout close for ``area`` at ``end_time``."""
+        self.timers.schedule(
+            f"{area}:close",
+            end_time,
+            lambda: self._close_expired(area),
+            kind="close",
+            area=area,
+        )
+
+    async def _close_expired(self, area: str) -> None:
+        """Close the question of ``area`` once its answer time ran out."""
         qinfo = self.bot.quiz_cog.current_questions.get(area)
         if qinfo:
             await self.close_question(area=area, qinfo=qinfo, timed_out=True)
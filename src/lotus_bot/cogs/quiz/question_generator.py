@@ -2,6 +2,7 @@ import random
 from typing import Dict, Any
 
 from lotus_bot.log_setup import get_logger
+from lotus_bot.utils.compute import run_compute
 
 from .question_state import QuestionStateManager
 from .area_providers.base import DynamicQuestionProvider, question_matches_context
@@ -32,37 +33,34 @@ class QuestionGenerator:
         language: str = "de",
         max_attempts: int = 20,
         context: str = "scheduled",
+        reserved: set | None = None,
+        mark_asked: bool = True,
     ) -> Dict[str, Any] | None:
         """Generate a new question for ``area`` in the given ``language``.
 
         ``max_attempts`` steuert, wie oft bei dynamischen Quellen erneut versucht
         wird, bis eine noch nicht gestellte Frage gefunden wurde.
+        ``reserved`` IDs are treated like already asked ones and with
+        ``mark_asked=False`` the history is left untouched, so the prefetch
+        queue can generate ahead of time without consuming questions.
         """
+        reserved = reserved or set()
         if not area:
             logger.warning("[QuestionGenerator] No area specified.")
             return None
 
         if area in self.dynamic_providers:
             provider = self.dynamic_providers[area]
-            question = None
-            attempts = 0
-            asked = set(self.state_manager.get_asked_questions(area))
-
-            while attempts < max_attempts:
-                q = self._provider_generate(provider, context)
-                attempts += 1
-                if not q:
-                    break
-                if not question_matches_context(q, context):
-                    continue
-                qid = q.get("id")
-                if qid in asked:
-                    logger.debug(
-                        f"[QuestionGenerator] Frage {qid} bereits gestellt, neuer Versuch"
-                    )
-                    continue
-                question = q
-                break
+            asked = set(self.state_manager.get_asked_questions(area)) | reserved
+
+            question, attempts = await run_compute(
+                "quiz.generate",
+                self._pick_dynamic,
+                provider,
+                context,
+                asked,
+                max_attempts,
+            )
 
             if not question and attempts >= max_attempts:
                 logger.info(
@@ -70,14 +68,21 @@ class QuestionGenerator:
                 )
                 await self.state_manager.reset_asked_questions(area)
                 asked.clear()
-                q = self._provider_generate(provider, context)
+                q = await run_compute(
+                    "quiz.generate", self._provider_generate, provider, context
+                )
                 if q:
                     question = q
 
             if question:
                 questions = [question]
             else:
-                questions = self._provider_generate_all_types(provider, context)
+                questions = await run_compute(
+                    "quiz.generate_all_types",
+                    self._provider_generate_all_types,
+                    provider,
+                    context,
+                )
             logger.debug(
                 f"[QuestionGenerator] Dynamische Frage für '{area}': {len(questions)}"
             )
@@ -88,7 +93,11 @@ class QuestionGenerator:
                 f"[QuestionGenerator] Statische Fragen für '{area}': {len(questions)}"
             )
 
-        unasked = self.state_manager.filter_unasked_questions(area, questions)
+        unasked = [
+            q
+            for q in self.state_manager.filter_unasked_questions(area, questions)
+            if q.get("id") not in reserved
+        ]
         if not unasked:
             logger.info(
                 f"[QuestionGenerator] Alle Fragen für '{area}' wurden bereits gestellt."
@@ -99,7 +108,8 @@ class QuestionGenerator:
         # store only the question ID in history to avoid unhashable entries
         question_id = question.get("id")
         if question_id is not None:
-            await self.state_manager.mark_question_as_asked(area, question_id)
+            if mark_asked:
+                await self.state_manager.mark_question_as_asked(area, question_id)
         else:
             logger.warning(
                 f"[QuestionGenerator] Frage ohne ID in '{area}' kann nicht in der Historie gespeichert werden."
@@ -109,6 +119,34 @@ class QuestionGenerator:
         )
         return question
 
+    def _pick_dynamic(
+        self,
+        provider: DynamicQuestionProvider,
+        context: str,
+        asked: set,
+        max_attempts: int,
+    ) -> tuple[Dict[str, Any] | None, int]:
+        """Draw from ``provider`` until an unasked question fits ``context``.
+
+        Runs in the compute pool; returns the question and attempts used.
+        """
+        attempts = 0
+        while attempts < max_attempts:
+            q = self._provider_generate(provider, context)
+            attempts += 1
+            if not q:
+                break
+            if not question_matches_context(q, context):
+                continue
+            qid = q.get("id")
+            if qid in asked:
+                logger.debug(
+                    f"[QuestionGenerator] Frage {qid} bereits gestellt, neuer Versuch"
+                )
+                continue
+            return q, attempts
+        return None, attempts
+
     def _provider_generate(
         self, provider: DynamicQuestionProvider, context: str
     ) -> Dict[str, Any] | None:
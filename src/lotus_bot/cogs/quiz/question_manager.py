@@ -2,10 +2,9 @@
 
 import datetime
 
-import discord
-
 from lotus_bot.log_setup import get_logger
 
+from .question_prefetch import PreparedQuestion
 from .question_state import QuestionInfo
 from .views import AnswerButtonView
 
@@ -64,31 +63,20 @@ class QuestionManager:
         channel = self.bot.get_channel(cfg.channel_id)
         qg = cfg.question_generator
 
-        language = cfg.language
-        question = await qg.generate(area, language=language)
-        if not question:
+        prefetch = getattr(self.cog, "prefetch", None)
+        if prefetch is not None:
+            prepared = await prefetch.take(area)
+        else:
+            question = await qg.generate(area, language=cfg.language)
+            prepared = PreparedQuestion.build(question) if question else None
+        if not prepared:
             logger.warning(f"[QuestionManager] No question generated for '{area}'.")
             return
 
+        question = prepared.question
         frage_text = question["frage"]
-        correct_answers = (
-            question["antwort"]
-            if isinstance(question["antwort"], list)
-            else [question["antwort"]]
-        )
-
-        embed = discord.Embed(
-            title=f"Quiz für {area.upper()}",
-            description=frage_text,
-            color=discord.Color.blue(),
-        )
-        embed.add_field(
-            name="Kategorie", value=question.get("category", "-"), inline=False
-        )
-        difficulty = question.get("difficulty")
-        if difficulty:
-            embed.add_field(name="Schwierigkeit", value=difficulty, inline=False)
-        embed.set_footer(text="Klicke auf 'Antworten', um zu antworten.")
+        correct_answers = prepared.answers
+        embed = prepared.embed(f"Quiz für {area.upper()}")
 
         view = AnswerButtonView(
             area, correct_answers, self.cog, question.get("difficulty")
@@ -104,8 +92,7 @@ class QuestionManager:
         # the real post time.
         now = datetime.datetime.utcnow()
         effective_end = max(end_time, now + cfg.answer_duration)
-        delay = max((effective_end - now).total_seconds(), 0)
-        self.cog._track_task(self.cog.closer.auto_close(area, delay))
+        self.cog.closer.schedule_close(area, effective_end)
 
         qinfo = QuestionInfo(
             message_id=sent_msg.id,
@@ -0,0 +1,246 @@
+# cogs/quiz/question_prefetch.py
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import discord
+
+from lotus_bot.log_setup import get_logger
+from lotus_bot.utils.compute import run_compute
+
+logger = get_logger(__name__)
+
+# Ready questions kept per (area, context).
+QUEUE_DEPTH = {"scheduled": 2, "duel": 5}
+# Ready question sets kept per area for the dynamic duel mode.
+DUEL_SET_DEPTH = 1
+
+
+def question_answers(question: dict) -> list[str]:
+    """Return the correct answers of ``question`` as list."""
+    answer = question["antwort"]
+    return answer if isinstance(answer, list) else [answer]
+
+
+def build_question_payload(question: dict, context: str = "scheduled") -> dict:
+    """Render the embed of ``question`` without title as ``Embed.to_dict`` payload."""
+    embed = discord.Embed(description=question["frage"], color=discord.Color.blue())
+    if context == "scheduled":
+        embed.add_field(
+            name="Kategorie", value=question.get("category", "-"), inline=False
+        )
+    difficulty = question.get("difficulty")
+    if difficulty:
+        embed.add_field(name="Schwierigkeit", value=difficulty, inline=False)
+    if context == "scheduled":
+        embed.set_footer(text="Klicke auf 'Antworten', um zu antworten.")
+    return embed.to_dict()
+
+
+@dataclass
+class PreparedQuestion:
+    """A generated question with its answers and rendered embed payload."""
+
+    question: dict[str, Any]
+    answers: list[str]
+    payload: dict[str, Any] = field(repr=False)
+    language: str = "de"
+
+    @classmethod
+    def build(
+        cls, question: dict, context: str = "scheduled", language: str = "de"
+    ) -> "PreparedQuestion":
+        return cls(
+            question=question,
+            answers=question_answers(question),
+            payload=build_question_payload(question, context),
+            language=language,
+        )
+
+    @property
+    def id(self):
+        return self.question.get("id")
+
+    def embed(self, title: str) -> discord.Embed:
+        """Return a fresh embed for this question with ``title``."""
+        return discord.Embed.from_dict({**self.payload, "title": title})
+
+
+class QuestionPrefetcher:
+    def __init__(self, bot, create_task: Callable | None = None) -> None:
+        """Keep ready-to-post questions per area and context.
+
+        Questions are generated in the background without touching the
+        history; they are only marked as asked when taken, so a queued
+        question that is never posted can still be asked later.
+        """
+        self.bot = bot
+        self._create_task = create_task or asyncio.create_task
+        self.queues: dict[tuple[str, str], deque[PreparedQuestion]] = {}
+        self.duel_sets: dict[str, deque[list[PreparedQuestion]]] = {}
+        self._refilling: set[tuple[str, str]] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def _generator(self, area: str):
+        cfg = self.bot.quiz_data.get(area)
+        return getattr(cfg, "question_generator", None) if cfg else None
+
+    def _reserved(self, area: str) -> set:
+        reserved = set()
+        for context in QUEUE_DEPTH:
+            for item in self.queues.get((area, context), ()):
+                if item.id is not None:
+                    reserved.add(item.id)
+        for questions in self.duel_sets.get(area, ()):
+            reserved.update(q.id for q in questions if q.id is not None)
+        return reserved
+
+    def size(self, area: str, context: str = "scheduled") -> int:
+        """Return how many prepared questions are queued."""
+        return len(self.queues.get((area, context), ()))
+
+    def invalidate(self, area: str) -> None:
+        """Drop every prepared question of ``area`` (e.g. after a language switch)."""
+        for context in QUEUE_DEPTH:
+            self.queues.pop((area, context), None)
+        self.duel_sets.pop(area, None)
+
+    def warm(self, areas) -> None:
+        """Start background refills for the scheduled queue of ``areas``."""
+        for area in areas:
+            self.refill(area)
+
+    def refill(self, area: str, context: str = "scheduled") -> None:
+        """Top up the queue of ``area``/``context`` in the background."""
+        key = (area, context)
+        if key in self._refilling or self._generator(area) is None:
+            return
+        self._refilling.add(key)
+        self._create_task(self._fill(area, context))
+
+    async def _fill(self, area: str, context: str) -> None:
+        key = (area, context)
+        try:
+            queue = self.queues.setdefault(key, deque())
+            while len(queue) < QUEUE_DEPTH.get(context, 1):
+                prepared = await self._generate(area, context)
+                if prepared is None:
+                    break
+                queue.append(prepared)
+            logger.debug(
+                f"[Prefetch] Queue '{area}'/{context} aufgefüllt: {len(queue)}"
+            )
+        finally:
+            self._refilling.discard(key)
+
+    async def _generate(self, area: str, context: str) -> PreparedQuestion | None:
+        qg = self._generator(area)
+        if qg is None:
+            return None
+        language = self.bot.quiz_data[area].language
+        question = await qg.generate(
+            area,
+            language=language,
+            context=context,
+            reserved=self._reserved(area),
+            mark_asked=False,
+        )
+        if not question:
+            return None
+        return PreparedQuestion.build(question, context, language)
+
+    async def take(
+        self, area: str, context: str = "scheduled"
+    ) -> PreparedQuestion | None:
+        """Return the next prepared question and mark it as asked.
+
+        Falls back to generating inline when the queue ran dry.
+        """
+        qg = self._generator(area)
+        if qg is None:
+            return None
+        language = self.bot.quiz_data[area].language
+        queue = self.queues.get((area, context))
+        asked = set(qg.state_manager.get_asked_questions(area)) if queue else set()
+        prepared = None
+        while queue:
+            item = queue.popleft()
+            if item.language != language or item.id in asked:
+                continue
+            prepared = item
+            break
+
+        if prepared is None:
+            self.misses += 1
+            logger.info(f"[Prefetch] Queue '{area}'/{context} leer – generiere direkt.")
+            prepared = await self._generate(area, context)
+        else:
+            self.hits += 1
+
+        if prepared is not None and prepared.id is not None:
+            await qg.state_manager.mark_question_as_asked(area, prepared.id)
+        self.refill(area, context)
+        return prepared
+
+    def refill_duel_set(self, area: str) -> None:
+        """Prepare a dynamic duel question set for ``area`` in the background."""
+        key = (area, "duel_set")
+        if key in self._refilling or self._generator(area) is None:
+            return
+        self._refilling.add(key)
+        self._create_task(self._fill_duel_set(area))
+
+    async def _fill_duel_set(self, area: str) -> None:
+        key = (area, "duel_set")
+        try:
+            sets = self.duel_sets.setdefault(area, deque())
+            while len(sets) < DUEL_SET_DEPTH:
+                questions = await self._generate_duel_set(area)
+                if not questions:
+                    break
+                sets.append(questions)
+        finally:
+            self._refilling.discard(key)
+
+    async def _generate_duel_set(self, area: str) -> list[PreparedQuestion]:
+        qg = self._generator(area)
+        provider = qg.get_dynamic_provider(area) if qg else None
+        if provider is None:
+            return []
+        language = self.bot.quiz_data[area].language
+        reserved = self._reserved(area)
+        questions = await run_compute(
+            "quiz.generate_all_types",
+            qg._provider_generate_all_types,
+            provider,
+            "duel",
+        )
+        questions = qg.state_manager.filter_unasked_questions(area, questions)
+        return [
+            PreparedQuestion.build(q, "duel", language)
+            for q in questions
+            if q.get("id") not in reserved
+        ]
+
+    async def take_duel_set(self, area: str) -> list[PreparedQuestion]:
+        """Return a prepared dynamic duel set, generating inline if none is ready."""
+        language = self.bot.quiz_data[area].language
+        sets = self.duel_sets.get(area)
+        questions = None
+        while sets:
+            candidate = sets.popleft()
+            if candidate and candidate[0].language == language:
+                questions = candidate
+                break
+        if questions is None:
+            self.misses += 1
+            questions = await self._generate_duel_set(area)
+        else:
+            self.hits += 1
+        self.refill_duel_set(area)
+        return questions
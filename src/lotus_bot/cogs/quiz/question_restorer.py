@@ -1,14 +1,20 @@
 import datetime
 import asyncio
+import time
+
 import discord
 
 from lotus_bot.log_setup import get_logger
 
 from .views import AnswerButtonView
 from .question_state import QuestionInfo
+from .utils import resolve_channel
 
 logger = get_logger(__name__)
 
+# Areas restored in parallel during ``restore_all``.
+RESTORE_CONCURRENCY = 5
+
 
 class QuestionRestorer:
     def __init__(self, bot, state_manager, create_task) -> None:
@@ -19,37 +25,52 @@ class QuestionRestorer:
         self.tasks: list[asyncio.Task] = []
 
     async def restore_all(self) -> None:
-        """Recreate all still active questions from persisted state."""
-        for area, _ in self.bot.quiz_data.items():
-            active = self.state.get_active_question(area)
-            if not active:
-                continue
-            try:
-                end_time = active.end_time
-                if end_time > datetime.datetime.utcnow():
-                    logger.info(
-                        "[Restorer] Wiederhergestellte Frage in '%s' läuft bis %s.",
-                        area,
-                        end_time,
-                    )
-                    task = self._create_task(self.repost_question(area, active))
-                    self.tasks.append(task)
-                else:
-                    await self.state.clear_active_question(area)
-            except Exception as e:
-                logger.error(
-                    f"[Restorer] Error restoring '{area}': {e}",
-                    exc_info=True,
+        """Recreate all still active questions from persisted state.
+
+        Areas are restored concurrently, bounded by ``RESTORE_CONCURRENCY``.
+        """
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(RESTORE_CONCURRENCY)
+
+        async def restore_one(area: str) -> bool:
+            async with semaphore:
+                return await self._restore_area(area)
+
+        results = await asyncio.gather(
+            *(restore_one(area) for area in self.bot.quiz_data)
+        )
+        logger.info(
+            f"[Restorer] {sum(results)} Frage(n) in {time.perf_counter() - start:.2f}s wiederhergestellt."
+        )
+
+    async def _restore_area(self, area: str) -> bool:
+        """Restore the active question of ``area`` if it is still running."""
+        active = self.state.get_active_question(area)
+        if not active:
+            return False
+        try:
+            end_time = active.end_time
+            if end_time > datetime.datetime.utcnow():
+                logger.info(
+                    f"[Restorer] Wiederhergestellte Frage in '{area}' läuft bis {end_time}."
                 )
+                return await self.repost_question(area, active)
+            await self.state.clear_active_question(area)
+        except Exception as e:
+            logger.error(
+                f"[Restorer] Error restoring '{area}': {e}",
+                exc_info=True,
+            )
+        return False
 
-    async def repost_question(self, area: str, qinfo: QuestionInfo) -> None:
+    async def repost_question(self, area: str, qinfo: QuestionInfo) -> bool:
         """Repost a single question message and restart timers."""
         cfg = self.bot.quiz_data[area]
-        channel = await self.bot.fetch_channel(cfg.channel_id)
+        channel = await resolve_channel(self.bot, cfg.channel_id)
 
         if not channel:
             logger.error(f"[Restorer] Channel for '{area}' not available.")
-            return
+            return False
 
         try:
             try:
@@ -59,7 +80,7 @@ class QuestionRestorer:
                     f"[Restorer] Ursprüngliche Nachricht für '{area}' nicht mehr vorhanden – lösche Zustand."
                 )
                 await self.state.clear_active_question(area)
-                return
+                return False
 
             if msg.embeds and (
                 msg.embeds[0].color == discord.Color.red()
@@ -70,7 +91,7 @@ class QuestionRestorer:
                     f"[Restorer] Frage in '{area}' war bereits rot markiert oder hatte Footer – wird nicht wiederhergestellt."
                 )
                 await self.state.clear_active_question(area)
-                return
+                return False
 
             correct_answers = qinfo.answers
             frage_text = qinfo.frage or "Frage nicht gespeichert"
@@ -103,14 +124,14 @@ class QuestionRestorer:
             )
             self.bot.quiz_cog.answered_users[area].clear()
 
-            delay = max((end_time - datetime.datetime.utcnow()).total_seconds(), 0)
-            task = self._create_task(self.bot.quiz_cog.closer.auto_close(area, delay))
-            self.tasks.append(task)
+            self.bot.quiz_cog.closer.schedule_close(area, end_time)
 
             logger.info(f"[Restorer] Question in '{area}' was successfully restored.")
+            return True
         except Exception as e:
             logger.error(f"[Restorer] Error in '{area}': {e}", exc_info=True)
             await self.state.clear_active_question(area)
+            return False
 
     def cancel_all(self) -> None:
         """Cancel all running tasks created by the restorer."""
@@ -134,11 +134,18 @@ class QuestionStateManager:
     async def set_schedule(
         self, area: str, post_time: datetime.datetime, window_end: datetime.datetime
     ) -> None:
-        """Persist the next ``post_time`` and ``window_end`` for ``area``."""
-        self.state.setdefault("schedules", {})[area] = {
+        """Persist the next ``post_time`` and ``window_end`` for ``area``.
+
+        Unchanged schedules are not written again.
+        """
+        entry = {
             "post_time": post_time.isoformat(),
             "window_end": window_end.isoformat(),
         }
+        schedules = self.state.setdefault("schedules", {})
+        if schedules.get(area) == entry:
+            return
+        schedules[area] = entry
         logger.debug(
             f"[QuestionState] Nächste Planung für '{area}' gespeichert: {post_time}"
         )
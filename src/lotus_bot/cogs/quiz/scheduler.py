@@ -1,9 +1,157 @@
 import random
 import asyncio
 import datetime
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
 
 from lotus_bot.log_setup import get_logger
 
+logger = get_logger(__name__)
+
+
+@dataclass(order=True)
+class TimerEvent:
+    """Entry of the :class:`TimerWheel` heap, ordered by due time."""
+
+    when: datetime.datetime
+    seq: int
+    key: str = field(compare=False)
+    kind: str = field(compare=False)
+    area: str | None = field(compare=False, default=None)
+    callback: Callable[[], Awaitable[None]] | None = field(
+        compare=False, default=None, repr=False
+    )
+    cancelled: bool = field(compare=False, default=False)
+
+
+class TimerWheel:
+    """Single background task driving all quiz and duel timers.
+
+    Events live in a min-heap keyed by due time. Cancelling or rescheduling
+    only marks the old heap entry as dead (lazy deletion), so both operations
+    are ``O(log n)`` and the heap is compacted once dead entries dominate.
+    Due callbacks are dispatched through ``create_task`` so a slow Discord
+    call never delays the next timer.
+    """
+
+    def __init__(self, create_task: Callable | None = None) -> None:
+        self._create_task = create_task or asyncio.create_task
+        self._heap: list[TimerEvent] = []
+        self._entries: dict[str, TimerEvent] = {}
+        self._counter = itertools.count()
+        self._dead = 0
+        self._wakeup = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def schedule(
+        self,
+        key: str,
+        when: datetime.datetime,
+        callback: Callable[[], Awaitable[None]],
+        *,
+        kind: str = "timer",
+        area: str | None = None,
+    ) -> TimerEvent:
+        """Arm ``callback`` for ``when``; an existing ``key`` is rescheduled."""
+        self._discard(key)
+        event = TimerEvent(when, next(self._counter), key, kind, area, callback)
+        self._entries[key] = event
+        heapq.heappush(self._heap, event)
+        if self._heap[0] is event:
+            self._wakeup.set()
+        return event
+
+    def reschedule(self, key: str, when: datetime.datetime) -> bool:
+        """Move an armed event to ``when``. Return ``False`` if unknown."""
+        event = self._entries.get(key)
+        if event is None:
+            return False
+        self.schedule(key, when, event.callback, kind=event.kind, area=event.area)
+        return True
+
+    def cancel(self, key: str) -> bool:
+        """Cancel the event stored under ``key``."""
+        return self._discard(key)
+
+    def cancel_area(self, area: str) -> int:
+        """Cancel every event registered for ``area``."""
+        keys = [k for k, e in self._entries.items() if e.area == area]
+        for key in keys:
+            self._discard(key)
+        return len(keys)
+
+    def get(self, key: str) -> TimerEvent | None:
+        """Return the armed event for ``key`` if present."""
+        return self._entries.get(key)
+
+    def upcoming(self, limit: int | None = None) -> list[TimerEvent]:
+        """Return armed events sorted by due time."""
+        events = sorted(self._entries.values())
+        return events if limit is None else events[:limit]
+
+    def _discard(self, key: str) -> bool:
+        event = self._entries.pop(key, None)
+        if event is None:
+            return False
+        event.cancelled = True
+        self._dead += 1
+        if self._dead > 32 and self._dead > len(self._heap) // 2:
+            self._heap = [e for e in self._heap if not e.cancelled]
+            heapq.heapify(self._heap)
+            self._dead = 0
+        return True
+
+    def pop_due(self, now: datetime.datetime | None = None) -> list[TimerEvent]:
+        """Remove and return all events due at ``now``."""
+        now = now or datetime.datetime.utcnow()
+        due = []
+        while self._heap and self._heap[0].when <= now:
+            event = heapq.heappop(self._heap)
+            if event.cancelled:
+                self._dead -= 1
+                continue
+            self._entries.pop(event.key, None)
+            due.append(event)
+        return due
+
+    def next_delay(self, now: datetime.datetime | None = None) -> float | None:
+        """Seconds until the next live event or ``None`` when idle."""
+        while self._heap and self._heap[0].cancelled:
+            heapq.heappop(self._heap)
+            self._dead -= 1
+        if not self._heap:
+            return None
+        now = now or datetime.datetime.utcnow()
+        return max((self._heap[0].when - now).total_seconds(), 0)
+
+    def dispatch_due(self, now: datetime.datetime | None = None) -> int:
+        """Start callbacks of all due events and return how many fired."""
+        due = self.pop_due(now)
+        for event in due:
+            logger.debug(f"[TimerWheel] Fire {event.kind} '{event.key}'")
+            self._create_task(event.callback())
+        return len(due)
+
+    async def run(self) -> None:
+        """Sleep until the next event, fire it and repeat forever."""
+        logger.info("[TimerWheel] Started.")
+        while True:
+            self._wakeup.clear()
+            self.dispatch_due()
+            delay = self.next_delay()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
 
 class QuizScheduler:
     def __init__(
@@ -12,93 +160,126 @@ class QuizScheduler:
         area: str,
         prepare_question_callback,
         close_question_callback,
+        timers: TimerWheel,
         post_time: datetime.datetime | None = None,
         window_end: datetime.datetime | None = None,
     ) -> None:
-        """Schedule automatic quiz questions for one area."""
+        """Schedule automatic quiz questions for one area on ``timers``."""
         self.bot = bot
         self.area = area
         self.prepare_question = prepare_question_callback
         self.close_question = close_question_callback
+        self.timers = timers
         self.logger = get_logger(__name__, area=area)
         self.post_time = post_time
         self.window_end = window_end
-        self.task: asyncio.Task | None = None
 
-    async def run(self) -> None:
-        """Background task loop scheduling questions in random intervals."""
-        await self.bot.wait_until_ready()
+    @property
+    def post_key(self) -> str:
+        return f"{self.area}:post"
+
+    @property
+    def window_key(self) -> str:
+        return f"{self.area}:window"
+
+    def start(self) -> None:
+        """Arm the first event: resume a persisted window or open a new one."""
+        if self.post_time and self.window_end:
+            self.logger.info(
+                f"[Scheduler] Wiederaufnahme des Zeitfensters für '{self.area}' "
+                f"bis {self.window_end:%H:%M}, Frage bei {self.post_time:%H:%M:%S}"
+            )
+            self._arm_window(self.post_time, self.window_end)
+        else:
+            self.timers.schedule(
+                self.window_key,
+                datetime.datetime.utcnow(),
+                self._begin_window,
+                kind="window_start",
+                area=self.area,
+            )
+
+    def stop(self) -> None:
+        """Cancel all pending events of this area."""
+        self.timers.cancel(self.post_key)
+        self.timers.cancel(self.window_key)
+
+    def _arm_window(
+        self, post_time: datetime.datetime, window_end: datetime.datetime
+    ) -> None:
+        self.timers.schedule(
+            self.post_key, post_time, self._on_post, kind="post", area=self.area
+        )
+        self.timers.schedule(
+            self.window_key,
+            window_end,
+            self._on_window_end,
+            kind="window_end",
+            area=self.area,
+        )
+
+    async def _begin_window(self) -> None:
+        """Open a new window and pick a random post time in its first half."""
         if self.area not in self.bot.quiz_data:
             self.logger.warning(
                 f"[Scheduler] '{self.area}' nicht in quiz_data vorhanden."
             )
             return
 
-        while True:
-            cfg = self.bot.quiz_data[self.area]
-            time_window = cfg.time_window
-
-            if self.post_time and self.window_end:
-                post_time = self.post_time
-                window_end = self.window_end
-                self.post_time = None
-                self.window_end = None
-                self.logger.info(
-                    f"[Scheduler] Wiederaufnahme des Zeitfensters für '{self.area}' "
-                    f"bis {window_end:%H:%M}, Frage bei {post_time:%H:%M:%S}"
-                )
-            else:
-                now = datetime.datetime.utcnow()
-                window_start = now.replace(second=0, microsecond=0)
-                window_end = window_start + time_window
+        time_window = self.bot.quiz_data[self.area].time_window
+        now = datetime.datetime.utcnow()
+        window_start = now.replace(second=0, microsecond=0)
+        window_end = window_start + time_window
+        next_time = window_start + datetime.timedelta(
+            seconds=random.uniform(0, time_window.total_seconds() / 2)
+        )
+        post_time = next_time + datetime.timedelta(seconds=random.uniform(0, 10))
 
-                next_time = window_start + datetime.timedelta(
-                    seconds=random.uniform(0, time_window.total_seconds() / 2)
-                )
-                post_time = next_time + datetime.timedelta(
-                    seconds=random.uniform(0, 10)
-                )
+        self.post_time = post_time
+        self.window_end = window_end
+        self._arm_window(post_time, window_end)
+        await self.bot.quiz_cog.state.set_schedule(self.area, post_time, window_end)
 
-                await self.bot.quiz_cog.state.set_schedule(
-                    self.area, post_time, window_end
-                )
+        self.logger.info(
+            f"[Scheduler] Neues Zeitfenster für '{self.area}' bis {window_end:%H:%M}. "
+            f"Frage geplant für ca. {post_time:%H:%M:%S}"
+        )
 
-                self.logger.info(
-                    f"[Scheduler] Neues Zeitfenster für '{self.area}' bis {window_end:%H:%M}. "
-                    f"Frage geplant für ca. {post_time:%H:%M:%S}"
-                )
+    async def _on_post(self) -> None:
+        """Post time reached: let the manager decide whether to ask."""
+        if self.area not in self.bot.quiz_data:
+            self.logger.warning(f"[Scheduler] '{self.area}' nicht mehr in quiz_data.")
+            self.stop()
+            return
 
-            now = datetime.datetime.utcnow()
-            await asyncio.sleep(max((post_time - now).total_seconds(), 0))
+        self.logger.debug(
+            f"[Scheduler] Wache auf – prüfe Bedingungen für '{self.area}'..."
+        )
+        await self.prepare_question(self.area, self.window_end)
+        await self.bot.quiz_cog.state.clear_schedule(self.area)
 
-            if self.area not in self.bot.quiz_data:
-                self.logger.warning(
-                    f"[Scheduler] '{self.area}' nicht mehr in quiz_data."
+    async def _on_window_end(self) -> None:
+        """Window over: stop waiting for activity and start the next window."""
+        if self.area not in self.bot.quiz_data:
+            self.stop()
+            return
+
+        cid = self.bot.quiz_data[self.area].channel_id
+        self.bot.quiz_cog.awaiting_activity.pop(cid, None)
+        # A question asked late (after activity gating) may carry an
+        # end_time beyond window_end so it gets its full answer duration.
+        # Re-arm the window end for that moment instead of cutting it short.
+        qinfo = self.bot.quiz_cog.current_questions.get(self.area)
+        if qinfo:
+            if qinfo.end_time > datetime.datetime.utcnow():
+                self.timers.schedule(
+                    self.window_key,
+                    qinfo.end_time,
+                    self._on_window_end,
+                    kind="window_end",
+                    area=self.area,
                 )
                 return
+            await self.close_question(self.area, qinfo=qinfo, timed_out=True)
 
-            self.logger.debug(
-                f"[Scheduler] Wache auf – prüfe Bedingungen für '{self.area}'..."
-            )
-            await self.prepare_question(self.area, window_end)
-            await self.bot.quiz_cog.state.clear_schedule(self.area)
-
-            await asyncio.sleep(
-                max((window_end - datetime.datetime.utcnow()).total_seconds(), 0)
-            )
-
-            cid = self.bot.quiz_data[self.area].channel_id
-            self.bot.quiz_cog.awaiting_activity.pop(cid, None)
-            # A question asked late (after activity gating) may carry an
-            # end_time beyond window_end so it gets its full answer duration.
-            # Wait that out before closing instead of cutting it short.
-            qinfo = self.bot.quiz_cog.current_questions.get(self.area)
-            if qinfo:
-                remaining = (
-                    qinfo.end_time - datetime.datetime.utcnow()
-                ).total_seconds()
-                if remaining > 0:
-                    await asyncio.sleep(remaining)
-                qinfo = self.bot.quiz_cog.current_questions.get(self.area)
-                if qinfo:
-                    await self.close_question(self.area, qinfo=qinfo, timed_out=True)
+        await self._begin_window()
@@ -11,7 +11,6 @@ from discord import app_commands
 from discord.ext import commands
 
 from .cog import QuizCog
-from .scheduler import QuizScheduler
 from .question_generator import QuestionGenerator
 from .duel import DuelInviteView, DuelConfig
 
@@ -104,6 +103,10 @@ async def language(interaction: discord.Interaction, lang: Literal["de", "en"]):
         if provider:
             provider.language = lang
 
+    quiz_cog: QuizCog | None = interaction.client.get_cog("QuizCog")
+    if quiz_cog:
+        quiz_cog.prefetch.invalidate(area)
+
     save_area_config(interaction.client)
 
     await interaction.response.send_message(
@@ -163,15 +166,11 @@ async def enable(
             provider.language = lang
 
     quiz_cog: QuizCog | None = interaction.client.get_cog("QuizCog")
-    if quiz_cog and area not in quiz_cog.schedulers:
-        scheduler = QuizScheduler(
-            bot=interaction.client,
-            area=area,
-            prepare_question_callback=quiz_cog.manager.prepare_question,
-            close_question_callback=quiz_cog.closer.close_question,
-        )
-        scheduler.task = quiz_cog._track_task(scheduler.run())
-        quiz_cog.schedulers[area] = scheduler
+    if quiz_cog:
+        quiz_cog.tracker.update_mapping()
+        quiz_cog.prefetch.invalidate(area)
+        quiz_cog.prefetch.refill(area)
+        quiz_cog.start_scheduler(area)
 
     save_area_config(interaction.client)
 
@@ -195,9 +194,7 @@ async def disable(interaction: discord.Interaction):
 
     quiz_cog: QuizCog | None = interaction.client.get_cog("QuizCog")
     if quiz_cog:
-        scheduler = quiz_cog.schedulers.pop(area, None)
-        if scheduler:
-            scheduler.task.cancel()
+        quiz_cog.stop_scheduler(area)
 
     save_area_config(interaction.client)
 
@@ -290,6 +287,12 @@ async def duel(
         area=area, points=punkte, mode=modus, timeout=timeout, best_of=best_of
     )
     view = DuelInviteView(interaction.user, cfg, interaction.client.get_cog("QuizCog"))
+    if quiz_cog:
+        # Warm up questions while the invite is pending.
+        if modus == "dynamic":
+            quiz_cog.prefetch.refill_duel_set(area)
+        else:
+            quiz_cog.prefetch.refill(area, "duel")
     embed = discord.Embed(
         title="Quiz-Duell",
         description=f"{interaction.user.mention} fordert einen Gegner heraus!",
@@ -385,6 +388,38 @@ async def status(interaction: discord.Interaction):
         )
 
 
+@quiz_group.command(
+    name="schedule", description="Zeigt die anstehenden Quiz- und Duell-Timer"
+)
+@app_commands.default_permissions(manage_guild=True)
+async def schedule(interaction: discord.Interaction):
+    quiz_cog: QuizCog | None = interaction.client.get_cog("QuizCog")
+    if quiz_cog is None:
+        await interaction.response.send_message(
+            "❌ Quiz-System nicht verfügbar.", ephemeral=True
+        )
+        return
+
+    events = quiz_cog.timers.upcoming(limit=20)
+    if not events:
+        await interaction.response.send_message(
+            "📭 Keine Timer geplant.", ephemeral=True
+        )
+        return
+
+    now = datetime.datetime.utcnow()
+    lines = [
+        "```text",
+        "In      Typ          Schlüssel",
+        "------- ------------ ---------",
+    ]
+    for event in events:
+        seconds = max(int((event.when - now).total_seconds()), 0)
+        lines.append(f"{seconds:>6}s {event.kind:<12} {event.key}")
+    lines.append("```")
+    await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+
 @quiz_group.command(name="stats", description="Zeigt Anzahl richtiger Antworten")
 @app_commands.describe(user="Optionaler Nutzer, dessen Statistik gezeigt wird")
 async def stats(interaction: discord.Interaction, user: discord.Member | None = None):
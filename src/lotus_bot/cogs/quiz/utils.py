@@ -6,6 +6,7 @@ import re
 import difflib
 
 from lotus_bot.log_setup import get_logger
+from lotus_bot.utils.compute import run_compute
 from unidecode import unidecode
 
 logger = get_logger(__name__)  # z. B. 'cogs.quiz.utils'
@@ -53,6 +54,25 @@ def check_answer(
     return False
 
 
+async def check_answer_async(
+    user_answer: str, correct_answers: list[str], threshold: float = 0.6
+) -> bool:
+    """
+    Wie ``check_answer``, läuft bei langen Eingaben aber im Compute-Pool,
+    damit ``SequenceMatcher`` den Event-Loop nicht blockiert.
+    """
+    size = len(user_answer) * sum(len(c) for c in correct_answers)
+    return await run_compute(
+        "quiz.check_answer",
+        check_answer,
+        user_answer,
+        correct_answers,
+        threshold,
+        size=size,
+        picklable=True,
+    )
+
+
 def create_permutations(answer: str) -> list[str]:
     """
     Erzeugt Varianten einer Antwort (Kleinschreibung, ASCII, ohne Sonderzeichen).
@@ -86,6 +106,14 @@ def normalize_text(text: str) -> str:
     return txt
 
 
+async def resolve_channel(bot, channel_id: int):
+    """Return ``channel_id`` from the gateway cache, fetching it only on a miss."""
+    channel = bot.get_channel(channel_id)
+    if channel is None:
+        channel = await bot.fetch_channel(channel_id)
+    return channel
+
+
 def get_available_areas():
     """
     Liest die verfügbaren Quiz-Areas aus der Konfigurationsdatei.
@@ -1,7 +1,7 @@
 import discord
 from discord.ui import View, Modal, TextInput, button, Button
 
-from .utils import check_answer
+from .utils import check_answer_async
 
 from lotus_bot.log_setup import get_logger
 
@@ -42,7 +42,7 @@ class AnswerModal(Modal, title="Antwort eingeben"):
         eingabe = self.answer.value.strip()
         self.cog.answered_users[self.area].add(user_id)
 
-        if check_answer(eingabe, self.correct_answers):
+        if await check_answer_async(eingabe, self.correct_answers):
             points = _points_for_difficulty(self.difficulty)
             champion_cog = self.cog.bot.get_cog("ChampionCog")
             if champion_cog:
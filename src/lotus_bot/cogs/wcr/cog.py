@@ -1,14 +1,18 @@
 # cogs/wcr/cog.py
 
+import asyncio
+
 import discord
-from discord.ext import commands
 from dataclasses import dataclass
 
 from lotus_bot.log_setup import get_logger
-from . import resolver, embed_builder
+from lotus_bot.utils.managed_cog import ManagedTaskCog
+from . import resolver, embed_builder, utils
 from . import helpers
 from .views import MiniSelectView
-from .duel import DuelCalculator
+from .duel import DuelMatrix
+from .store import WCRUnitStore, unit_faction_ids
+from .embed_cache import CachedEmbed, EmbedCache, fingerprint
 
 logger = get_logger(__name__)
 
@@ -20,12 +24,27 @@ class DuelOutcome:
     text: str
 
 
-class WCRCog(commands.Cog):
+class WCRCog(ManagedTaskCog):
     def __init__(self, bot) -> None:
         """Cog für Warcraft Rumble Befehle mit automatischem Fallback."""
+        super().__init__()
         self.bot = bot
+        self.embed_cache = EmbedCache()
+        self.data_version = 0
+        self.emoji_version = 0
+        self._emoji_source: dict | None = None
+        self.load_data(bot.data.get("wcr") or {})
+
+    @property
+    def emojis(self) -> dict[str, str]:
+        """Aktuelle Emoji-Map aus ``bot.data`` (wird in ``on_ready`` ersetzt)."""
+        return self.bot.data.get("emojis", {})
 
-        wcr_data = bot.data.get("wcr") or {}
+    def load_data(self, wcr_data: dict) -> None:
+        """(Re)build all lookup structures from ``wcr_data``.
+
+        Erhöht ``data_version`` und verwirft gecachte Embeds.
+        """
 
         # Bei fehlenden Daten Warnung ausgeben, aber nicht abbrechen
         if not wcr_data:
@@ -46,6 +65,7 @@ class WCRCog(commands.Cog):
                     en_units.append(entry)
             self.languages = {"en": {"units": en_units}}
         self.categories = wcr_data.get("categories", {})
+        self.source_version = wcr_data.get("version")
         self.stat_labels = wcr_data.get("stat_labels", {})
         self.faction_combinations = wcr_data.get("faction_combinations", {})
 
@@ -57,9 +77,8 @@ class WCRCog(commands.Cog):
         ) = resolver.build_lookup_tables(self.languages)
 
         self.lang_category_lookup = helpers.build_category_lookup(self.categories)
-
-        # Emojis liegen in bot.data["emojis"]
-        self.emojis = bot.data["emojis"]
+        self.store = WCRUnitStore(self.units, self.languages)
+        self.duel_matrix = DuelMatrix(self.units)
 
         # Cached lists for the autocomplete callbacks -----------------------
         # Unique elixir costs found in ``self.units``
@@ -96,6 +115,77 @@ class WCRCog(commands.Cog):
             for cid, item in cats.get("traits", {}).items()
         ]
 
+        self.data_version += 1
+        self.embed_cache.invalidate("WCR-Daten neu geladen")
+
+    async def cog_load(self) -> None:
+        """Startet die Hintergrund-Revalidierung der WCR-Daten."""
+        if utils.CACHE_TTL > 0:
+            self.create_task(self._refresh_loop())
+
+    async def _refresh_loop(self) -> None:
+        """Revalidate the cached WCR data whenever the cache TTL expires.
+
+        Fehlschläge beenden die Schleife nicht; die Wartezeit bis zum nächsten
+        Versuch verdoppelt sich bis ``utils.MAX_RETRY_DELAY``.
+        """
+        failures = 0
+        while True:
+            await asyncio.sleep(utils.refresh_delay())
+            try:
+                data = await utils.refresh_wcr_data()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                data = None
+                logger.error(
+                    f"[WCRCog] Revalidierung fehlgeschlagen: {exc}", exc_info=True
+                )
+            if data:
+                self.apply_data(data)
+            if utils.refresh_delay() > 0:
+                failures = 0
+                continue
+            # Upstream nicht erreichbar: alten Stand behalten, später erneut
+            failures += 1
+            delay = min(utils.RETRY_DELAY * 2 ** (failures - 1), utils.MAX_RETRY_DELAY)
+            logger.warning(
+                f"[WCRCog] Nächster Revalidierungsversuch in {delay}s "
+                f"({failures}. Fehlschlag)."
+            )
+            await asyncio.sleep(delay)
+
+    def apply_data(self, wcr_data: dict) -> None:
+        """Hot-swap new WCR data into the bot, this cog and the quiz provider."""
+        self.bot.data["wcr"] = wcr_data
+        self.load_data(wcr_data)
+
+        cfg = getattr(self.bot, "quiz_data", {}).get("wcr")
+        if cfg is not None:
+            from lotus_bot.cogs.quiz.area_providers.wcr import get_provider
+
+            cfg.question_generator.dynamic_providers["wcr"] = get_provider(
+                self.bot, language=cfg.language
+            )
+            prefetch = getattr(getattr(self.bot, "quiz_cog", None), "prefetch", None)
+            if prefetch is not None:
+                prefetch.invalidate("wcr")
+        logger.info(
+            f"[WCRCog] Data version {self.source_version} active "
+            f"({len(self.units)} Minis)."
+        )
+
+    def _current_emoji_version(self) -> int:
+        """Return the emoji map version and drop stale embeds on change."""
+        emojis = self.emojis
+        if emojis is not self._emoji_source:
+            self._emoji_source = emojis
+            version = fingerprint(emojis)
+            if version != self.emoji_version:
+                self.emoji_version = version
+                self.embed_cache.invalidate("Emojis neu geladen")
+        return self.emoji_version
+
     def _autocomplete(
         self, options: list[discord.app_commands.Choice], current: str
     ) -> list[discord.app_commands.Choice]:
@@ -139,16 +229,12 @@ class WCRCog(commands.Cog):
     ) -> list[discord.app_commands.Choice]:
         """Autocomplete Minis über alle unterstützten Sprachen."""
         normalized = " ".join(helpers.normalize_name(current))
-        matched_ids: set[str] = set()
-        for mapping in self.unit_name_map.values():
-            for name, uid in mapping.items():
-                if not normalized or normalized in name:
-                    matched_ids.add(uid)
+        matched_ids = self.store.match_names(normalized, limit=25)
 
         results: list[discord.app_commands.Choice] = []
         for lang in self.languages:
             for uid in matched_ids:
-                unit_name = helpers.get_text_data(uid, lang, self.languages)[0]
+                unit_name = self.store.name(uid, lang)
                 results.append(
                     discord.app_commands.Choice(
                         name=f"{unit_name} [{lang}]", value=str(uid)
@@ -185,94 +271,44 @@ class WCRCog(commands.Cog):
             )
             return
 
-        filtered_units = self.units
+        criteria: dict[str, str] = {}
 
         # Kosten filtern
         if cost is not None:
             try:
-                cost_value = int(cost)
+                criteria["cost"] = str(int(cost))
             except ValueError:
                 await interaction.response.send_message(
                     f"Kosten '{cost}' ist keine gültige Zahl.",
                     ephemeral=not public,
                 )
                 return
-            filtered_units = [u for u in filtered_units if u.get("cost") == cost_value]
 
-        # Geschwindigkeit filtern
-        if speed is not None:
-            speed_id = (
+        checks = (
+            ("speed", speed, "speeds", "Geschwindigkeit"),
+            ("faction", faction, "factions", "Fraktion"),
+            ("type", type, "types", "Typ"),
+            ("trait", trait, "traits", "Merkmal"),
+        )
+        for field, value, category, label in checks:
+            if value is None:
+                continue
+            category_id = (
                 helpers.find_category_id(
-                    speed, "speeds", lang, self.lang_category_lookup
+                    value, category, lang, self.lang_category_lookup
                 )
-                if not speed.isdigit()
-                else speed
+                if not value.isdigit()
+                else value
             )
-            if speed_id is None:
+            if category_id is None:
                 await interaction.response.send_message(
-                    f"Geschwindigkeit '{speed}' nicht gefunden.",
+                    f"{label} '{value}' nicht gefunden.",
                     ephemeral=not public,
                 )
                 return
-            filtered_units = [
-                u for u in filtered_units if u.get("speed_id") == speed_id
-            ]
+            criteria[field] = category_id
 
-        # Fraktion filtern
-        if faction is not None:
-            faction_id = (
-                helpers.find_category_id(
-                    faction, "factions", lang, self.lang_category_lookup
-                )
-                if not faction.isdigit()
-                else faction
-            )
-            if faction_id is None:
-                await interaction.response.send_message(
-                    f"Fraktion '{faction}' nicht gefunden.",
-                    ephemeral=not public,
-                )
-                return
-            filtered_units = [
-                u
-                for u in filtered_units
-                if str(faction_id)
-                in [str(fid) for fid in (u.get("faction_ids") or [u.get("faction_id")])]
-            ]
-
-        # Typ filtern
-        if type is not None:
-            type_id = (
-                helpers.find_category_id(type, "types", lang, self.lang_category_lookup)
-                if not type.isdigit()
-                else type
-            )
-            if type_id is None:
-                await interaction.response.send_message(
-                    f"Typ '{type}' nicht gefunden.",
-                    ephemeral=not public,
-                )
-                return
-            filtered_units = [u for u in filtered_units if u.get("type_id") == type_id]
-
-        # Merkmal filtern
-        if trait is not None:
-            trait_id = (
-                helpers.find_category_id(
-                    trait, "traits", lang, self.lang_category_lookup
-                )
-                if not trait.isdigit()
-                else trait
-            )
-            if trait_id is None:
-                await interaction.response.send_message(
-                    f"Merkmal '{trait}' nicht gefunden.",
-                    ephemeral=not public,
-                )
-                return
-            filtered_units = [
-                u for u in filtered_units if trait_id in u.get("trait_ids", [])
-            ]
+        filtered_units = self.store.filter(**criteria)
 
         if not filtered_units:
             await interaction.response.send_message(
@@ -291,9 +327,12 @@ class WCRCog(commands.Cog):
         options = []
         for unit in filtered_units:
             unit_id = unit["id"]
-            unit_name = helpers.get_text_data(unit_id, lang, self.languages)[0]
+            unit_name = self.store.name(unit_id, lang)
+            faction_ids = unit_faction_ids(unit)
             emoji_syntax = self.emojis.get(
-                helpers.get_faction_icon(unit["faction_id"], self.lang_category_lookup),
+                helpers.get_faction_icon(
+                    faction_ids[0] if faction_ids else "", self.lang_category_lookup
+                ),
                 "",
             )
             if emoji_syntax:
@@ -364,6 +403,25 @@ class WCRCog(commands.Cog):
         outcome = self._compute_duel_outcome(mini_a, mini_b, level_a, level_b, lang)
         await interaction.followup.send(outcome.text, ephemeral=not public)
 
+    async def cmd_counters(
+        self,
+        interaction: discord.Interaction,
+        mini: str,
+        level: int = 1,
+        counter_level: int | None = None,
+        lang: str = "de",
+        public: bool = False,
+    ) -> None:
+        """Implementation for ``/wcr konter``."""
+        logger.info(
+            f"[WCR] /wcr konter by {interaction.user} - mini={mini}, level={level}, "
+            f"counter_level={counter_level}, lang={lang}, public={public}"
+        )
+        await interaction.response.send_message(
+            self._compute_counters(mini, level, counter_level, lang),
+            ephemeral=not public,
+        )
+
     async def cmd_debug(self, interaction: discord.Interaction) -> None:
         """Sendet eine kurze Übersicht der geladenen WCR-Daten."""
         units_count = len(self.units)
@@ -371,13 +429,24 @@ class WCRCog(commands.Cog):
         msg = f"{units_count} Minis geladen. Kategorien: " + ", ".join(
             f"{k}={v}" for k, v in categories.items()
         )
+        age = utils.cache_age()
+        msg += f"\nDatenversion: {self.source_version or '-'}"
+        if age is not None:
+            msg += f", Cache-Alter {age / 3600:.1f} h"
+        cache = self.embed_cache.stats()
+        msg += (
+            f"\nEmbed-Cache: {cache['size']} Einträge, "
+            f"Trefferquote {cache['hit_rate']:.0%} "
+            f"({cache['hits']}/{cache['hits'] + cache['misses']})"
+        )
         await interaction.response.send_message(msg, ephemeral=True)
 
     def create_mini_embed(self, name_or_id, lang):
         """Baue ein Mini-Embed.
 
         Lookup erfolgt sprachübergreifend, die Ausgabe richtet sich nach
-        ``lang``.
+        ``lang``. Gerenderte Embeds werden pro Mini, Sprache, Daten- und
+        Emoji-Version im ``embed_cache`` gehalten.
         """
         result = self.resolve_unit(name_or_id, lang)
         if not result:
@@ -386,17 +455,22 @@ class WCRCog(commands.Cog):
             return None, None
 
         unit_id, unit_data, _ = result
-
-        return embed_builder.build_mini_embed(
-            unit_id,
-            unit_data,
-            lang,
-            self.emojis,
-            self.languages,
-            self.lang_category_lookup,
-            self.stat_labels,
-            self.faction_combinations,
-        )
+        key = (unit_id, lang, self.data_version, self._current_emoji_version())
+        cached = self.embed_cache.get(key)
+        if cached is None:
+            embed, logo_file = embed_builder.build_mini_embed(
+                unit_id,
+                unit_data,
+                lang,
+                self.emojis,
+                self.languages,
+                self.lang_category_lookup,
+                self.stat_labels,
+                self.faction_combinations,
+            )
+            cached = CachedEmbed.from_rendered(embed, logo_file)
+            self.embed_cache.put(key, cached)
+        return cached.materialize()
 
     def _find_unit_id_by_name(
         self, normalized: str, lang: str
@@ -418,13 +492,10 @@ class WCRCog(commands.Cog):
         if lang not in self.languages:
             return None
 
-        if any(unit["id"] == str(name_or_id) for unit in self.units):
+        unit_data = self.store.get(name_or_id)
+        if unit_data is not None:
             unit_id = str(name_or_id)
-            unit_data = next((u for u in self.units if u["id"] == unit_id), None)
-            if not unit_data:
-                return None
-            name, _, _ = helpers.get_text_data(unit_id, lang, self.languages)
-            if name == "Unbekannt":
+            if self.store.name(unit_id, lang) == "Unbekannt":
                 return None
         else:
             normalized = " ".join(helpers.normalize_name(name_or_id))
@@ -442,9 +513,7 @@ class WCRCog(commands.Cog):
             if unit_id is None:
                 return None
 
-            unit_data = next(
-                (unit for unit in self.units if unit["id"] == unit_id), None
-            )
+            unit_data = self.store.get(unit_id)
             if not unit_data:
                 return None
 
@@ -475,37 +544,23 @@ class WCRCog(commands.Cog):
         id_a, data_a, _ = res_a
         id_b, data_b, _ = res_b
 
-        name_a = helpers.get_text_data(id_a, lang, self.languages)[0]
-        name_b = helpers.get_text_data(id_b, lang, self.languages)[0]
-
-        calculator = DuelCalculator()
+        name_a = self.store.name(id_a, lang)
+        name_b = self.store.name(id_b, lang)
 
         base_a = data_a.get("stats", {})
         base_b = data_b.get("stats", {})
-        stats_a = calculator.scaled_stats(data_a, level_a)
-        stats_b = calculator.scaled_stats(data_b, level_b)
-
-        dps_a, notes_a = calculator.compute_dps_details(data_a, stats_a, data_b)
-        dps_b, notes_b = calculator.compute_dps_details(data_b, stats_b, data_a)
+        stats_a = self.duel_matrix.stats(id_a, level_a)
+        stats_b = self.duel_matrix.stats(id_b, level_b)
 
-        def _flight_issue(att: dict, def_: dict) -> bool:
-            """Return True if ``att`` cannot hit ``def_`` due to flying."""
-
-            ta = [str(t) for t in att.get("trait_ids", [])]
-            td = [str(t) for t in def_.get("trait_ids", [])]
-            if att.get("type_id") == "2":
-                # Spells always hit flying targets
-                return False
-            # Trait 15 = Flying. Trait 11/15 allow hitting flying units
-            return "15" in td and "11" not in ta and "15" not in ta
-
-        issue_a = _flight_issue(data_a, data_b)
-        issue_b = _flight_issue(data_b, data_a)
+        dps_a, notes_a = self.duel_matrix.dps_details(id_a, id_b, level_a)
+        dps_b, notes_b = self.duel_matrix.dps_details(id_b, id_a, level_b)
+        issue_a = self.duel_matrix.cell(id_a, id_b).blocked
+        issue_b = self.duel_matrix.cell(id_b, id_a).blocked
 
         if (issue_a or dps_a == 0) and (issue_b or dps_b == 0):
             return DuelOutcome("Keines der Minis kann den Gegner treffen.")
 
-        winner_data = calculator.duel_result(data_a, level_a, data_b, level_b)
+        winner_data = self.duel_matrix.duel_result(id_a, level_a, id_b, level_b)
 
         is_spell_a = data_a.get("type_id") == 2
         is_spell_b = data_b.get("type_id") == 2
@@ -540,8 +595,7 @@ class WCRCog(commands.Cog):
                 )
 
         def _fmt_stats(base: dict, scaled: dict, lvl: int) -> str:
-            dmg_key = "damage" if "damage" in base else "area_damage"
-            dmg_scaled = scaled.get(dmg_key, 0)
+            dmg_scaled = scaled.get("damage", 0)
             hp_scaled = scaled.get("health", 0)
             dps_scaled = scaled.get("dps", base.get("dps", 0))
             return (
@@ -571,6 +625,35 @@ class WCRCog(commands.Cog):
 
         return DuelOutcome(text)
 
+    def _compute_counters(
+        self,
+        mini: str,
+        level: int = 1,
+        counter_level: int | None = None,
+        lang: str = "de",
+        limit: int = 5,
+    ) -> str:
+        """Baue den Text der besten Konter gegen ``mini`` aus der Duell-Matrix."""
+        res = self.resolve_unit(mini, lang)
+        if not res:
+            return f"Mini '{mini}' nicht gefunden."
+        unit_id = res[0]
+        counter_level = level if counter_level is None else counter_level
+        name = self.store.name(unit_id, lang)
+        counters = self.duel_matrix.best_counters(
+            unit_id, level, counter_level, limit=limit
+        )
+        if not counters:
+            return f"Kein Mini besiegt {name} (Level {level}) im direkten Duell."
+        lines = [
+            f"Beste Konter gegen {name} (Level {level}, Konter Level {counter_level}):"
+        ]
+        for pos, (cid, time) in enumerate(counters, start=1):
+            lines.append(
+                f"{pos}. {self.store.name(cid, lang)} – besiegt in {time:.1f} Sekunden"
+            )
+        return "\n".join(lines)
+
     async def send_mini_embed(
         self, interaction, unit_id, lang, public: bool = False
     ) -> None:
@@ -599,5 +682,5 @@ class WCRCog(commands.Cog):
             )
 
     def cog_unload(self):
-        """Nothing to clean up when unloading the cog."""
-        return
+        """Stoppt die Hintergrund-Revalidierung."""
+        super().cog_unload()
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from lotus_bot.log_setup import get_logger
 
 logger = get_logger(__name__)
@@ -139,3 +141,172 @@ class DuelCalculator:
         if time_a < time_b:
             return "a", time_a
         return "b", time_b
+
+
+# Level-Bereich von ``/wcr duell``
+MAX_LEVEL = 31
+
+
+@dataclass(frozen=True)
+class DuelCell:
+    """Vorberechnetes Ergebnis ``attacker`` gegen ``defender`` bei gleichem Level."""
+
+    winner: str | None
+    time: float
+    blocked: bool
+    dps: float
+
+
+class DuelMatrix:
+    def __init__(self, units: list[dict], calculator: DuelCalculator | None = None):
+        """Precompute stat vectors and the attacker × defender outcome matrix.
+
+        Alle Werte skalieren linear mit ``scale_stat``. Die Matrix wird daher
+        einmal auf Level 1 berechnet; Ergebnisse für gleiche Level sind
+        identisch, unterschiedliche Level ergeben sich durch Skalierung der
+        gespeicherten Basiswerte ohne erneute Dict-Auswertung.
+        """
+        self.calculator = calculator or DuelCalculator()
+        self.units = units
+        self.ids = [str(u["id"]) for u in units]
+        self.index = {uid: i for i, uid in enumerate(self.ids)}
+        self.factors = [
+            self.calculator.scale_stat(1, level) for level in range(1, MAX_LEVEL + 1)
+        ]
+
+        base = [self.calculator.scaled_stats(u, 1) for u in units]
+        self.health = [s.get("health", 0) for s in base]
+        self.is_spell = [u.get("type_id") == "2" for u in units]
+        self.spell_damage = [
+            self.calculator.spell_total_damage(u, s) if spell else 0.0
+            for u, s, spell in zip(units, base, self.is_spell)
+        ]
+        # Stat-Vektoren pro Level: levels[level - 1][stat][unit]
+        self.levels = [
+            {
+                "health": [h * f for h in self.health],
+                "damage": [s.get("damage", s.get("area_damage", 0)) * f for s in base],
+                "dps": [s["dps"] * f if "dps" in s else None for s in base],
+            }
+            for f in self.factors
+        ]
+
+        n = len(units)
+        self.dps: list[float] = [0.0] * (n * n)
+        self.notes: list[list[str]] = [[] for _ in range(n * n)]
+        self.blocked: list[bool] = [False] * (n * n)
+        for i, attacker in enumerate(units):
+            traits_a = {str(t) for t in attacker.get("trait_ids", [])}
+            for j, defender in enumerate(units):
+                k = i * n + j
+                dps, notes = self.calculator.compute_dps_details(
+                    attacker, base[i], defender
+                )
+                self.dps[k] = dps
+                self.notes[k] = notes
+                traits_d = {str(t) for t in defender.get("trait_ids", [])}
+                self.blocked[k] = (
+                    attacker.get("type_id") != "2"
+                    and "15" in traits_d
+                    and "11" not in traits_a
+                    and "15" not in traits_a
+                )
+        self.cells = [self._cell(i, j) for i in range(n) for j in range(n)]
+        logger.info(f"[DuelMatrix] {n}×{n} Matchups vorberechnet.")
+
+    def __contains__(self, unit_id) -> bool:
+        return str(unit_id) in self.index
+
+    def factor(self, level: int) -> float:
+        """Return the stat multiplier for ``level``."""
+        return self.factors[min(max(level, 1), MAX_LEVEL) - 1]
+
+    def _cell(self, i: int, j: int) -> DuelCell:
+        result = self._result(i, 1.0, j, 1.0)
+        winner, time = result if result else (None, 0.0)
+        n = len(self.ids)
+        return DuelCell(winner, time, self.blocked[i * n + j], self.dps[i * n + j])
+
+    def _result(self, i: int, fa: float, j: int, fb: float) -> tuple[str, float] | None:
+        n = len(self.ids)
+        dps_a = self.dps[i * n + j] * fa
+        dps_b = self.dps[j * n + i] * fb
+        spell_a, spell_b = self.is_spell[i], self.is_spell[j]
+
+        if spell_a and spell_b:
+            if dps_a == dps_b:
+                return None
+            return ("a", 0.0) if dps_a > dps_b else ("b", 0.0)
+        if spell_a:
+            return (
+                ("a", 0.0) if self.spell_damage[i] * fa >= self.health[j] * fb else None
+            )
+        if spell_b:
+            return (
+                ("b", 0.0) if self.spell_damage[j] * fb >= self.health[i] * fa else None
+            )
+
+        time_a = self.health[j] * fb / dps_a if dps_a > 0 else float("inf")
+        time_b = self.health[i] * fa / dps_b if dps_b > 0 else float("inf")
+        if time_a == time_b:
+            return None
+        if time_a < time_b:
+            return "a", time_a
+        return "b", time_b
+
+    def cell(self, attacker_id, defender_id) -> DuelCell:
+        """Return the precomputed same-level cell for two unit ids."""
+        n = len(self.ids)
+        return self.cells[
+            self.index[str(attacker_id)] * n + self.index[str(defender_id)]
+        ]
+
+    def dps_details(
+        self, attacker_id, defender_id, level: int = 1
+    ) -> tuple[float, list[str]]:
+        """Return DPS of ``attacker_id`` against ``defender_id`` and its notes."""
+        k = self.index[str(attacker_id)] * len(self.ids) + self.index[str(defender_id)]
+        return self.dps[k] * self.factor(level), self.notes[k]
+
+    def stats(self, unit_id, level: int = 1) -> dict[str, float]:
+        """Return the scaled stat vector entry of ``unit_id`` for ``level``."""
+        i = self.index[str(unit_id)]
+        row = self.levels[min(max(level, 1), MAX_LEVEL) - 1]
+        return {key: values[i] for key, values in row.items() if values[i] is not None}
+
+    def duel_result(
+        self, id_a, level_a: int, id_b, level_b: int
+    ) -> tuple[str, float] | None:
+        """Lookup counterpart of :meth:`DuelCalculator.duel_result`."""
+        i, j = self.index[str(id_a)], self.index[str(id_b)]
+        if level_a == level_b:
+            cell = self.cells[i * len(self.ids) + j]
+            return (cell.winner, cell.time) if cell.winner else None
+        return self._result(i, self.factor(level_a), j, self.factor(level_b))
+
+    def best_counters(
+        self,
+        unit_id,
+        level: int = 1,
+        counter_level: int | None = None,
+        limit: int = 5,
+        include_spells: bool = False,
+    ) -> list[tuple[str, float]]:
+        """Return ids that beat ``unit_id`` sorted by time-to-kill."""
+        j = self.index[str(unit_id)]
+        counter_level = level if counter_level is None else counter_level
+        fa, fb = self.factor(counter_level), self.factor(level)
+        n = len(self.ids)
+        counters = []
+        for i in range(n):
+            if i == j or (self.is_spell[i] and not include_spells):
+                continue
+            if fa == fb:
+                cell = self.cells[i * n + j]
+                result = (cell.winner, cell.time) if cell.winner else None
+            else:
+                result = self._result(i, fa, j, fb)
+            if result and result[0] == "a":
+                counters.append((self.ids[i], result[1]))
+        counters.sort(key=lambda item: item[1])
+        return counters[:limit]
@@ -0,0 +1,109 @@
+# cogs/wcr/embed_cache.py
+"""LRU-Cache für gerenderte Mini-Embeds."""
+
+from __future__ import annotations
+
+import io
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Hashable
+
+import discord
+
+from lotus_bot.log_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Anzahl gerenderter Embeds, die im Speicher gehalten werden
+EMBED_CACHE_SIZE = 256
+
+
+def fingerprint(mapping: dict) -> int:
+    """Return a content hash of ``mapping`` used as cache version."""
+    return hash(frozenset((k, str(v)) for k, v in mapping.items()))
+
+
+@dataclass
+class CachedEmbed:
+    """Serialisiertes Embed samt Logo-Datei."""
+
+    payload: dict[str, Any]
+    logo_name: str | None = None
+    logo_bytes: bytes | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_rendered(
+        cls, embed: discord.Embed, logo_file: discord.File | None
+    ) -> "CachedEmbed":
+        """Serialize ``embed`` and read ``logo_file`` into memory."""
+        if logo_file is None:
+            return cls(embed.to_dict())
+        try:
+            data = logo_file.fp.read()
+        finally:
+            logo_file.close()
+        return cls(embed.to_dict(), logo_file.filename, data)
+
+    def materialize(self) -> tuple[discord.Embed, discord.File | None]:
+        """Return a fresh embed and file; ``discord.File`` is single-use."""
+        embed = discord.Embed.from_dict(self.payload)
+        if self.logo_bytes is None:
+            return embed, None
+        return embed, discord.File(io.BytesIO(self.logo_bytes), filename=self.logo_name)
+
+
+class EmbedCache:
+    def __init__(self, maxsize: int = EMBED_CACHE_SIZE) -> None:
+        """LRU cache keyed by ``(unit_id, lang, data_version, emoji_version)``."""
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, CachedEmbed] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key: Hashable) -> CachedEmbed | None:
+        """Return the entry for ``key`` and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, entry: CachedEmbed) -> None:
+        """Store ``entry`` and evict the least recently used item if full."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, reason: str = "") -> None:
+        """Drop all cached embeds, e.g. after a data or emoji reload."""
+        if self._entries:
+            logger.info(
+                f"[EmbedCache] {len(self._entries)} Embeds verworfen ({reason or 'reload'})."
+            )
+        self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Return size and hit metrics."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 3),
+        }
@@ -134,6 +134,33 @@ async def duell(
     await cog.cmd_duel(interaction, mini_a, mini_b, level_a, level_b, lang, public)
 
 
+@wcr_group.command(
+    name="konter",
+    description="Zeigt die Minis, die ein Mini im Duell am schnellsten besiegen.",
+)
+@app_commands.describe(
+    mini="Mini (Name oder ID)",
+    level="Level des Minis (1-31, Standard 1)",
+    counter_level="Level der Konter (1-31, Standard wie Mini)",
+    lang="Sprache",
+    public="Antwort \u00f6ffentlich anzeigen",
+)
+@app_commands.autocomplete(mini=_unit_name_ac)
+async def konter(
+    interaction: discord.Interaction,
+    mini: str,
+    level: app_commands.Range[int, 1, 31] = 1,
+    counter_level: app_commands.Range[int, 1, 31] | None = None,
+    lang: str = "de",
+    public: bool = False,
+):
+    logger.info(
+        f"/wcr konter by {interaction.user} mini={mini} level={level} counter_level={counter_level} lang={lang} public={public}"
+    )
+    cog: WCRCog = interaction.client.get_cog("WCRCog")
+    await cog.cmd_counters(interaction, mini, level, counter_level, lang, public)
+
+
 @wcr_group.command(name="debug", description="Zeigt geladene WCR-Daten an.")
 @app_commands.checks.has_permissions(manage_guild=True)
 async def debug(interaction: discord.Interaction):
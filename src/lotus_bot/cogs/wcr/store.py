@@ -0,0 +1,137 @@
+# cogs/wcr/store.py
+"""Indizierter Speicher für Warcraft Rumble Minis."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List
+
+from . import helpers
+
+# Filterkriterium -> Feld(er) der Unit
+FILTER_FIELDS = ("cost", "speed", "faction", "type", "trait")
+
+UNKNOWN_TEXT = ("Unbekannt", "Beschreibung fehlt", [])
+
+
+def unit_faction_ids(unit: dict) -> list[str]:
+    """Return all faction ids of ``unit`` as strings."""
+    ids = unit.get("faction_ids") or [unit.get("faction_id")]
+    return [str(fid) for fid in ids if fid is not None]
+
+
+def _unit_values(unit: dict, field: str) -> list[str]:
+    if field == "cost":
+        return [str(unit["cost"])] if unit.get("cost") is not None else []
+    if field == "speed":
+        return [str(unit["speed_id"])] if unit.get("speed_id") is not None else []
+    if field == "faction":
+        return unit_faction_ids(unit)
+    if field == "type":
+        return [str(unit["type_id"])] if unit.get("type_id") is not None else []
+    return [str(t) for t in unit.get("trait_ids", [])]
+
+
+class WCRUnitStore:
+    def __init__(self, units: List[dict], languages: Dict[str, Any]) -> None:
+        """Index ``units`` by id and precompute texts and filter bitsets.
+
+        Jede Unit erhält eine feste Bitposition. Pro Filterkriterium und Wert
+        wird ein ``int`` als Bitmenge gespeichert, sodass kombinierte Filter
+        nur noch aus ``&``-Verknüpfungen bestehen.
+        """
+        self.units = units
+        self.languages = languages
+        self.ids: list[str] = [str(unit["id"]) for unit in units]
+        self.by_id: dict[str, dict] = dict(zip(self.ids, units))
+        self._position = {uid: pos for pos, uid in enumerate(self.ids)}
+        self.all_mask = (1 << len(self.ids)) - 1
+
+        self.texts: dict[tuple[str, str], tuple[str, str, list]] = {}
+        for lang, data in languages.items():
+            for entry in data.get("units", []):
+                self.texts[(str(entry["id"]), lang)] = (
+                    entry.get("name", UNKNOWN_TEXT[0]),
+                    entry.get("description", UNKNOWN_TEXT[1]),
+                    entry.get("talents", []),
+                )
+
+        self.bitsets: dict[str, dict[str, int]] = {f: {} for f in FILTER_FIELDS}
+        for pos, unit in enumerate(units):
+            bit = 1 << pos
+            for field in FILTER_FIELDS:
+                bucket = self.bitsets[field]
+                for value in _unit_values(unit, field):
+                    bucket[value] = bucket.get(value, 0) | bit
+
+        # Normalisierte Namen aller Sprachen für die Autovervollständigung
+        self.search_names: list[tuple[str, str]] = sorted(
+            {
+                (" ".join(helpers.normalize_name(name)), uid)
+                for (uid, _), (name, _, _) in self.texts.items()
+                if uid in self._position
+            },
+            key=lambda item: (self._position[item[1]], item[0]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, unit_id) -> bool:
+        return str(unit_id) in self.by_id
+
+    def get(self, unit_id) -> dict | None:
+        """Return the unit with ``unit_id`` or ``None``."""
+        return self.by_id.get(str(unit_id))
+
+    def text(self, unit_id, lang: str) -> tuple[str, str, list]:
+        """Return name, description and talents like ``helpers.get_text_data``."""
+        if lang not in self.languages:
+            lang = "en"
+        return self.texts.get((str(unit_id), lang), UNKNOWN_TEXT)
+
+    def name(self, unit_id, lang: str) -> str:
+        """Return the localized name of ``unit_id``."""
+        return self.text(unit_id, lang)[0]
+
+    def mask(self, field: str, value) -> int:
+        """Return the bitset of units whose ``field`` matches ``value``."""
+        return self.bitsets[field].get(str(value), 0)
+
+    def _iter_mask(self, mask: int) -> Iterator[str]:
+        while mask:
+            low = mask & -mask
+            yield self.ids[low.bit_length() - 1]
+            mask ^= low
+
+    def filter(self, **criteria) -> list[dict]:
+        """Return units matching all given criteria in roster order.
+
+        Erlaubte Schlüssel sind ``cost``, ``speed``, ``faction``, ``type`` und
+        ``trait``; ``None``-Werte werden ignoriert.
+        """
+        mask = self.all_mask
+        for field, value in criteria.items():
+            if value is None:
+                continue
+            mask &= self.mask(field, value)
+            if not mask:
+                return []
+        return [self.by_id[uid] for uid in self._iter_mask(mask)]
+
+    def count(self, **criteria) -> int:
+        """Return how many units match ``criteria`` without building the list."""
+        mask = self.all_mask
+        for field, value in criteria.items():
+            if value is not None:
+                mask &= self.mask(field, value)
+        return mask.bit_count()
+
+    def match_names(self, normalized: str, limit: int | None = None) -> list[str]:
+        """Return unit ids whose name in any language contains ``normalized``."""
+        matched: dict[str, None] = {}
+        for name, uid in self.search_names:
+            if not normalized or normalized in name:
+                matched[uid] = None
+                if limit is not None and len(matched) >= limit:
+                    break
+        return list(matched)
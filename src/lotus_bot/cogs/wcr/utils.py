@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import os
 import time
 from pathlib import Path
@@ -21,37 +23,70 @@ BASE_PATH = Path("data/wcr")
 
 # Cache-Datei für API-Daten
 CACHE_FILE = Path("data/pers/wcr_cache.json")
-# Standard-TTL (in Sekunden) kann über ``WCR_CACHE_TTL`` angepasst werden
+# Standard-TTL (in Sekunden) kann über ``WCR_CACHE_TTL`` angepasst werden.
+# Danach wird der Cache im Hintergrund revalidiert; 0 deaktiviert den Cache.
 CACHE_TTL = int(os.getenv("WCR_CACHE_TTL", "86400"))
+# Wartezeit bis zum nächsten Versuch, wenn die API nicht antwortet
+RETRY_DELAY = 300
+# Obergrenze für die verdoppelte Wartezeit nach wiederholten Fehlschlägen
+MAX_RETRY_DELAY = 3600
+# Version des Cache-Formats (``raw`` + ``data`` + Validatoren)
+CACHE_FORMAT = 2
 
+ENDPOINTS = ("units", "categories")
 
-async def fetch_wcr_data(base_url: str) -> dict[str, Any]:
+
+async def fetch_wcr_data(
+    base_url: str, validators: dict[str, dict[str, str]] | None = None
+) -> dict[str, Any]:
     """Ruft alle WCR-Endpunkte von ``base_url`` ab.
 
-    Erwartet die Unterpfade ``/units`` und ``/categories``.
+    Erwartet die Unterpfade ``/units`` und ``/categories``. Mit
+    ``validators`` (ETag/Last-Modified pro Endpunkt) werden bedingte Anfragen
+    gestellt; Endpunkte mit ``304`` oder Fehler fehlen im Ergebnis. Neue
+    Validatoren stehen unter ``"validators"``.
     """
 
-    endpoints = ["units", "categories"]
+    validators = validators or {}
     data: dict[str, Any] = {}
+    new_validators: dict[str, dict[str, str]] = {}
     timeout = aiohttp.ClientTimeout(total=10)
     async with aiohttp.ClientSession(timeout=timeout) as session:
 
         async def fetch(ep: str) -> tuple[str, Any]:
             url = f"{base_url.rstrip('/')}/{ep}"
+            headers = {}
+            known = validators.get(ep, {})
+            if known.get("etag"):
+                headers["If-None-Match"] = known["etag"]
+            if known.get("last_modified"):
+                headers["If-Modified-Since"] = known["last_modified"]
             try:
-                async with session.get(url) as resp:
+                async with session.get(url, headers=headers) as resp:
+                    if resp.status == 304:
+                        logger.info("[WCRUtils] '%s' not modified.", ep)
+                        new_validators[ep] = known
+                        return ep, None
                     resp.raise_for_status()
                     payload = await resp.json()
+                    new_validators[ep] = {
+                        k: v
+                        for k, v in (
+                            ("etag", resp.headers.get("ETag")),
+                            ("last_modified", resp.headers.get("Last-Modified")),
+                        )
+                        if v
+                    }
                 logger.info("[WCRUtils] '%s' loaded successfully.", ep)
                 return ep, payload
             except asyncio.TimeoutError:
                 logger.error("[WCRUtils] Timeout while fetching %s", ep)
             except Exception as exc:  # pragma: no cover - unexpected errors
                 logger.error("[WCRUtils] Error fetching %s: %s", ep, exc)
-            return ep, {}
+            return ep, None
 
-        results = await asyncio.gather(*(fetch(ep) for ep in endpoints))
-        data.update(dict(results))
+        results = await asyncio.gather(*(fetch(ep) for ep in ENDPOINTS))
+        data.update({ep: payload for ep, payload in results if payload is not None})
 
     # Fraktions-Metadaten aus lokaler Datei zusammenführen
     meta_file = BASE_PATH / "faction_meta.json"
@@ -71,36 +106,14 @@ async def fetch_wcr_data(base_url: str) -> dict[str, Any]:
         for faction in data["categories"].get("factions", []):
             faction.update(meta_map.get(str(faction.get("id")), {}))
 
+    data["validators"] = new_validators
     return data
 
 
-async def load_wcr_data(base_url: str | None = None) -> dict[str, Any]:
-    """Lädt alle benötigten WCR-Daten.
-
-    Bei vorhandenem und gültigem Cache werden die Daten aus
-    :data:`CACHE_FILE` geladen. Andernfalls erfolgt ein API-Aufruf über
-    :func:`fetch_wcr_data` und das Ergebnis wird im Cache gespeichert.
-    """
-
-    # Zuerst Cache prüfen
-    if CACHE_FILE.exists():
-        age = time.time() - CACHE_FILE.stat().st_mtime
-        if age < CACHE_TTL:
-            try:
-                with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                    cached = json.load(f)
-                logger.info("[WCRUtils] Loaded data from cache.")
-                return cached
-            except Exception as exc:  # pragma: no cover - should not happen
-                logger.error("[WCRUtils] Error reading cache: %s", exc)
-
-    base_url = base_url or os.getenv("WCR_API_URL")
-    if not base_url:
-        logger.error("[WCRUtils] Base URL for the WCR API is missing.")
-        return {}
-
-    api_data = await fetch_wcr_data(base_url)
+def build_wcr_data(api_data: dict[str, Any]) -> dict[str, Any]:
+    """Bereitet die Rohdaten der API für Cog und Quiz auf."""
 
+    api_data = copy.deepcopy(api_data)
     units = api_data.get("units", {})
     units_list = units.get("units", units)
 
@@ -146,7 +159,7 @@ async def load_wcr_data(base_url: str | None = None) -> dict[str, Any]:
         except Exception as exc:  # pragma: no cover - should not happen in tests
             logger.error("[WCRUtils] Error loading stat_labels.json: %s", exc)
 
-    result = {
+    return {
         "units": units_list,
         "locals": locals_,
         "categories": api_data.get("categories", {}),
@@ -154,13 +167,123 @@ async def load_wcr_data(base_url: str | None = None) -> dict[str, Any]:
         "faction_combinations": api_data.get("faction_combinations", {}),
     }
 
-    # Cache speichern
+
+def payload_version(raw: dict[str, Any]) -> str:
+    """Return a short content hash of the raw API payloads."""
+    encoded = json.dumps(raw, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:12]
+
+
+def read_cache() -> dict[str, Any] | None:
+    """Liest den Cache; ältere Formate enthalten nur die aufbereiteten Daten."""
+    if not CACHE_FILE.exists():
+        return None
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except Exception as exc:
+        logger.error("[WCRUtils] Error reading cache: %s", exc)
+        return None
+    if cached.get("format") != CACHE_FORMAT:
+        return {"data": cached, "raw": None, "validators": {}, "version": None}
+    return cached
+
+
+def write_cache(entry: dict[str, Any]) -> None:
+    """Speichert ``entry`` atomar, damit ein Abbruch keinen halben Cache hinterlässt."""
     try:
         CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(result, f)
+        tmp = CACHE_FILE.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"format": CACHE_FORMAT, **entry}, f)
+        os.replace(tmp, CACHE_FILE)
         logger.info("[WCRUtils] Cache updated.")
     except Exception as exc:  # pragma: no cover - should not happen
         logger.error("[WCRUtils] Error writing cache: %s", exc)
 
-    return result
+
+def cache_age() -> float | None:
+    """Return the age of the cache file in seconds or ``None`` if missing."""
+    if not CACHE_FILE.exists():
+        return None
+    return time.time() - CACHE_FILE.stat().st_mtime
+
+
+def refresh_delay() -> float:
+    """Seconds until the cache is due for revalidation."""
+    age = cache_age()
+    if age is None:
+        return 0.0
+    return max(CACHE_TTL - age, 0.0)
+
+
+async def refresh_wcr_data(
+    base_url: str | None = None, cached: dict[str, Any] | None = None
+) -> dict[str, Any] | None:
+    """Revalidiert die WCR-Daten gegen die API.
+
+    Gibt neue aufbereitete Daten zurück, wenn sich etwas geändert hat, sonst
+    ``None``. Unvollständige Antworten überschreiben den letzten gültigen
+    Cache nie.
+    """
+
+    base_url = base_url or os.getenv("WCR_API_URL")
+    if not base_url:
+        logger.error("[WCRUtils] Base URL for the WCR API is missing.")
+        return None
+
+    if cached is None and CACHE_TTL > 0:
+        cached = read_cache()
+    cached_raw = (cached or {}).get("raw") or {}
+    validators = (cached or {}).get("validators", {}) if cached_raw else {}
+
+    api_data = await fetch_wcr_data(base_url, validators)
+    new_validators = api_data.pop("validators", {})
+
+    raw = {
+        key: api_data[key] if key in api_data else cached_raw.get(key)
+        for key in (*ENDPOINTS, "faction_combinations")
+    }
+    if not all(raw.get(ep) for ep in ENDPOINTS):
+        logger.warning("[WCRUtils] Incomplete API response, keeping cached data.")
+        return None
+    raw["faction_combinations"] = raw["faction_combinations"] or {}
+
+    version = payload_version(raw)
+    data = None
+    if cached and cached.get("version") == version:
+        logger.info(f"[WCRUtils] Data unchanged (version {version}).")
+    else:
+        data = build_wcr_data(raw)
+        data["version"] = version
+        logger.info(f"[WCRUtils] New data version {version}.")
+
+    if CACHE_TTL > 0:
+        write_cache(
+            {
+                "version": version,
+                "validators": new_validators,
+                "raw": raw,
+                "data": data if data is not None else cached["data"],
+            }
+        )
+    return data
+
+
+async def load_wcr_data(base_url: str | None = None) -> dict[str, Any]:
+    """Lädt alle benötigten WCR-Daten.
+
+    Ist ein Cache vorhanden, wird er unabhängig vom Alter sofort
+    zurückgegeben; die Revalidierung übernimmt der WCR-Cog im Hintergrund.
+    Nur ohne Cache (oder mit ``WCR_CACHE_TTL=0``) wird die API direkt
+    abgefragt.
+    """
+
+    if CACHE_TTL > 0:
+        cached = read_cache()
+        if cached and cached.get("data"):
+            age = cache_age() or 0.0
+            logger.info(f"[WCRUtils] Loaded data from cache (age {age:.0f}s).")
+            return cached["data"]
+
+    return await refresh_wcr_data(base_url, cached={}) or {}
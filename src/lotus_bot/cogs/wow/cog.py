@@ -29,6 +29,7 @@ from .data import (
     GearMilestoneEvent,
     ProfessionSkillEvent,
     RecipeLearningEvent,
+    RosterChange,
     RosterMember,
     WoWData,
     parse_roster_member,
@@ -367,6 +368,20 @@ class WoWCog(ManagedTaskCog):
             self.bot.add_view(ClaimReviewView(self))
             self.bot.add_view(WoWPanelLayoutView(self))
 
+    async def cog_load(self) -> None:
+        """Apply pending schema migrations once, before commands and loops run."""
+        await self.data.init_db()
+        self.data.add_roster_listener(self._on_roster_change)
+
+    def _on_roster_change(self, change: RosterChange) -> None:
+        """Refresh the hub stats line when member or ghost totals move.
+
+        The daily scan publishes the panel itself once it is done, so only
+        the hourly live refresh triggers a publish from here.
+        """
+        if change.counts_changed and not self._scan_lock.locked():
+            self._track_task(self._auto_publish_panel())
+
     async def _poll_loop(self) -> None:
         await self.bot.wait_until_ready()
         await self._auto_publish_panel()
@@ -3037,6 +3052,7 @@ class WoWCog(ManagedTaskCog):
 
     def cog_unload(self) -> None:
         super().cog_unload()
+        self.data.remove_roster_listener(self._on_roster_change)
         self.create_task(self.data.close())
 
 
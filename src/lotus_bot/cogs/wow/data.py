@@ -1,14 +1,265 @@
-import os
+import asyncio
+import copy
+import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterable
 
 import aiosqlite
 
 from lotus_bot.log_setup import get_logger
+from lotus_bot.utils.sqlite_pool import SQLitePool
 
 logger = get_logger(__name__)
 
+SchemaStep = str | Callable[[aiosqlite.Connection], Awaitable[None]]
+RosterListener = Callable[["RosterChange"], None]
+
+
+def add_column(table: str, column: str, definition: str) -> SchemaStep:
+    """Schema step adding ``column`` unless the table already has it."""
+
+    async def step(db: aiosqlite.Connection) -> None:
+        cur = await db.execute(f"PRAGMA table_info({table})")
+        if column not in {row[1] for row in await cur.fetchall()}:
+            await db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    return step
+
+
+# Frozen, idempotent base schema. Runs before ``MIGRATIONS`` whenever the
+# database is behind ``SCHEMA_VERSION`` (fresh installs and databases from
+# before the migration runner) and is skipped once it is up to date. Later
+# tables and columns are added as a new ``MIGRATIONS`` entry instead.
+BASE_SCHEMA: tuple[SchemaStep, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS settings (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS roster_snapshot (
+        character_key TEXT PRIMARY KEY,
+        character_id INTEGER,
+        name TEXT NOT NULL,
+        realm_slug TEXT NOT NULL,
+        level INTEGER NOT NULL,
+        class_id INTEGER,
+        race_id INTEGER,
+        faction TEXT,
+        guild_rank INTEGER,
+        is_ghost INTEGER NOT NULL DEFAULT 0,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    # Frozen day-over-day baseline for the daily digest diff. ``roster_snapshot``
+    # is now refreshed hourly (so freshly-joined chars become claimable within
+    # the hour), which would otherwise destroy the digest's "yesterday vs today"
+    # comparison. The digest reads this table instead; it is only rewritten by
+    # the daily scan. Same columns as ``roster_snapshot``.
+    """
+    CREATE TABLE IF NOT EXISTS roster_digest_baseline (
+        character_key TEXT PRIMARY KEY,
+        character_id INTEGER,
+        name TEXT NOT NULL,
+        realm_slug TEXT NOT NULL,
+        level INTEGER NOT NULL,
+        class_id INTEGER,
+        race_id INTEGER,
+        faction TEXT,
+        guild_rank INTEGER,
+        is_ghost INTEGER NOT NULL DEFAULT 0,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS milestone_events (
+        character_key TEXT NOT NULL,
+        level INTEGER NOT NULL,
+        announced_at TEXT NOT NULL,
+        PRIMARY KEY(character_key, level)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS death_events (
+        character_key TEXT PRIMARY KEY,
+        recorded_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS officer_note_events (
+        character_key TEXT PRIMARY KEY,
+        recorded_at TEXT NOT NULL
+    )
+    """,
+    # Tracks the first time we ever saw a character_key in any roster
+    # snapshot. INSERT OR IGNORE on each replace_snapshot — never
+    # overwritten, so chars who leave + rejoin keep their original date.
+    # Limitation: for chars present at first bot scan, this equals the
+    # bot-tracking-start date, not their actual guild-join date.
+    """
+    CREATE TABLE IF NOT EXISTS roster_first_seen (
+        character_key TEXT PRIMARY KEY,
+        first_seen_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS character_claims (
+        character_key TEXT PRIMARY KEY,
+        character_name TEXT NOT NULL,
+        realm_slug TEXT NOT NULL,
+        discord_user_id INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        claimed_at TEXT NOT NULL,
+        verified_at TEXT,
+        verified_by INTEGER,
+        review_message_id INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS character_professions (
+        character_key TEXT NOT NULL,
+        profession_id TEXT NOT NULL,
+        skill_level INTEGER NOT NULL,
+        specialization TEXT,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY(character_key, profession_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS character_known_recipes (
+        character_key TEXT NOT NULL,
+        spell_id TEXT NOT NULL,
+        profession_id TEXT NOT NULL,
+        learned_at TEXT NOT NULL,
+        PRIMARY KEY(character_key, spell_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS recipe_learning_events (
+        character_key TEXT NOT NULL,
+        spell_id TEXT NOT NULL,
+        profession_id TEXT NOT NULL,
+        rarity TEXT NOT NULL,
+        points INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        announced_at TEXT,
+        awarded_at TEXT,
+        PRIMARY KEY(character_key, spell_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS character_gear_snapshot (
+        character_key TEXT PRIMARY KEY,
+        average_item_level REAL NOT NULL,
+        item_count INTEGER NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS gear_milestone_events (
+        character_key TEXT NOT NULL,
+        threshold INTEGER NOT NULL,
+        average_item_level REAL NOT NULL,
+        points INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT NOT NULL,
+        announced_at TEXT,
+        awarded_at TEXT,
+        PRIMARY KEY(character_key, threshold)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS profession_skill_milestone_events (
+        character_key TEXT NOT NULL,
+        profession_id TEXT NOT NULL,
+        threshold INTEGER NOT NULL,
+        skill_level INTEGER NOT NULL,
+        points INTEGER NOT NULL,
+        created_at TEXT NOT NULL,
+        announced_at TEXT,
+        awarded_at TEXT,
+        PRIMARY KEY(character_key, profession_id, threshold)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS profession_cooldowns (
+        character_key TEXT NOT NULL,
+        cooldown_group TEXT NOT NULL,
+        last_spell_id TEXT NOT NULL,
+        last_spell_name TEXT NOT NULL,
+        used_at TEXT NOT NULL,
+        ready_at TEXT NOT NULL,
+        PRIMARY KEY(character_key, cooldown_group)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS bank_characters (
+        character_key TEXT PRIMARY KEY,
+        character_name TEXT NOT NULL,
+        added_by INTEGER NOT NULL,
+        added_at TEXT NOT NULL
+    )
+    """,
+    add_column("gear_milestone_events", "points", "INTEGER NOT NULL DEFAULT 0"),
+    add_column("gear_milestone_events", "awarded_at", "TEXT"),
+    add_column("roster_snapshot", "is_ghost", "INTEGER NOT NULL DEFAULT 0"),
+)
+
+# Versioned schema migrations. The entry at index ``i`` upgrades
+# ``PRAGMA user_version`` from ``i`` to ``i + 1`` (the comment number is the
+# resulting version); never edit an applied entry, append a new one.
+MIGRATIONS: tuple[tuple[SchemaStep, ...], ...] = (
+    # 1: secondary indexes for the hot lookup paths
+    (
+        "CREATE INDEX IF NOT EXISTS idx_roster_name "
+        "ON roster_snapshot(lower(name), is_ghost, character_id DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_roster_ghost "
+        "ON roster_snapshot(is_ghost) WHERE is_ghost = 1",
+        "CREATE INDEX IF NOT EXISTS idx_claims_name "
+        "ON character_claims(lower(character_name))",
+        "CREATE INDEX IF NOT EXISTS idx_claims_user "
+        "ON character_claims(discord_user_id, lower(character_name))",
+        "CREATE INDEX IF NOT EXISTS idx_claims_status "
+        "ON character_claims(status, lower(character_name))",
+        "CREATE INDEX IF NOT EXISTS idx_claims_review "
+        "ON character_claims(review_message_id) "
+        "WHERE review_message_id IS NOT NULL",
+        "CREATE INDEX IF NOT EXISTS idx_professions_skill "
+        "ON character_professions(profession_id, skill_level DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_cooldowns_ready "
+        "ON profession_cooldowns(ready_at)",
+    ),
+    # 2: drop the removed reputation tracking
+    (
+        "DROP TABLE IF EXISTS character_reputation_snapshot",
+        "DROP TABLE IF EXISTS reputation_events",
+    ),
+)
+SCHEMA_VERSION = len(MIGRATIONS)
+
+# Seed the digest baseline from the existing live snapshot while the baseline
+# is empty, e.g. on upgrade of a database that predates the baseline table.
+# Without this the first daily scan after deploy would diff against an empty
+# baseline and announce the entire guild as "new". Runs on every ``init_db``
+# and is a no-op on a fresh install or once the baseline holds rows.
+SEED_DIGEST_BASELINE = """
+    INSERT INTO roster_digest_baseline (
+        character_key, character_id, name, realm_slug, level, class_id,
+        race_id, faction, guild_rank, is_ghost, updated_at
+    )
+    SELECT character_key, character_id, name, realm_slug, level, class_id,
+           race_id, faction, guild_rank, is_ghost, updated_at
+      FROM roster_snapshot
+     WHERE NOT EXISTS (SELECT 1 FROM roster_digest_baseline)
+"""
+
+# Spalten für ``RosterMember`` in Tabellenreihenfolge
+ROSTER_COLUMNS = (
+    "character_key, character_id, name, realm_slug, level, class_id, "
+    "race_id, faction, guild_rank, is_ghost"
+)
+
 
 @dataclass
 class RosterMember:
@@ -127,280 +378,202 @@ class Cooldown:
     ready_at: str
 
 
+@dataclass(frozen=True)
+class RosterChange:
+    """Difference between two roster snapshots, passed to roster listeners."""
+
+    added: frozenset[str]
+    removed: frozenset[str]
+    updated: frozenset[str]
+    ghosts_changed: bool
+
+    @property
+    def keys(self) -> frozenset[str]:
+        return self.added | self.removed | self.updated
+
+    @property
+    def counts_changed(self) -> bool:
+        """Member or ghost totals moved (what the panel stats line shows)."""
+        return bool(self.added or self.removed or self.ghosts_changed)
+
+    def __bool__(self) -> bool:
+        return bool(self.keys)
+
+
+class RosterCache:
+    """Immutable in-memory view of ``roster_snapshot``.
+
+    Built once per write from the committed member list: by key, by
+    case-folded name (alive before ghosts, newest character first), the
+    sorted distinct names for autocomplete and the ghost partition.
+    """
+
+    def __init__(self, members: Iterable[RosterMember]):
+        self.members: dict[str, RosterMember] = {
+            member.character_key: member for member in members
+        }
+        self.by_name: dict[str, list[RosterMember]] = {}
+        for member in self.members.values():
+            self.by_name.setdefault(member.name.casefold(), []).append(member)
+        for entries in self.by_name.values():
+            # Gleiche Reihenfolge wie früher ``ORDER BY is_ghost, character_id DESC``
+            entries.sort(
+                key=lambda m: (
+                    m.is_ghost,
+                    m.character_id is None,
+                    -(m.character_id or 0),
+                )
+            )
+        self.names = sorted(
+            {member.name for member in self.members.values()}, key=str.casefold
+        )
+        self.sorted_members = sorted(
+            self.members.values(), key=lambda m: m.name.casefold()
+        )
+        self.ghosts = sorted(
+            (member for member in self.members.values() if member.is_ghost),
+            key=lambda m: (-m.level, m.name.casefold()),
+        )
+
+    def diff(self, other: "RosterCache") -> RosterChange:
+        """What changed from ``self`` to ``other``."""
+        before, after = self.members.keys(), other.members.keys()
+        updated = frozenset(
+            key for key in before & after if self.members[key] != other.members[key]
+        )
+        return RosterChange(
+            added=frozenset(after - before),
+            removed=frozenset(before - after),
+            updated=updated,
+            ghosts_changed={m.character_key for m in self.ghosts}
+            != {m.character_key for m in other.ghosts},
+        )
+
+
 class WoWData:
     """SQLite storage for WoW guild settings, snapshots, and milestones."""
 
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self.db: aiosqlite.Connection | None = None
+        self._pool = SQLitePool(db_path)
         self._init_done = False
+        self._init_lock = asyncio.Lock()
+        # Dauer des letzten ``init_db``-Laufs (Millisekunden)
+        self.init_ms = 0.0
+        # Roster im Speicher; wird beim ersten Lesen geladen, danach nur
+        # von ``replace_snapshot``/``refresh_live_snapshot`` ersetzt
+        self._roster_cache: RosterCache | None = None
+        self._roster_listeners: list[RosterListener] = []
 
     async def _get_db(self) -> aiosqlite.Connection:
-        if self.db is None:
-            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-            self.db = await aiosqlite.connect(self.db_path)
-            await self.db.execute("PRAGMA journal_mode=WAL")
-        return self.db
+        return await self._pool.writer()
 
     async def init_db(self) -> None:
+        """Bring the schema up to date; later calls only check a flag."""
         if self._init_done:
             return
-        db = await self._get_db()
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS roster_snapshot (
-                character_key TEXT PRIMARY KEY,
-                character_id INTEGER,
-                name TEXT NOT NULL,
-                realm_slug TEXT NOT NULL,
-                level INTEGER NOT NULL,
-                class_id INTEGER,
-                race_id INTEGER,
-                faction TEXT,
-                guild_rank INTEGER,
-                is_ghost INTEGER NOT NULL DEFAULT 0,
-                updated_at TEXT NOT NULL
-            )
-            """)
-        # Frozen day-over-day baseline for the daily digest diff. ``roster_snapshot``
-        # is now refreshed hourly (so freshly-joined chars become claimable within
-        # the hour), which would otherwise destroy the digest's "yesterday vs today"
-        # comparison. The digest reads this table instead; it is only rewritten by
-        # the daily scan. Same columns as ``roster_snapshot``.
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS roster_digest_baseline (
-                character_key TEXT PRIMARY KEY,
-                character_id INTEGER,
-                name TEXT NOT NULL,
-                realm_slug TEXT NOT NULL,
-                level INTEGER NOT NULL,
-                class_id INTEGER,
-                race_id INTEGER,
-                faction TEXT,
-                guild_rank INTEGER,
-                is_ghost INTEGER NOT NULL DEFAULT 0,
-                updated_at TEXT NOT NULL
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS milestone_events (
-                character_key TEXT NOT NULL,
-                level INTEGER NOT NULL,
-                announced_at TEXT NOT NULL,
-                PRIMARY KEY(character_key, level)
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS death_events (
-                character_key TEXT PRIMARY KEY,
-                recorded_at TEXT NOT NULL
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS officer_note_events (
-                character_key TEXT PRIMARY KEY,
-                recorded_at TEXT NOT NULL
-            )
-            """)
-        # Tracks the first time we ever saw a character_key in any roster
-        # snapshot. INSERT OR IGNORE on each replace_snapshot — never
-        # overwritten, so chars who leave + rejoin keep their original date.
-        # Limitation: for chars present at first bot scan, this equals the
-        # bot-tracking-start date, not their actual guild-join date.
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS roster_first_seen (
-                character_key TEXT PRIMARY KEY,
-                first_seen_at TEXT NOT NULL
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS character_claims (
-                character_key TEXT PRIMARY KEY,
-                character_name TEXT NOT NULL,
-                realm_slug TEXT NOT NULL,
-                discord_user_id INTEGER NOT NULL,
-                status TEXT NOT NULL,
-                claimed_at TEXT NOT NULL,
-                verified_at TEXT,
-                verified_by INTEGER,
-                review_message_id INTEGER
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS character_professions (
-                character_key TEXT NOT NULL,
-                profession_id TEXT NOT NULL,
-                skill_level INTEGER NOT NULL,
-                specialization TEXT,
-                updated_at TEXT NOT NULL,
-                PRIMARY KEY(character_key, profession_id)
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS character_known_recipes (
-                character_key TEXT NOT NULL,
-                spell_id TEXT NOT NULL,
-                profession_id TEXT NOT NULL,
-                learned_at TEXT NOT NULL,
-                PRIMARY KEY(character_key, spell_id)
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS recipe_learning_events (
-                character_key TEXT NOT NULL,
-                spell_id TEXT NOT NULL,
-                profession_id TEXT NOT NULL,
-                rarity TEXT NOT NULL,
-                points INTEGER NOT NULL,
-                created_at TEXT NOT NULL,
-                announced_at TEXT,
-                awarded_at TEXT,
-                PRIMARY KEY(character_key, spell_id)
-            )
-            """)
-        await db.execute("DROP TABLE IF EXISTS character_reputation_snapshot")
-        await db.execute("DROP TABLE IF EXISTS reputation_events")
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS character_gear_snapshot (
-                character_key TEXT PRIMARY KEY,
-                average_item_level REAL NOT NULL,
-                item_count INTEGER NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS gear_milestone_events (
-                character_key TEXT NOT NULL,
-                threshold INTEGER NOT NULL,
-                average_item_level REAL NOT NULL,
-                points INTEGER NOT NULL DEFAULT 0,
-                created_at TEXT NOT NULL,
-                announced_at TEXT,
-                awarded_at TEXT,
-                PRIMARY KEY(character_key, threshold)
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS profession_skill_milestone_events (
-                character_key TEXT NOT NULL,
-                profession_id TEXT NOT NULL,
-                threshold INTEGER NOT NULL,
-                skill_level INTEGER NOT NULL,
-                points INTEGER NOT NULL,
-                created_at TEXT NOT NULL,
-                announced_at TEXT,
-                awarded_at TEXT,
-                PRIMARY KEY(character_key, profession_id, threshold)
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS profession_cooldowns (
-                character_key TEXT NOT NULL,
-                cooldown_group TEXT NOT NULL,
-                last_spell_id TEXT NOT NULL,
-                last_spell_name TEXT NOT NULL,
-                used_at TEXT NOT NULL,
-                ready_at TEXT NOT NULL,
-                PRIMARY KEY(character_key, cooldown_group)
-            )
-            """)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS bank_characters (
-                character_key TEXT PRIMARY KEY,
-                character_name TEXT NOT NULL,
-                added_by INTEGER NOT NULL,
-                added_at TEXT NOT NULL
-            )
-            """)
-        await self._ensure_column(
-            "gear_milestone_events", "points", "INTEGER NOT NULL DEFAULT 0"
+        async with self._init_lock:
+            if self._init_done:
+                return
+            start = time.perf_counter()
+            async with self._pool.writing() as db:
+                await db.execute("BEGIN IMMEDIATE")
+                cur = await db.execute("PRAGMA user_version")
+                version = (await cur.fetchone())[0]
+                if version < SCHEMA_VERSION:
+                    for step in BASE_SCHEMA:
+                        await self._run_step(db, step)
+                    await self._migrate(db, version)
+                await db.execute(SEED_DIGEST_BASELINE)
+                await db.commit()
+            self.init_ms = (time.perf_counter() - start) * 1000
+            self._init_done = True
+        logger.info(
+            f"[WoWData] Schema v{SCHEMA_VERSION} ready in {self.init_ms:.1f} ms "
+            f"({SCHEMA_VERSION - version} migration(s) applied)."
         )
-        await self._ensure_column("gear_milestone_events", "awarded_at", "TEXT")
-        await self._ensure_column(
-            "roster_snapshot", "is_ghost", "INTEGER NOT NULL DEFAULT 0"
-        )
-        # Seed the digest baseline from the existing live snapshot exactly once,
-        # on upgrade of a database that predates the baseline table. Without this
-        # the first daily scan after deploy would diff against an empty baseline
-        # and announce the entire guild as "new". Skips on a fresh install (both
-        # tables empty) and never re-seeds once the baseline holds rows.
-        cur = await db.execute("SELECT COUNT(*) FROM roster_digest_baseline")
-        baseline_count = (await cur.fetchone())[0]
-        if baseline_count == 0:
-            await db.execute("""
-                INSERT INTO roster_digest_baseline (
-                    character_key, character_id, name, realm_slug, level, class_id,
-                    race_id, faction, guild_rank, is_ghost, updated_at
-                )
-                SELECT character_key, character_id, name, realm_slug, level, class_id,
-                       race_id, faction, guild_rank, is_ghost, updated_at
-                  FROM roster_snapshot
-                """)
-        await db.commit()
-        self._init_done = True
-        logger.info("[WoWData] SQLite database initialized.")
-
-    async def _ensure_column(self, table: str, column: str, definition: str) -> None:
-        db = await self._get_db()
-        cur = await db.execute(f"PRAGMA table_info({table})")
-        columns = {row[1] for row in await cur.fetchall()}
-        if column not in columns:
-            await db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    @staticmethod
+    async def _run_step(db: aiosqlite.Connection, step: SchemaStep) -> None:
+        if isinstance(step, str):
+            await db.execute(step)
+        else:
+            await step(db)
+
+    @classmethod
+    async def _migrate(cls, db: aiosqlite.Connection, version: int) -> None:
+        """Apply the ``MIGRATIONS`` entries after ``version``."""
+        for target, steps in enumerate(MIGRATIONS[version:], start=version + 1):
+            for step in steps:
+                await cls._run_step(db, step)
+            await db.execute(f"PRAGMA user_version = {target}")
+            logger.info(f"[WoWData] Schema migrated to version {target}.")
 
     async def close(self) -> None:
-        if self.db is not None:
-            await self.db.close()
-            self.db = None
-            self._init_done = False
+        await self._pool.close()
+        self._init_done = False
+        self._roster_cache = None
 
     async def get_setting(self, key: str) -> str | None:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        row = await cur.fetchone()
+        row = await self._pool.fetchone(
+            "SELECT value FROM settings WHERE key = ?", (key,)
+        )
         return row[0] if row else None
 
     async def set_setting(self, key: str, value: str) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            INSERT INTO settings(key, value) VALUES(?, ?)
-            ON CONFLICT(key) DO UPDATE SET value = excluded.value
-            """,
-            (key, value),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                INSERT INTO settings(key, value) VALUES(?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """,
+                (key, value),
+            )
+            await db.commit()
 
-    async def get_snapshot(self) -> dict[str, RosterMember]:
-        await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
-            SELECT character_key, character_id, name, realm_slug, level, class_id,
-                   race_id, faction, guild_rank, is_ghost
-              FROM roster_snapshot
-            """)
-        rows = await cur.fetchall()
-        return {
-            row[0]: RosterMember(
-                character_key=row[0],
-                character_id=row[1],
-                name=row[2],
-                realm_slug=row[3],
-                level=row[4],
-                class_id=row[5],
-                race_id=row[6],
-                faction=row[7] or "",
-                guild_rank=row[8],
-                is_ghost=bool(row[9]),
+    def add_roster_listener(self, listener: RosterListener) -> None:
+        """Call ``listener(change)`` after every roster write that changed rows."""
+        self._roster_listeners.append(listener)
+
+    def remove_roster_listener(self, listener: RosterListener) -> None:
+        if listener in self._roster_listeners:
+            self._roster_listeners.remove(listener)
+
+    def _emit_roster_change(self, change: RosterChange) -> None:
+        if not change:
+            return
+        for listener in list(self._roster_listeners):
+            try:
+                listener(change)
+            except Exception as exc:
+                logger.error("[WoWData] Roster listener failed: %s", exc, exc_info=True)
+
+    async def _load_roster(self, db: aiosqlite.Connection) -> RosterCache:
+        """Load the cache through the writer; callers hold ``writing()``."""
+        if self._roster_cache is None:
+            cur = await db.execute(f"SELECT {ROSTER_COLUMNS} FROM roster_snapshot")
+            self._roster_cache = RosterCache(
+                _roster_member_from_row(row) for row in await cur.fetchall()
             )
-            for row in rows
-        }
+        return self._roster_cache
+
+    async def _roster(self) -> RosterCache:
+        cache = self._roster_cache
+        if cache is not None:
+            return cache
+        await self.init_db()
+        async with self._pool.writing() as db:
+            return await self._load_roster(db)
+
+    async def get_snapshot(self) -> dict[str, RosterMember]:
+        roster = await self._roster()
+        return {key: copy.copy(member) for key, member in roster.members.items()}
+
+    async def roster_names(self) -> list[str]:
+        """Distinct roster names, case-insensitively sorted (autocomplete)."""
+        return list((await self._roster()).names)
 
     async def ghost_members(self) -> list[RosterMember]:
         """Return roster members currently flagged as dead/ghost.
@@ -408,31 +581,7 @@ class WoWData:
         Sorted by level descending then name. Officers can use this to
         clean up dead characters that are still in the guild roster.
         """
-        await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
-            SELECT character_key, character_id, name, realm_slug, level, class_id,
-                   race_id, faction, guild_rank, is_ghost
-              FROM roster_snapshot
-             WHERE is_ghost = 1
-             ORDER BY level DESC, lower(name)
-            """)
-        rows = await cur.fetchall()
-        return [
-            RosterMember(
-                character_key=row[0],
-                character_id=row[1],
-                name=row[2],
-                realm_slug=row[3],
-                level=row[4],
-                class_id=row[5],
-                race_id=row[6],
-                faction=row[7] or "",
-                guild_rank=row[8],
-                is_ghost=bool(row[9]),
-            )
-            for row in rows
-        ]
+        return [copy.copy(member) for member in (await self._roster()).ghosts]
 
     @staticmethod
     async def _write_roster_table(
@@ -489,12 +638,15 @@ class WoWData:
         the baseline untouched.
         """
         await self.init_db()
-        db = await self._get_db()
-        now = datetime.utcnow().isoformat()
-        await self._write_roster_table(db, "roster_snapshot", members, now)
-        await self._write_roster_table(db, "roster_digest_baseline", members, now)
-        await self._record_first_seen(db, members, now)
-        await db.commit()
+        async with self._pool.writing() as db:
+            previous = await self._load_roster(db)
+            now = datetime.utcnow().isoformat()
+            await self._write_roster_table(db, "roster_snapshot", members, now)
+            await self._write_roster_table(db, "roster_digest_baseline", members, now)
+            await self._record_first_seen(db, members, now)
+            await db.commit()
+            self._roster_cache = RosterCache(copy.copy(m) for m in members)
+        self._emit_roster_change(previous.diff(self._roster_cache))
 
     async def refresh_live_snapshot(self, members: list[RosterMember]) -> None:
         """Refresh only the live snapshot (hourly), preserving known ghost state.
@@ -506,126 +658,105 @@ class WoWData:
         touched here.
         """
         await self.init_db()
-        db = await self._get_db()
-        now = datetime.utcnow().isoformat()
-        cur = await db.execute(
-            "SELECT character_key FROM roster_snapshot WHERE is_ghost = 1"
-        )
-        known_ghosts = {row[0] for row in await cur.fetchall()}
-        for member in members:
-            if member.character_key in known_ghosts:
-                member.is_ghost = True
-        await self._write_roster_table(db, "roster_snapshot", members, now)
-        await self._record_first_seen(db, members, now)
-        await db.commit()
+        async with self._pool.writing() as db:
+            previous = await self._load_roster(db)
+            now = datetime.utcnow().isoformat()
+            for member in members:
+                known = previous.members.get(member.character_key)
+                if known is not None and known.is_ghost:
+                    member.is_ghost = True
+            await self._write_roster_table(db, "roster_snapshot", members, now)
+            await self._record_first_seen(db, members, now)
+            await db.commit()
+            self._roster_cache = RosterCache(copy.copy(m) for m in members)
+        self._emit_roster_change(previous.diff(self._roster_cache))
 
     async def get_digest_baseline(self) -> dict[str, RosterMember]:
         """Return the frozen day-over-day baseline used by the daily digest."""
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
-            SELECT character_key, character_id, name, realm_slug, level, class_id,
-                   race_id, faction, guild_rank, is_ghost
-              FROM roster_digest_baseline
-            """)
-        rows = await cur.fetchall()
-        return {
-            row[0]: RosterMember(
-                character_key=row[0],
-                character_id=row[1],
-                name=row[2],
-                realm_slug=row[3],
-                level=row[4],
-                class_id=row[5],
-                race_id=row[6],
-                faction=row[7] or "",
-                guild_rank=row[8],
-                is_ghost=bool(row[9]),
-            )
-            for row in rows
-        }
+        rows = await self._pool.fetchall(
+            f"SELECT {ROSTER_COLUMNS} FROM roster_digest_baseline"
+        )
+        return {row[0]: _roster_member_from_row(row) for row in rows}
 
     async def first_seen_at(self, character_key: str) -> str | None:
         """Return the ISO timestamp of when this character was first seen
         in any roster snapshot, or ``None`` if never recorded."""
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        row = await self._pool.fetchone(
             "SELECT first_seen_at FROM roster_first_seen WHERE character_key = ?",
             (character_key,),
         )
-        row = await cur.fetchone()
         return row[0] if row else None
 
     async def milestone_exists(self, character_key: str, level: int) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            "SELECT 1 FROM milestone_events WHERE character_key = ? AND level = ?",
-            (character_key, level),
+        return (
+            await self._pool.fetchone(
+                "SELECT 1 FROM milestone_events WHERE character_key = ? AND level = ?",
+                (character_key, level),
+            )
+            is not None
         )
-        return await cur.fetchone() is not None
 
     async def record_milestone(self, character_key: str, level: int) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            INSERT OR IGNORE INTO milestone_events(character_key, level, announced_at)
-            VALUES (?, ?, ?)
-            """,
-            (character_key, level, datetime.utcnow().isoformat()),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                INSERT OR IGNORE INTO milestone_events(character_key, level, announced_at)
+                VALUES (?, ?, ?)
+                """,
+                (character_key, level, datetime.utcnow().isoformat()),
+            )
+            await db.commit()
 
     async def death_exists(self, character_key: str) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            "SELECT 1 FROM death_events WHERE character_key = ?",
-            (character_key,),
+        return (
+            await self._pool.fetchone(
+                "SELECT 1 FROM death_events WHERE character_key = ?",
+                (character_key,),
+            )
+            is not None
         )
-        return await cur.fetchone() is not None
 
     async def record_death(self, character_key: str) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            INSERT OR IGNORE INTO death_events(character_key, recorded_at)
-            VALUES (?, ?)
-            """,
-            (character_key, datetime.utcnow().isoformat()),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                INSERT OR IGNORE INTO death_events(character_key, recorded_at)
+                VALUES (?, ?)
+                """,
+                (character_key, datetime.utcnow().isoformat()),
+            )
+            await db.commit()
 
     async def officer_note_exists(self, character_key: str) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            "SELECT 1 FROM officer_note_events WHERE character_key = ?",
-            (character_key,),
+        return (
+            await self._pool.fetchone(
+                "SELECT 1 FROM officer_note_events WHERE character_key = ?",
+                (character_key,),
+            )
+            is not None
         )
-        return await cur.fetchone() is not None
 
     async def record_officer_note(self, character_key: str) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            INSERT OR IGNORE INTO officer_note_events(character_key, recorded_at)
-            VALUES (?, ?)
-            """,
-            (character_key, datetime.utcnow().isoformat()),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                INSERT OR IGNORE INTO officer_note_events(character_key, recorded_at)
+                VALUES (?, ?)
+                """,
+                (character_key, datetime.utcnow().isoformat()),
+            )
+            await db.commit()
 
     async def member_count(self) -> int:
-        await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("SELECT COUNT(*) FROM roster_snapshot")
-        row = await cur.fetchone()
-        return row[0] if row else 0
+        return len((await self._roster()).members)
 
     async def last_scan_at(self) -> str | None:
         return await self.get_setting("last_scan_at")
@@ -637,72 +768,31 @@ class WoWData:
         """Lookup by name, preferring living characters over ghosts.
 
         After a HC death + reroll, both an old (ghost) and a new (alive)
-        character with the same name can sit in the snapshot. The
-        ``ORDER BY is_ghost ASC`` sorts the alive one to the top so
-        ``/wow whois`` and the claim flow always pick the active char.
+        character with the same name can sit in the snapshot. The name index
+        keeps the alive one first so ``/wow whois`` and the claim flow always
+        pick the active char.
         """
-        await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
-            SELECT character_key, character_id, name, realm_slug, level, class_id,
-                   race_id, faction, guild_rank, is_ghost
-              FROM roster_snapshot
-             WHERE lower(name) = lower(?)
-             ORDER BY is_ghost ASC, character_id DESC
-             LIMIT 1
-            """,
-            (name.strip(),),
-        )
-        row = await cur.fetchone()
-        if not row:
-            return None
-        return RosterMember(
-            character_key=row[0],
-            character_id=row[1],
-            name=row[2],
-            realm_slug=row[3],
-            level=row[4],
-            class_id=row[5],
-            race_id=row[6],
-            faction=row[7] or "",
-            guild_rank=row[8],
-            is_ghost=bool(row[9]),
-        )
+        matches = (await self._roster()).by_name.get(name.strip().casefold())
+        return copy.copy(matches[0]) if matches else None
 
     async def unclaimed_roster_members(self) -> list[RosterMember]:
         """Snapshot members without a claim, alphabetically sorted."""
-        await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
-            SELECT s.character_key, s.character_id, s.name, s.realm_slug, s.level,
-                   s.class_id, s.race_id, s.faction, s.guild_rank, s.is_ghost
-              FROM roster_snapshot s
-              LEFT JOIN character_claims c ON c.character_key = s.character_key
-             WHERE c.character_key IS NULL
-             ORDER BY lower(s.name)
-            """)
-        rows = await cur.fetchall()
-        return [
-            RosterMember(
-                character_key=row[0],
-                character_id=row[1],
-                name=row[2],
-                realm_slug=row[3],
-                level=row[4],
-                class_id=row[5],
-                race_id=row[6],
-                faction=row[7] or "",
-                guild_rank=row[8],
-                is_ghost=bool(row[9]),
+        roster = await self._roster()
+        claimed = {
+            row[0]
+            for row in await self._pool.fetchall(
+                "SELECT character_key FROM character_claims"
             )
-            for row in rows
+        }
+        return [
+            copy.copy(member)
+            for member in roster.sorted_members
+            if member.character_key not in claimed
         ]
 
     async def get_claim(self, character_key: str) -> CharacterClaim | None:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        row = await self._pool.fetchone(
             """
             SELECT character_key, character_name, realm_slug, discord_user_id, status,
                    claimed_at, verified_at, verified_by, review_message_id
@@ -711,7 +801,6 @@ class WoWData:
             """,
             (character_key,),
         )
-        row = await cur.fetchone()
         return _claim_from_row(row) if row else None
 
     async def get_claim_by_name(self, name: str) -> CharacterClaim | None:
@@ -724,8 +813,7 @@ class WoWData:
             2. fallback: most recently claimed
         """
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        row = await self._pool.fetchone(
             """
             SELECT c.character_key, c.character_name, c.realm_slug, c.discord_user_id,
                    c.status, c.claimed_at, c.verified_at, c.verified_by,
@@ -741,7 +829,6 @@ class WoWData:
             """,
             (name.strip(),),
         )
-        row = await cur.fetchone()
         return _claim_from_row(row) if row else None
 
     async def create_claim(
@@ -752,64 +839,63 @@ class WoWData:
         if existing:
             return existing, False
 
-        db = await self._get_db()
-        now = datetime.utcnow().isoformat()
-        await db.execute(
-            """
-            INSERT INTO character_claims(
-                character_key, character_name, realm_slug, discord_user_id, status,
-                claimed_at, verified_at, verified_by, review_message_id
-            ) VALUES (?, ?, ?, ?, ?, ?, NULL, NULL, NULL)
-            """,
-            (
-                member.character_key,
-                member.name,
-                member.realm_slug,
-                discord_user_id,
-                "unverified",
-                now,
-            ),
-        )
-        await db.commit()
-        claim = await self.get_claim(member.character_key)
-        if claim is None:  # pragma: no cover - defensive
-            raise RuntimeError("Claim creation failed")
-        return claim, True
+        async with self._pool.writing() as db:
+            now = datetime.utcnow().isoformat()
+            await db.execute(
+                """
+                INSERT INTO character_claims(
+                    character_key, character_name, realm_slug, discord_user_id, status,
+                    claimed_at, verified_at, verified_by, review_message_id
+                ) VALUES (?, ?, ?, ?, ?, ?, NULL, NULL, NULL)
+                """,
+                (
+                    member.character_key,
+                    member.name,
+                    member.realm_slug,
+                    discord_user_id,
+                    "unverified",
+                    now,
+                ),
+            )
+            await db.commit()
+            claim = await self.get_claim(member.character_key)
+            if claim is None:  # pragma: no cover - defensive
+                raise RuntimeError("Claim creation failed")
+            return claim, True
 
     async def set_claim_review_message(
         self, character_key: str, review_message_id: int
     ) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            UPDATE character_claims
-               SET review_message_id = ?
-             WHERE character_key = ?
-            """,
-            (review_message_id, character_key),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                UPDATE character_claims
+                   SET review_message_id = ?
+                 WHERE character_key = ?
+                """,
+                (review_message_id, character_key),
+            )
+            await db.commit()
 
     async def verify_claim(self, character_key: str, reviewer_id: int) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            UPDATE character_claims
-               SET status = 'verified', verified_at = ?, verified_by = ?
-             WHERE character_key = ?
-            """,
-            (datetime.utcnow().isoformat(), reviewer_id, character_key),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                UPDATE character_claims
+                   SET status = 'verified', verified_at = ?, verified_by = ?
+                 WHERE character_key = ?
+                """,
+                (datetime.utcnow().isoformat(), reviewer_id, character_key),
+            )
+            await db.commit()
 
     async def get_claim_by_review_message(
         self, review_message_id: int
     ) -> CharacterClaim | None:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        row = await self._pool.fetchone(
             """
             SELECT character_key, character_name, realm_slug, discord_user_id, status,
                    claimed_at, verified_at, verified_by, review_message_id
@@ -818,17 +904,16 @@ class WoWData:
             """,
             (review_message_id,),
         )
-        row = await cur.fetchone()
         return _claim_from_row(row) if row else None
 
     async def remove_claim(self, character_key: str) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            "DELETE FROM character_claims WHERE character_key = ?",
-            (character_key,),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                "DELETE FROM character_claims WHERE character_key = ?",
+                (character_key,),
+            )
+            await db.commit()
 
     async def release_claim(self, character_key: str, discord_user_id: int) -> bool:
         claim = await self.get_claim(character_key)
@@ -839,8 +924,7 @@ class WoWData:
 
     async def claims_for_user(self, discord_user_id: int) -> list[CharacterClaim]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT character_key, character_name, realm_slug, discord_user_id, status,
                    claimed_at, verified_at, verified_by, review_message_id
@@ -850,12 +934,10 @@ class WoWData:
             """,
             (discord_user_id,),
         )
-        rows = await cur.fetchall()
         return [_claim_from_row(row) for row in rows]
 
     async def list_claims(self, status: str = "all") -> list[CharacterClaim]:
         await self.init_db()
-        db = await self._get_db()
         query = """
             SELECT character_key, character_name, realm_slug, discord_user_id, status,
                    claimed_at, verified_at, verified_by, review_message_id
@@ -866,8 +948,7 @@ class WoWData:
             query += " WHERE status = ?"
             params = (status,)
         query += " ORDER BY lower(character_name)"
-        cur = await db.execute(query, params)
-        rows = await cur.fetchall()
+        rows = await self._pool.fetchall(query, params)
         return [_claim_from_row(row) for row in rows]
 
     async def role_eligible_user_ids(self) -> set[int]:
@@ -881,51 +962,52 @@ class WoWData:
         automatically. Unverified (pending-review) claims never count.
         """
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
+        rows = await self._pool.fetchall("""
             SELECT DISTINCT c.discord_user_id
               FROM character_claims c
               JOIN roster_snapshot rs ON rs.character_key = c.character_key
              WHERE c.status = 'verified' AND rs.is_ghost = 0
             """)
-        rows = await cur.fetchall()
         return {int(row[0]) for row in rows}
 
     async def add_bank_character(
         self, character_key: str, character_name: str, added_by: int
     ) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            INSERT INTO bank_characters (character_key, character_name, added_by, added_at)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(character_key) DO UPDATE SET
-                character_name = excluded.character_name
-            """,
-            (character_key, character_name, added_by, datetime.utcnow().isoformat()),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                INSERT INTO bank_characters (character_key, character_name, added_by, added_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(character_key) DO UPDATE SET
+                    character_name = excluded.character_name
+                """,
+                (
+                    character_key,
+                    character_name,
+                    added_by,
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+            await db.commit()
 
     async def remove_bank_character(self, character_key: str) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            "DELETE FROM bank_characters WHERE character_key = ?",
-            (character_key,),
-        )
-        await db.commit()
-        return cur.rowcount > 0
+        async with self._pool.writing() as db:
+            cur = await db.execute(
+                "DELETE FROM bank_characters WHERE character_key = ?",
+                (character_key,),
+            )
+            await db.commit()
+            return cur.rowcount > 0
 
     async def list_bank_characters(self) -> list[BankCharacter]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
+        rows = await self._pool.fetchall("""
             SELECT character_key, character_name, added_by, added_at
               FROM bank_characters
              ORDER BY lower(character_name)
             """)
-        rows = await cur.fetchall()
         return [
             BankCharacter(
                 character_key=row[0],
@@ -938,12 +1020,13 @@ class WoWData:
 
     async def is_bank_character(self, character_key: str) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            "SELECT 1 FROM bank_characters WHERE character_key = ?",
-            (character_key,),
+        return (
+            await self._pool.fetchone(
+                "SELECT 1 FROM bank_characters WHERE character_key = ?",
+                (character_key,),
+            )
+            is not None
         )
-        return await cur.fetchone() is not None
 
     async def set_character_profession(
         self,
@@ -955,46 +1038,45 @@ class WoWData:
         if skill_level < 1 or skill_level > 300:
             raise ValueError("skill_level must be between 1 and 300")
         await self.init_db()
-        db = await self._get_db()
-        now = datetime.utcnow().isoformat()
-        cleaned_specialization = (
-            specialization.strip()
-            if specialization and specialization.strip()
-            else None
-        )
-        await db.execute(
-            """
-            INSERT INTO character_professions(
-                character_key, profession_id, skill_level, specialization, updated_at
-            ) VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(character_key, profession_id)
-            DO UPDATE SET
-                skill_level = excluded.skill_level,
-                specialization = excluded.specialization,
-                updated_at = excluded.updated_at
-            """,
-            (
-                claim.character_key,
-                profession_id,
-                skill_level,
-                cleaned_specialization,
-                now,
-            ),
-        )
-        await db.commit()
-        profession = await self.get_character_profession(
-            claim.character_key, profession_id
-        )
-        if profession is None:  # pragma: no cover - defensive
-            raise RuntimeError("Profession update failed")
-        return profession
+        async with self._pool.writing() as db:
+            now = datetime.utcnow().isoformat()
+            cleaned_specialization = (
+                specialization.strip()
+                if specialization and specialization.strip()
+                else None
+            )
+            await db.execute(
+                """
+                INSERT INTO character_professions(
+                    character_key, profession_id, skill_level, specialization, updated_at
+                ) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(character_key, profession_id)
+                DO UPDATE SET
+                    skill_level = excluded.skill_level,
+                    specialization = excluded.specialization,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    claim.character_key,
+                    profession_id,
+                    skill_level,
+                    cleaned_specialization,
+                    now,
+                ),
+            )
+            await db.commit()
+            profession = await self.get_character_profession(
+                claim.character_key, profession_id
+            )
+            if profession is None:  # pragma: no cover - defensive
+                raise RuntimeError("Profession update failed")
+            return profession
 
     async def get_character_profession(
         self, character_key: str, profession_id: str
     ) -> CharacterProfession | None:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        row = await self._pool.fetchone(
             """
             SELECT c.character_key, c.character_name, c.realm_slug, c.discord_user_id,
                    p.profession_id, p.skill_level, p.specialization, p.updated_at
@@ -1004,30 +1086,28 @@ class WoWData:
             """,
             (character_key, profession_id),
         )
-        row = await cur.fetchone()
         return _profession_from_row(row) if row else None
 
     async def remove_character_profession(
         self, character_key: str, profession_id: str
     ) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
-            DELETE FROM character_professions
-             WHERE character_key = ? AND profession_id = ?
-            """,
-            (character_key, profession_id),
-        )
-        await db.commit()
-        return cur.rowcount > 0
+        async with self._pool.writing() as db:
+            cur = await db.execute(
+                """
+                DELETE FROM character_professions
+                 WHERE character_key = ? AND profession_id = ?
+                """,
+                (character_key, profession_id),
+            )
+            await db.commit()
+            return cur.rowcount > 0
 
     async def professions_for_user(
         self, discord_user_id: int
     ) -> list[CharacterProfession]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT c.character_key, c.character_name, c.realm_slug, c.discord_user_id,
                    p.profession_id, p.skill_level, p.specialization, p.updated_at
@@ -1038,14 +1118,12 @@ class WoWData:
             """,
             (discord_user_id,),
         )
-        rows = await cur.fetchall()
         return [_profession_from_row(row) for row in rows]
 
     async def list_professions(
         self, profession_id: str | None = None
     ) -> list[CharacterProfession]:
         await self.init_db()
-        db = await self._get_db()
         query = """
             SELECT c.character_key, c.character_name, c.realm_slug, c.discord_user_id,
                    p.profession_id, p.skill_level, p.specialization, p.updated_at
@@ -1059,16 +1137,14 @@ class WoWData:
         query += (
             " ORDER BY p.profession_id, p.skill_level DESC, lower(c.character_name)"
         )
-        cur = await db.execute(query, params)
-        rows = await cur.fetchall()
+        rows = await self._pool.fetchall(query, params)
         return [_profession_from_row(row) for row in rows]
 
     async def professions_for_character(
         self, character_key: str
     ) -> list[CharacterProfession]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT c.character_key, c.character_name, c.realm_slug, c.discord_user_id,
                    p.profession_id, p.skill_level, p.specialization, p.updated_at
@@ -1079,7 +1155,6 @@ class WoWData:
             """,
             (character_key,),
         )
-        rows = await cur.fetchall()
         return [_profession_from_row(row) for row in rows]
 
     async def find_crafters(
@@ -1093,8 +1168,7 @@ class WoWData:
         ``character_key`` so a reroll with the same name starts fresh.
         """
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT c.character_key, c.character_name, c.realm_slug, c.discord_user_id,
                    p.profession_id, p.skill_level, p.specialization, p.updated_at
@@ -1109,7 +1183,6 @@ class WoWData:
             """,
             (profession_id, minimum_skill),
         )
-        rows = await cur.fetchall()
         return [_profession_from_row(row) for row in rows]
 
     async def add_known_recipes(
@@ -1133,22 +1206,22 @@ class WoWData:
         if not spell_ids:
             return []
         await self.init_db()
-        db = await self._get_db()
-        now = datetime.utcnow().isoformat()
-        inserted: list[str] = []
-        for spell_id in spell_ids:
-            cur = await db.execute(
-                """
-                INSERT OR IGNORE INTO character_known_recipes(
-                    character_key, spell_id, profession_id, learned_at
-                ) VALUES (?, ?, ?, ?)
-                """,
-                (character_key, spell_id, profession_id, now),
-            )
-            if cur.rowcount > 0:
-                inserted.append(spell_id)
-        await db.commit()
-        return inserted
+        async with self._pool.writing() as db:
+            now = datetime.utcnow().isoformat()
+            inserted: list[str] = []
+            for spell_id in spell_ids:
+                cur = await db.execute(
+                    """
+                    INSERT OR IGNORE INTO character_known_recipes(
+                        character_key, spell_id, profession_id, learned_at
+                    ) VALUES (?, ?, ?, ?)
+                    """,
+                    (character_key, spell_id, profession_id, now),
+                )
+                if cur.rowcount > 0:
+                    inserted.append(spell_id)
+            await db.commit()
+            return inserted
 
     async def record_recipe_learning_event(
         self,
@@ -1159,29 +1232,28 @@ class WoWData:
         points: int,
     ) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
-            INSERT OR IGNORE INTO recipe_learning_events(
-                character_key, spell_id, profession_id, rarity, points, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                character_key,
-                spell_id,
-                profession_id,
-                rarity,
-                points,
-                datetime.utcnow().isoformat(),
-            ),
-        )
-        await db.commit()
-        return cur.rowcount > 0
+        async with self._pool.writing() as db:
+            cur = await db.execute(
+                """
+                INSERT OR IGNORE INTO recipe_learning_events(
+                    character_key, spell_id, profession_id, rarity, points, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    character_key,
+                    spell_id,
+                    profession_id,
+                    rarity,
+                    points,
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+            await db.commit()
+            return cur.rowcount > 0
 
     async def pending_recipe_learning_events(self) -> list[RecipeLearningEvent]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
+        rows = await self._pool.fetchall("""
             SELECT c.character_key, c.character_name, c.realm_slug, c.discord_user_id,
                    e.spell_id, e.profession_id, e.rarity, e.points, e.created_at
               FROM recipe_learning_events e
@@ -1189,7 +1261,6 @@ class WoWData:
              WHERE e.announced_at IS NULL
              ORDER BY e.points DESC, e.created_at, lower(c.character_name)
             """)
-        rows = await cur.fetchall()
         return [_recipe_event_from_row(row) for row in rows]
 
     async def pending_award_retries_recipe_learning(
@@ -1201,8 +1272,7 @@ class WoWData:
         cost a user their points permanently.
         """
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
+        rows = await self._pool.fetchall("""
             SELECT c.character_key, c.character_name, c.realm_slug, c.discord_user_id,
                    e.spell_id, e.profession_id, e.rarity, e.points, e.created_at
               FROM recipe_learning_events e
@@ -1212,40 +1282,39 @@ class WoWData:
                AND e.points > 0
              ORDER BY e.created_at
             """)
-        rows = await cur.fetchall()
         return [_recipe_event_from_row(row) for row in rows]
 
     async def mark_recipe_learning_announced(
         self, character_key: str, spell_id: str
     ) -> None:
         await self.init_db()
-        db = await self._get_db()
-        now = datetime.utcnow().isoformat()
-        await db.execute(
-            """
-            UPDATE recipe_learning_events
-               SET announced_at = COALESCE(announced_at, ?)
-             WHERE character_key = ? AND spell_id = ?
-            """,
-            (now, character_key, spell_id),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            now = datetime.utcnow().isoformat()
+            await db.execute(
+                """
+                UPDATE recipe_learning_events
+                   SET announced_at = COALESCE(announced_at, ?)
+                 WHERE character_key = ? AND spell_id = ?
+                """,
+                (now, character_key, spell_id),
+            )
+            await db.commit()
 
     async def mark_recipe_learning_awarded(
         self, character_key: str, spell_id: str
     ) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
-            UPDATE recipe_learning_events
-               SET awarded_at = ?
-             WHERE character_key = ? AND spell_id = ? AND awarded_at IS NULL
-            """,
-            (datetime.utcnow().isoformat(), character_key, spell_id),
-        )
-        await db.commit()
-        return cur.rowcount > 0
+        async with self._pool.writing() as db:
+            cur = await db.execute(
+                """
+                UPDATE recipe_learning_events
+                   SET awarded_at = ?
+                 WHERE character_key = ? AND spell_id = ? AND awarded_at IS NULL
+                """,
+                (datetime.utcnow().isoformat(), character_key, spell_id),
+            )
+            await db.commit()
+            return cur.rowcount > 0
 
     async def unmark_recipe_learning_awarded(
         self, character_key: str, spell_id: str
@@ -1257,21 +1326,20 @@ class WoWData:
         on failure so the next scan's retry loop picks the row up again.
         """
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            UPDATE recipe_learning_events
-               SET awarded_at = NULL
-             WHERE character_key = ? AND spell_id = ?
-            """,
-            (character_key, spell_id),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                UPDATE recipe_learning_events
+                   SET awarded_at = NULL
+                 WHERE character_key = ? AND spell_id = ?
+                """,
+                (character_key, spell_id),
+            )
+            await db.commit()
 
     async def gear_snapshot(self, character_key: str) -> CharacterGearSnapshot | None:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        row = await self._pool.fetchone(
             """
             SELECT character_key, average_item_level, item_count, updated_at
               FROM character_gear_snapshot
@@ -1279,45 +1347,45 @@ class WoWData:
             """,
             (character_key,),
         )
-        row = await cur.fetchone()
         return _gear_snapshot_from_row(row) if row else None
 
     async def set_gear_snapshot(
         self, character_key: str, average_item_level: float, item_count: int
     ) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            INSERT INTO character_gear_snapshot(
-                character_key, average_item_level, item_count, updated_at
-            ) VALUES (?, ?, ?, ?)
-            ON CONFLICT(character_key)
-            DO UPDATE SET
-                average_item_level = excluded.average_item_level,
-                item_count = excluded.item_count,
-                updated_at = excluded.updated_at
-            """,
-            (
-                character_key,
-                float(average_item_level),
-                int(item_count),
-                datetime.utcnow().isoformat(),
-            ),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                INSERT INTO character_gear_snapshot(
+                    character_key, average_item_level, item_count, updated_at
+                ) VALUES (?, ?, ?, ?)
+                ON CONFLICT(character_key)
+                DO UPDATE SET
+                    average_item_level = excluded.average_item_level,
+                    item_count = excluded.item_count,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    character_key,
+                    float(average_item_level),
+                    int(item_count),
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+            await db.commit()
 
     async def gear_milestone_exists(self, character_key: str, threshold: int) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
+        return (
+            await self._pool.fetchone(
+                """
             SELECT 1 FROM gear_milestone_events
              WHERE character_key = ? AND threshold = ?
             """,
-            (character_key, threshold),
+                (character_key, threshold),
+            )
+            is not None
         )
-        return await cur.fetchone() is not None
 
     async def record_gear_milestone(
         self,
@@ -1327,28 +1395,27 @@ class WoWData:
         points: int,
     ) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
-            INSERT OR IGNORE INTO gear_milestone_events(
-                character_key, threshold, average_item_level, points, created_at
-            ) VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                character_key,
-                int(threshold),
-                float(average_item_level),
-                int(points),
-                datetime.utcnow().isoformat(),
-            ),
-        )
-        await db.commit()
-        return cur.rowcount > 0
+        async with self._pool.writing() as db:
+            cur = await db.execute(
+                """
+                INSERT OR IGNORE INTO gear_milestone_events(
+                    character_key, threshold, average_item_level, points, created_at
+                ) VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    character_key,
+                    int(threshold),
+                    float(average_item_level),
+                    int(points),
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+            await db.commit()
+            return cur.rowcount > 0
 
     async def pending_gear_milestone_events(self) -> list[GearMilestoneEvent]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
+        rows = await self._pool.fetchall("""
             SELECT e.character_key,
                    COALESCE(c.character_name, s.name, e.character_key),
                    COALESCE(c.realm_slug, s.realm_slug, ''),
@@ -1363,7 +1430,6 @@ class WoWData:
              WHERE e.announced_at IS NULL
              ORDER BY e.threshold DESC, e.created_at
             """)
-        rows = await cur.fetchall()
         return [_gear_event_from_row(row) for row in rows]
 
     async def pending_award_retries_gear_milestone(
@@ -1371,8 +1437,7 @@ class WoWData:
     ) -> list[GearMilestoneEvent]:
         """Gear-milestone events that were announced but never awarded."""
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
+        rows = await self._pool.fetchall("""
             SELECT e.character_key,
                    COALESCE(c.character_name, s.name, e.character_key),
                    COALESCE(c.realm_slug, s.realm_slug, ''),
@@ -1390,57 +1455,56 @@ class WoWData:
                AND c.discord_user_id IS NOT NULL
              ORDER BY e.created_at
             """)
-        rows = await cur.fetchall()
         return [_gear_event_from_row(row) for row in rows]
 
     async def mark_gear_milestone_announced(
         self, character_key: str, threshold: int
     ) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            UPDATE gear_milestone_events
-               SET announced_at = COALESCE(announced_at, ?)
-             WHERE character_key = ? AND threshold = ?
-            """,
-            (datetime.utcnow().isoformat(), character_key, threshold),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                UPDATE gear_milestone_events
+                   SET announced_at = COALESCE(announced_at, ?)
+                 WHERE character_key = ? AND threshold = ?
+                """,
+                (datetime.utcnow().isoformat(), character_key, threshold),
+            )
+            await db.commit()
 
     async def mark_gear_milestone_awarded(
         self, character_key: str, threshold: int
     ) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
-            UPDATE gear_milestone_events
-               SET awarded_at = ?
-             WHERE character_key = ?
-               AND threshold = ?
-               AND awarded_at IS NULL
-            """,
-            (datetime.utcnow().isoformat(), character_key, threshold),
-        )
-        await db.commit()
-        return cur.rowcount > 0
+        async with self._pool.writing() as db:
+            cur = await db.execute(
+                """
+                UPDATE gear_milestone_events
+                   SET awarded_at = ?
+                 WHERE character_key = ?
+                   AND threshold = ?
+                   AND awarded_at IS NULL
+                """,
+                (datetime.utcnow().isoformat(), character_key, threshold),
+            )
+            await db.commit()
+            return cur.rowcount > 0
 
     async def unmark_gear_milestone_awarded(
         self, character_key: str, threshold: int
     ) -> None:
         """Roll back awarded_at so a failed ChampionCog call can be retried."""
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            UPDATE gear_milestone_events
-               SET awarded_at = NULL
-             WHERE character_key = ? AND threshold = ?
-            """,
-            (character_key, threshold),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                UPDATE gear_milestone_events
+                   SET awarded_at = NULL
+                 WHERE character_key = ? AND threshold = ?
+                """,
+                (character_key, threshold),
+            )
+            await db.commit()
 
     # ---- profession-skill milestones ----
 
@@ -1448,15 +1512,16 @@ class WoWData:
         self, character_key: str, profession_id: str, threshold: int
     ) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
+        return (
+            await self._pool.fetchone(
+                """
             SELECT 1 FROM profession_skill_milestone_events
              WHERE character_key = ? AND profession_id = ? AND threshold = ?
             """,
-            (character_key, profession_id, int(threshold)),
+                (character_key, profession_id, int(threshold)),
+            )
+            is not None
         )
-        return await cur.fetchone() is not None
 
     async def record_skill_milestone(
         self,
@@ -1467,29 +1532,28 @@ class WoWData:
         points: int,
     ) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
-            INSERT OR IGNORE INTO profession_skill_milestone_events(
-                character_key, profession_id, threshold, skill_level, points, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                character_key,
-                profession_id,
-                int(threshold),
-                int(skill_level),
-                int(points),
-                datetime.utcnow().isoformat(),
-            ),
-        )
-        await db.commit()
-        return cur.rowcount > 0
+        async with self._pool.writing() as db:
+            cur = await db.execute(
+                """
+                INSERT OR IGNORE INTO profession_skill_milestone_events(
+                    character_key, profession_id, threshold, skill_level, points, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    character_key,
+                    profession_id,
+                    int(threshold),
+                    int(skill_level),
+                    int(points),
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+            await db.commit()
+            return cur.rowcount > 0
 
     async def pending_skill_milestone_events(self) -> list[ProfessionSkillEvent]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
+        rows = await self._pool.fetchall("""
             SELECT e.character_key,
                    COALESCE(c.character_name, s.name, e.character_key),
                    COALESCE(c.realm_slug, s.realm_slug, ''),
@@ -1505,7 +1569,6 @@ class WoWData:
              WHERE e.announced_at IS NULL
              ORDER BY e.threshold DESC, e.created_at
             """)
-        rows = await cur.fetchall()
         return [_skill_event_from_row(row) for row in rows]
 
     async def pending_award_retries_skill_milestone(
@@ -1513,8 +1576,7 @@ class WoWData:
     ) -> list[ProfessionSkillEvent]:
         """Skill-milestone events that were announced but never awarded."""
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute("""
+        rows = await self._pool.fetchall("""
             SELECT e.character_key,
                    COALESCE(c.character_name, s.name, e.character_key),
                    COALESCE(c.realm_slug, s.realm_slug, ''),
@@ -1533,70 +1595,69 @@ class WoWData:
                AND c.discord_user_id IS NOT NULL
              ORDER BY e.created_at
             """)
-        rows = await cur.fetchall()
         return [_skill_event_from_row(row) for row in rows]
 
     async def mark_skill_milestone_announced(
         self, character_key: str, profession_id: str, threshold: int
     ) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            UPDATE profession_skill_milestone_events
-               SET announced_at = COALESCE(announced_at, ?)
-             WHERE character_key = ? AND profession_id = ? AND threshold = ?
-            """,
-            (
-                datetime.utcnow().isoformat(),
-                character_key,
-                profession_id,
-                int(threshold),
-            ),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                UPDATE profession_skill_milestone_events
+                   SET announced_at = COALESCE(announced_at, ?)
+                 WHERE character_key = ? AND profession_id = ? AND threshold = ?
+                """,
+                (
+                    datetime.utcnow().isoformat(),
+                    character_key,
+                    profession_id,
+                    int(threshold),
+                ),
+            )
+            await db.commit()
 
     async def mark_skill_milestone_awarded(
         self, character_key: str, profession_id: str, threshold: int
     ) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
-            UPDATE profession_skill_milestone_events
-               SET awarded_at = ?
-             WHERE character_key = ?
-               AND profession_id = ?
-               AND threshold = ?
-               AND awarded_at IS NULL
-            """,
-            (
-                datetime.utcnow().isoformat(),
-                character_key,
-                profession_id,
-                int(threshold),
-            ),
-        )
-        await db.commit()
-        return cur.rowcount > 0
+        async with self._pool.writing() as db:
+            cur = await db.execute(
+                """
+                UPDATE profession_skill_milestone_events
+                   SET awarded_at = ?
+                 WHERE character_key = ?
+                   AND profession_id = ?
+                   AND threshold = ?
+                   AND awarded_at IS NULL
+                """,
+                (
+                    datetime.utcnow().isoformat(),
+                    character_key,
+                    profession_id,
+                    int(threshold),
+                ),
+            )
+            await db.commit()
+            return cur.rowcount > 0
 
     async def unmark_skill_milestone_awarded(
         self, character_key: str, profession_id: str, threshold: int
     ) -> None:
         """Roll back awarded_at so a failed ChampionCog call can be retried."""
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            UPDATE profession_skill_milestone_events
-               SET awarded_at = NULL
-             WHERE character_key = ?
-               AND profession_id = ?
-               AND threshold = ?
-            """,
-            (character_key, profession_id, int(threshold)),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                UPDATE profession_skill_milestone_events
+                   SET awarded_at = NULL
+                 WHERE character_key = ?
+                   AND profession_id = ?
+                   AND threshold = ?
+                """,
+                (character_key, profession_id, int(threshold)),
+            )
+            await db.commit()
 
     # ---- profession cooldowns ----
 
@@ -1610,35 +1671,34 @@ class WoWData:
         ready_at: str,
     ) -> None:
         await self.init_db()
-        db = await self._get_db()
-        await db.execute(
-            """
-            INSERT INTO profession_cooldowns(
-                character_key, cooldown_group, last_spell_id, last_spell_name,
-                used_at, ready_at
-            ) VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(character_key, cooldown_group)
-            DO UPDATE SET
-                last_spell_id = excluded.last_spell_id,
-                last_spell_name = excluded.last_spell_name,
-                used_at = excluded.used_at,
-                ready_at = excluded.ready_at
-            """,
-            (
-                character_key,
-                cooldown_group,
-                last_spell_id,
-                last_spell_name,
-                used_at,
-                ready_at,
-            ),
-        )
-        await db.commit()
+        async with self._pool.writing() as db:
+            await db.execute(
+                """
+                INSERT INTO profession_cooldowns(
+                    character_key, cooldown_group, last_spell_id, last_spell_name,
+                    used_at, ready_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(character_key, cooldown_group)
+                DO UPDATE SET
+                    last_spell_id = excluded.last_spell_id,
+                    last_spell_name = excluded.last_spell_name,
+                    used_at = excluded.used_at,
+                    ready_at = excluded.ready_at
+                """,
+                (
+                    character_key,
+                    cooldown_group,
+                    last_spell_id,
+                    last_spell_name,
+                    used_at,
+                    ready_at,
+                ),
+            )
+            await db.commit()
 
     async def cooldowns_for_character(self, character_key: str) -> list[Cooldown]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT cd.character_key,
                    COALESCE(c.character_name, s.name, cd.character_key),
@@ -1657,13 +1717,11 @@ class WoWData:
             """,
             (character_key,),
         )
-        rows = await cur.fetchall()
         return [_cooldown_from_row(row) for row in rows]
 
     async def cooldowns_for_user(self, discord_user_id: int) -> list[Cooldown]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT cd.character_key,
                    c.character_name,
@@ -1681,15 +1739,13 @@ class WoWData:
             """,
             (int(discord_user_id),),
         )
-        rows = await cur.fetchall()
         return [_cooldown_from_row(row) for row in rows]
 
     async def cooldowns_ready_in_window(
         self, start_iso: str, end_iso: str
     ) -> list[Cooldown]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT cd.character_key,
                    COALESCE(c.character_name, s.name, cd.character_key),
@@ -1708,37 +1764,33 @@ class WoWData:
             """,
             (start_iso, end_iso),
         )
-        rows = await cur.fetchall()
         return [_cooldown_from_row(row) for row in rows]
 
     async def active_cooldown_count(self) -> int:
         """Count cooldowns that are still running (ready_at in the future)."""
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        row = await self._pool.fetchone(
             "SELECT COUNT(*) FROM profession_cooldowns WHERE ready_at > ?",
             (datetime.utcnow().isoformat(),),
         )
-        row = await cur.fetchone()
         return int(row[0]) if row else 0
 
     async def remove_known_recipe(self, character_key: str, spell_id: str) -> bool:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
-            """
-            DELETE FROM character_known_recipes
-             WHERE character_key = ? AND spell_id = ?
-            """,
-            (character_key, spell_id),
-        )
-        await db.commit()
-        return cur.rowcount > 0
+        async with self._pool.writing() as db:
+            cur = await db.execute(
+                """
+                DELETE FROM character_known_recipes
+                 WHERE character_key = ? AND spell_id = ?
+                """,
+                (character_key, spell_id),
+            )
+            await db.commit()
+            return cur.rowcount > 0
 
     async def known_recipe_spell_ids(self, character_key: str) -> set[str]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT spell_id
               FROM character_known_recipes
@@ -1746,15 +1798,13 @@ class WoWData:
             """,
             (character_key,),
         )
-        rows = await cur.fetchall()
         return {str(row[0]) for row in rows}
 
     async def known_recipes_for_character(
         self, character_key: str
     ) -> list[CharacterKnownRecipe]:
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT c.character_key, c.character_name, c.realm_slug, c.discord_user_id,
                    r.spell_id, r.profession_id, r.learned_at
@@ -1765,7 +1815,6 @@ class WoWData:
             """,
             (character_key,),
         )
-        rows = await cur.fetchall()
         return [_known_recipe_from_row(row) for row in rows]
 
     async def find_crafters_with_known_recipe(
@@ -1780,8 +1829,7 @@ class WoWData:
         don't show up even if their old data still references the recipe.
         """
         await self.init_db()
-        db = await self._get_db()
-        cur = await db.execute(
+        rows = await self._pool.fetchall(
             """
             SELECT c.character_key, c.character_name, c.realm_slug, c.discord_user_id,
                    p.profession_id, p.skill_level, p.specialization, p.updated_at
@@ -1799,10 +1847,24 @@ class WoWData:
             """,
             (spell_id, profession_id, minimum_skill),
         )
-        rows = await cur.fetchall()
         return [_profession_from_row(row) for row in rows]
 
 
+def _roster_member_from_row(row: tuple[Any, ...]) -> RosterMember:
+    return RosterMember(
+        character_key=row[0],
+        character_id=row[1],
+        name=row[2],
+        realm_slug=row[3],
+        level=row[4],
+        class_id=row[5],
+        race_id=row[6],
+        faction=row[7] or "",
+        guild_rank=row[8],
+        is_ghost=bool(row[9]),
+    )
+
+
 def _claim_from_row(row: tuple[Any, ...]) -> CharacterClaim:
     return CharacterClaim(
         character_key=row[0],
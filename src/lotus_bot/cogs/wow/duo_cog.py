@@ -24,6 +24,7 @@ anspricht.
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import partial
 from typing import TYPE_CHECKING
 
 import discord
@@ -53,6 +54,7 @@ from .duo_logic import (
 
 if TYPE_CHECKING:  # pragma: no cover
     from .cog import WoWCog
+    from .data import RosterChange
 
 logger = get_logger(__name__)
 
@@ -125,6 +127,10 @@ class DuoCog(ManagedTaskCog):
         self.data = DuoData("data/pers/wow/duo.db")
         self.forum_channel_id = DUO_FORUM_CHANNEL_ID
         self._tags: dict[str, discord.ForumTag] = {}
+        # Seit dem letzten stündlichen Refresh geänderte Chars; ``None`` heißt
+        # "unbekannt" (noch nicht am Roster angemeldet) → alle Posts neu rendern
+        self._roster_changes: set[str] | None = None
+        self._roster_subscribed = False
         self.create_task(self._startup())
         if hasattr(self.bot, "add_view"):
             self.bot.add_view(DuoHubView(self))
@@ -144,11 +150,33 @@ class DuoCog(ManagedTaskCog):
 
     async def _startup(self) -> None:
         await self.bot.wait_until_ready()
+        wow = self.wow
+        if wow is not None:
+            wow.data.add_roster_listener(self.on_roster_change)
+            self._roster_subscribed = True
         try:
             await self.publish_hub()
         except Exception as exc:  # pragma: no cover - defensive
             logger.error("[DuoCog] Hub-Publish beim Start fehlgeschlagen: %s", exc)
 
+    def cog_unload(self) -> None:
+        super().cog_unload()
+        wow = self.wow
+        if wow is not None:
+            wow.data.remove_roster_listener(self.on_roster_change)
+
+    def on_roster_change(self, change: RosterChange) -> None:
+        """Roster listener: remember which characters need their posts redone."""
+        if self._roster_changes is not None:
+            self._roster_changes |= change.keys
+
+    def _take_roster_changes(self) -> set[str] | None:
+        """Changed keys since the last refresh; ``None`` means every post."""
+        changes = self._roster_changes
+        if self._roster_subscribed:
+            self._roster_changes = set()
+        return changes
+
     async def _ensure_tags(self, forum: discord.ForumChannel) -> None:
         """Resolve (and create if missing) the managed forum tags."""
         wanted = [TAG_SEARCHING, TAG_ACTIVE, TAG_MOURNING, TAG_DISBANDED]
@@ -956,16 +984,18 @@ class DuoCog(ManagedTaskCog):
         doesn't skip the rest."""
         if self.forum() is None:
             return
+        changed = self._take_roster_changes()
         for step in (
             self._expire_stale_searches,
-            self._refresh_search_posts,
-            self._refresh_team_titles,
+            partial(self._refresh_search_posts, changed),
+            partial(self._refresh_team_titles, changed),
             self._refresh_hub_counter,
         ):
             try:
                 await step()
             except Exception as exc:  # pragma: no cover - defensive
-                logger.warning("[DuoCog] %s fehlgeschlagen: %s", step.__name__, exc)
+                name = getattr(step, "func", step).__name__
+                logger.warning("[DuoCog] %s fehlgeschlagen: %s", name, exc)
 
     async def _expire_stale_searches(self) -> None:
         cutoff = (datetime.utcnow() - timedelta(days=SEARCH_STALE_DAYS)).isoformat()
@@ -979,10 +1009,12 @@ class DuoCog(ManagedTaskCog):
                 signup.character_key,
             )
 
-    async def _refresh_search_posts(self) -> None:
+    async def _refresh_search_posts(self, changed: set[str] | None = None) -> None:
         for signup in await self.data.list_signups():
             if not signup.post_id:
                 continue
+            if changed is not None and signup.character_key not in changed:
+                continue
             thread = await self._fetch_thread(signup.post_id)
             if thread is None:
                 continue
@@ -996,11 +1028,15 @@ class DuoCog(ManagedTaskCog):
             except (discord.Forbidden, discord.HTTPException):
                 pass
 
-    async def _refresh_team_titles(self) -> None:
+    async def _refresh_team_titles(self, changed: set[str] | None = None) -> None:
         for team in await self.data.active_teams():
             if not team.thread_id:
                 continue
             members = await self.data.team_members(team.team_id)
+            if changed is not None and changed.isdisjoint(
+                m.character_key for m in members
+            ):
+                continue
             title = await self._team_title(
                 team.name, [m.character_key for m in members]
             )
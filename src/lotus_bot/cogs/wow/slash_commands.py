@@ -74,8 +74,7 @@ async def roster_char_autocomplete(
     cog: WoWCog | None = interaction.client.get_cog("WoWCog")
     if cog is None:
         return []
-    snapshot = await cog.data.get_snapshot()
-    names = sorted({member.name for member in snapshot.values()}, key=str.casefold)
+    names = await cog.data.roster_names()
     return [
         app_commands.Choice(name=name[:100], value=name)
         for name in names
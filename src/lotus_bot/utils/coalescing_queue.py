@@ -0,0 +1,100 @@
+"""Queue that keeps only the latest value per key."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Generic, Hashable, TypeVar
+
+from lotus_bot.log_setup import get_logger
+
+logger = get_logger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CoalescingQueue(Generic[K, V]):
+    """Unbounded queue where a newer value replaces a pending one for the same key.
+
+    Keys keep the position of their first pending insert, so distinct keys are
+    processed in FIFO order. ``warn_size`` only triggers a log entry; ``put``
+    never blocks or fails.
+    """
+
+    def __init__(self, warn_size: int = 1000) -> None:
+        self.warn_size = warn_size
+        self._items: dict[K, V] = {}
+        self._available = asyncio.Event()
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._unfinished = 0
+        self.enqueued = 0
+        self.coalesced = 0
+        self.processed = 0
+        self.batches = 0
+        self.high_water = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, key: K, value: V) -> None:
+        """Store ``value`` for ``key``; a pending value is overwritten."""
+        if key in self._items:
+            self.coalesced += 1
+        else:
+            self._unfinished += 1
+            self._finished.clear()
+        self._items[key] = value
+        self.enqueued += 1
+
+        size = len(self._items)
+        if size > self.high_water:
+            self.high_water = size
+            if size == self.warn_size:
+                logger.warning(
+                    f"[CoalescingQueue] {size} ausstehende Einträge, Verarbeitung hinkt hinterher."
+                )
+        self._available.set()
+
+    async def get_batch(self, max_items: int, delay: float = 0.0) -> list[tuple[K, V]]:
+        """Wait for entries and return up to ``max_items`` of them.
+
+        ``delay`` waits a little after the first entry arrives so bursts for
+        the same key collapse before they are handed out.
+        """
+        while not self._items:
+            self._available.clear()
+            await self._available.wait()
+        if delay:
+            await asyncio.sleep(delay)
+
+        keys = list(self._items)[:max_items]
+        batch = [(key, self._items.pop(key)) for key in keys]
+        if not self._items:
+            self._available.clear()
+        self.batches += 1
+        return batch
+
+    def task_done(self, count: int = 1) -> None:
+        """Mark ``count`` handed-out entries as processed."""
+        self._unfinished -= count
+        self.processed += count
+        if self._unfinished <= 0:
+            self._unfinished = 0
+            self._finished.set()
+
+    async def join(self) -> None:
+        """Wait until every entry put so far has been processed."""
+        await self._finished.wait()
+
+    def stats(self) -> dict[str, int]:
+        """Return backpressure metrics."""
+        return {
+            "pending": len(self._items),
+            "in_flight": self._unfinished - len(self._items),
+            "enqueued": self.enqueued,
+            "coalesced": self.coalesced,
+            "processed": self.processed,
+            "batches": self.batches,
+            "high_water": self.high_water,
+        }
@@ -0,0 +1,137 @@
+import asyncio
+import functools
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from lotus_bot.log_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Work below this size (caller-defined units) runs inline on the event loop.
+INLINE_THRESHOLD = 2000
+
+
+@dataclass
+class CallStats:
+    """Timing metrics for one named compute call."""
+
+    calls: int = 0
+    inline: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def avg(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+    def record(self, elapsed: float, inline: bool) -> None:
+        self.calls += 1
+        self.inline += inline
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
+class ComputePool:
+    """Offload CPU-bound work from the event loop.
+
+    ``mode`` is ``"thread"`` (default), ``"process"`` or ``"inline"``. In
+    process mode only calls marked ``picklable`` go to the process pool;
+    bound methods of providers holding the bot stay on the thread pool.
+    Calls with a ``size`` up to ``inline_threshold`` always run inline, since
+    the executor round trip would cost more than the work itself.
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        max_workers: int | None = None,
+        inline_threshold: int = INLINE_THRESHOLD,
+    ) -> None:
+        if mode not in ("thread", "process", "inline"):
+            raise ValueError(f"Unknown compute mode: {mode}")
+        self.mode = mode
+        self.max_workers = max_workers
+        self.inline_threshold = inline_threshold
+        self.stats: dict[str, CallStats] = {}
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+
+    def _executor(self, picklable: bool) -> Executor:
+        if self.mode == "process" and picklable:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._processes
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="compute"
+            )
+        return self._threads
+
+    async def run(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        size: int | None = None,
+        picklable: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Run ``func(*args, **kwargs)`` off the loop and record its timing."""
+        inline = self.mode == "inline" or (
+            size is not None and size <= self.inline_threshold
+        )
+        start = time.perf_counter()
+        try:
+            if inline:
+                return func(*args, **kwargs)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor(picklable), functools.partial(func, *args, **kwargs)
+            )
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stats.setdefault(name, CallStats()).record(elapsed, inline)
+            if elapsed > 0.5:
+                logger.warning(f"[Compute] '{name}' took {elapsed:.2f}s")
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return per-call metrics as plain dict."""
+        return {
+            name: {
+                "calls": s.calls,
+                "inline": s.inline,
+                "avg_ms": round(s.avg * 1000, 3),
+                "max_ms": round(s.max * 1000, 3),
+            }
+            for name, s in self.stats.items()
+        }
+
+    def shutdown(self) -> None:
+        """Stop the executors without waiting for queued work."""
+        for executor in (self._threads, self._processes):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._threads = self._processes = None
+
+
+_pool: ComputePool | None = None
+
+
+def get_compute_pool() -> ComputePool:
+    """Return the shared pool configured via ``COMPUTE_MODE``/``COMPUTE_WORKERS``."""
+    global _pool
+    if _pool is None:
+        workers = os.getenv("COMPUTE_WORKERS")
+        _pool = ComputePool(
+            mode=os.getenv("COMPUTE_MODE", "thread"),
+            max_workers=int(workers) if workers else None,
+        )
+    return _pool
+
+
+async def run_compute(name: str, func: Callable[..., Any], *args: Any, **kwargs: Any):
+    """Shortcut for ``get_compute_pool().run(...)``."""
+    return await get_compute_pool().run(name, func, *args, **kwargs)
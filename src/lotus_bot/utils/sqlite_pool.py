@@ -0,0 +1,199 @@
+"""Shared aiosqlite access layer: one writer, a small pool of WAL readers."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterable
+
+import aiosqlite
+
+from lotus_bot.log_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Lesende Verbindungen pro Datenbank
+READ_POOL_SIZE = 2
+# Größe des Prepared-Statement-Caches pro Verbindung
+STATEMENT_CACHE_SIZE = 256
+# Abfragen ab dieser Dauer werden als langsam geloggt (Millisekunden)
+SLOW_QUERY_MS = 200.0
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",
+    "PRAGMA mmap_size=67108864",
+)
+
+QueryListener = Callable[[str, tuple, float], None]
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+
+class SQLitePool:
+    """Serialisierter Writer plus Read-Pool für eine SQLite-Datei.
+
+    Schreibzugriffe laufen über :meth:`writing`, das die einzige
+    Schreibverbindung exklusiv für eine Transaktion hält. Reine Lesezugriffe
+    nutzen :meth:`fetchall`/:meth:`fetchone` auf einer ``query_only``-Verbindung
+    und sehen nur committete Daten. Alle Statements beider Seiten laufen durch
+    Timing und Listener.
+    """
+
+    def __init__(self, path: str, readers: int = READ_POOL_SIZE) -> None:
+        self.path = path
+        self.readers = readers
+        self._writer: aiosqlite.Connection | None = None
+        self._open_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._idle: list[aiosqlite.Connection] = []
+        self._all_readers: list[aiosqlite.Connection] = []
+        self._reader_slots = asyncio.Semaphore(readers)
+        self._listeners: list[QueryListener] = []
+        self.stats: dict[str, QueryStats] = {}
+
+    async def _connect(self, query_only: bool = False) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(
+            self.path, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        for pragma in PRAGMAS:
+            await conn.execute(pragma)
+        if query_only:
+            await conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def _trace(self, conn: aiosqlite.Connection) -> aiosqlite.Connection:
+        """Route ``execute``/``executemany`` of ``conn`` through :meth:`_record`."""
+        execute, executemany = conn.execute, conn.executemany
+
+        async def traced_execute(sql: str, parameters: Any = None):
+            start = time.perf_counter()
+            cursor = await execute(sql, parameters)
+            params = () if parameters is None else parameters
+            self._record(sql, params, (time.perf_counter() - start) * 1000)
+            return cursor
+
+        async def traced_executemany(sql: str, parameters: Iterable[Any]):
+            start = time.perf_counter()
+            cursor = await executemany(sql, parameters)
+            self._record(sql, (), (time.perf_counter() - start) * 1000)
+            return cursor
+
+        conn.execute = traced_execute
+        conn.executemany = traced_executemany
+        return conn
+
+    async def writer(self) -> aiosqlite.Connection:
+        """Return the single write connection, opening it on first use.
+
+        Prefer :meth:`writing`; direct use skips write serialisation.
+        """
+        if self._writer is None:
+            async with self._open_lock:
+                if self._writer is None:
+                    directory = os.path.dirname(self.path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    self._writer = self._trace(await self._connect())
+        return self._writer
+
+    @asynccontextmanager
+    async def writing(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the writer exclusively for one write transaction.
+
+        The caller commits as before; an exception rolls back whatever is
+        still uncommitted. Not reentrant: do not nest ``writing`` blocks.
+        """
+        async with self._write_lock:
+            conn = await self.writer()
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection from the pool."""
+        await self.writer()  # legt Datei und WAL-Modus an
+        async with self._reader_slots:
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = await self._connect(query_only=True)
+                self._all_readers.append(conn)
+            try:
+                yield conn
+            finally:
+                if conn in self._all_readers:
+                    self._idle.append(conn)
+
+    def add_listener(self, listener: QueryListener) -> None:
+        """Call ``listener(sql, params, elapsed_ms)`` after every statement."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: QueryListener) -> None:
+        self._listeners.remove(listener)
+
+    def _record(self, sql: str, params: tuple, elapsed_ms: float) -> None:
+        key = " ".join(sql.split())[:80]
+        self.stats.setdefault(key, QueryStats()).add(elapsed_ms)
+        if elapsed_ms >= SLOW_QUERY_MS:
+            logger.warning(
+                f"[SQLitePool] Slow query ({elapsed_ms:.0f} ms) on "
+                f"{os.path.basename(self.path)}: {key}"
+            )
+        for listener in self._listeners:
+            listener(sql, params, elapsed_ms)
+
+    async def _query(self, sql: str, params: Iterable[Any], one: bool) -> Any:
+        params = tuple(params)
+        async with self.reader() as conn:
+            start = time.perf_counter()
+            async with conn.execute(sql, params) as cur:
+                result = await (cur.fetchone() if one else cur.fetchall())
+            self._record(sql, params, (time.perf_counter() - start) * 1000)
+        return result
+
+    async def fetchall(self, sql: str, params: Iterable[Any] = ()) -> list[tuple]:
+        """Run a read query on the pool and return all rows."""
+        return await self._query(sql, params, one=False)
+
+    async def fetchone(self, sql: str, params: Iterable[Any] = ()) -> tuple | None:
+        """Run a read query on the pool and return the first row."""
+        return await self._query(sql, params, one=True)
+
+    def timing(self) -> dict[str, dict[str, float]]:
+        """Per-query call count, total and max duration in milliseconds."""
+        return {
+            key: {
+                "count": s.count,
+                "total_ms": round(s.total_ms, 2),
+                "max_ms": round(s.max_ms, 2),
+            }
+            for key, s in self.stats.items()
+        }
+
+    async def close(self) -> None:
+        """Close the writer and all read connections."""
+        readers, self._all_readers, self._idle = self._all_readers, [], []
+        for conn in readers:
+            await conn.close()
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
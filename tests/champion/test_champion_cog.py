@@ -1,6 +1,4 @@
 import asyncio
-import json
-import logging
 import pytest
 
 
@@ -16,6 +14,9 @@ class DummyBot:
         self.main_guild = None
         self.guilds = []
 
+    async def wait_until_ready(self):
+        await asyncio.Event().wait()
+
 
 class DummyRole:
     def __init__(self, name, rid=0):
@@ -236,31 +237,34 @@ async def test_worker_cancelled_on_unload(monkeypatch, patch_logged_task):
 
 
 @pytest.mark.asyncio
-async def test_queue_raises_when_full(monkeypatch, patch_logged_task, caplog):
-    patch_logged_task(champion_cog_mod, log_setup)
+async def test_queue_coalesces_burst_per_user(monkeypatch, patch_logged_task, tmp_path):
     bot = DummyBot()
+    patch_logged_task(champion_cog_mod, log_setup)
 
-    # erzwinge eine kleine Warteschlange für den Test
-    original_queue = asyncio.Queue
-
-    def small_queue(*args, **kwargs):
-        return original_queue(maxsize=2)
+    def schedule_task(coro, logger=None):
+        return asyncio.create_task(coro)
 
-    monkeypatch.setattr(champion_cog_mod.asyncio, "Queue", small_queue)
+    monkeypatch.setattr(log_setup, "create_logged_task", schedule_task)
+    monkeypatch.setattr(champion_cog_mod, "UPDATE_QUEUE_WARN_SIZE", 2)
     cog = ChampionCog(bot)
+    cog.data = ChampionData(str(tmp_path / "points.db"))
 
-    async def fake_add(user_id, delta, reason):
-        return delta
+    applied = []
 
-    monkeypatch.setattr(cog.data, "add_delta", fake_add)
+    async def fake_apply(user_id, score):
+        applied.append((user_id, score))
 
-    await cog.update_user_score(1, 1, "a")
-    await cog.update_user_score(2, 1, "b")
-    with caplog.at_level(logging.ERROR):
-        with pytest.raises(RuntimeError):
-            await cog.update_user_score(3, 1, "c")
+    monkeypatch.setattr(cog, "_apply_champion_role", fake_apply)
 
-    events = [json.loads(r.getMessage()).get("event", "") for r in caplog.records]
-    assert any("update_queue full" in e for e in events)
+    for _ in range(5):
+        await cog.update_user_score(1, 1, "quiz")
+    for uid in (2, 3):
+        await cog.update_user_score(uid, 2, "digest")
+    await cog.update_queue.join()
 
+    assert applied == [("1", 5), ("2", 2), ("3", 2)]
+    stats = cog.update_queue.stats()
+    assert stats["coalesced"] == 4
+    assert stats["processed"] == 3
+    assert stats["pending"] == 0
     await cog.cog_unload()
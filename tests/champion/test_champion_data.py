@@ -1,7 +1,10 @@
+from datetime import date, datetime, timedelta
+
+import aiosqlite
 import pytest
 
 
-from lotus_bot.cogs.champion.data import ChampionData
+from lotus_bot.cogs.champion.data import ChampionData, period_start
 
 
 @pytest.mark.asyncio
@@ -126,3 +129,114 @@ async def test_get_history_large_dataset(tmp_path):
     await data.close()
     db_path.unlink()
     assert not db_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_page_keyset_and_rank_context(tmp_path):
+    data = ChampionData(str(tmp_path / "keyset" / "points.db"))
+
+    for uid, pts in [("A", 5), ("B", 10), ("C", 7), ("D", 7), ("E", 1)]:
+        await data.add_delta(uid, pts, "init")
+    assert data.version == 5
+
+    first = await data.get_leaderboard_page(limit=2)
+    assert [(e.rank, e.user_id, e.total) for e in first] == [(1, "B", 10), (2, "D", 7)]
+    second = await data.get_leaderboard_page(limit=2, after=first[-1].key)
+    assert [(e.rank, e.user_id) for e in second] == [(2, "C"), (4, "A")]
+    third = await data.get_leaderboard_page(limit=2, after=second[-1].key)
+    assert [(e.rank, e.user_id) for e in third] == [(5, "E")]
+
+    context = await data.get_rank_context("A", neighbors=1)
+    assert [(e.rank, e.user_id) for e in context] == [(2, "C"), (4, "A"), (5, "E")]
+    context = await data.get_rank_context("B", neighbors=2)
+    assert [(e.rank, e.user_id) for e in context] == [(1, "B"), (2, "D"), (2, "C")]
+    assert await data.get_rank("D") == (2, 7)
+    assert await data.get_rank("C") == (2, 7)
+    assert await data.get_rank_context("missing") == []
+
+    statements = []
+
+    def record(sql, params, elapsed_ms):
+        statements.append((sql, params))
+
+    data._pool.add_listener(record)
+    await data.get_leaderboard_page(limit=2, after=first[-1].key)
+    await data.get_rank_context("A", neighbors=1)
+    data._pool.remove_listener(record)
+    db = await data._get_db()
+    for sql, params in statements:
+        cur = await db.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        plan = [row[3] for row in await cur.fetchall()]
+        assert not [step for step in plan if step.startswith("SCAN points")], plan
+    await data.close()
+
+
+def test_period_start():
+    today = date(2026, 8, 13)  # Donnerstag
+    assert period_start("week", today) == date(2026, 8, 10)
+    assert period_start("month", today) == date(2026, 8, 1)
+    assert period_start("season", today) == date(2026, 7, 1)
+    with pytest.raises(ValueError):
+        period_start("year", today)
+
+
+@pytest.mark.asyncio
+async def test_rollups_archive_and_period_leaderboard(tmp_path):
+    data = ChampionData(str(tmp_path / "rollup" / "points.db"))
+    await data.add_delta("A", 5, "quiz")
+    await data.add_delta("A", 3, "quiz")
+    await data.add_delta("B", 4, "duel")
+
+    db = await data._get_db()
+    old = (datetime.utcnow() - timedelta(days=400)).isoformat()
+    await db.execute(
+        "INSERT INTO history(user_id, delta, reason, date) VALUES ('B', 50, 'alt', ?)",
+        (old,),
+    )
+    await db.commit()
+    await data.rebuild_rollups()
+
+    today = datetime.utcnow().date()
+    board = await data.get_period_leaderboard(today, limit=5)
+    assert [(e.rank, e.user_id, e.total) for e in board] == [(1, "A", 8), (2, "B", 4)]
+    assert await data.get_period_points("B", date(2000, 1, 1)) == 54
+
+    assert await data.archive_history(365) == 1
+    cur = await db.execute("SELECT COUNT(*) FROM history")
+    assert (await cur.fetchone())[0] == 3
+    # Archivierte Einträge bleiben in Historie und Tagessummen sichtbar
+    history = await data.get_history("B", limit=5)
+    assert [h["reason"] for h in history] == ["duel", "alt"]
+    assert await data.get_period_points("B", date(2000, 1, 1)) == 54
+
+    cur = await db.execute(
+        "EXPLAIN QUERY PLAN SELECT delta FROM history WHERE user_id = 'A' "
+        "ORDER BY date DESC"
+    )
+    plan = " ".join(row[3] for row in await cur.fetchall())
+    assert "idx_history_user_date" in plan
+
+    await data.delete_user("B")
+    assert await data.get_history("B") == []
+    assert await data.get_period_points("B", date(2000, 1, 1)) == 0
+    await data.close()
+
+
+@pytest.mark.asyncio
+async def test_rollups_backfilled_for_existing_history(tmp_path):
+    path = tmp_path / "legacy.db"
+    async with aiosqlite.connect(path) as db:
+        await db.execute(
+            "CREATE TABLE history (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "user_id TEXT NOT NULL, delta INTEGER NOT NULL, reason TEXT NOT NULL, "
+            "date TEXT NOT NULL)"
+        )
+        await db.executemany(
+            "INSERT INTO history(user_id, delta, reason, date) VALUES (?, ?, 'x', ?)",
+            [("A", 2, "2026-01-05T10:00:00"), ("A", 3, "2026-01-05T12:00:00")],
+        )
+        await db.commit()
+
+    data = ChampionData(str(path))
+    assert await data.get_period_points("A", date(2026, 1, 1)) == 5
+    await data.close()
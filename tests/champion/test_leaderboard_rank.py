@@ -1,6 +1,7 @@
 import pytest
 
-from lotus_bot.cogs.champion.slash_commands import leaderboard, rank
+from lotus_bot.cogs.champion.data import LeaderboardEntry
+from lotus_bot.cogs.champion.slash_commands import leaderboard, rank, top
 
 
 class DummyMember:
@@ -13,9 +14,20 @@ class DummyMember:
 class DummyData:
     def __init__(self):
         self.rank_calls = []
+        self.page_calls = 0
+        self.version = 0
 
-    async def get_leaderboard(self, limit=30):
-        return [("1", 60), ("2", 30), ("3", 10)]
+    async def get_leaderboard_page(self, limit=30, after=None):
+        self.page_calls += 1
+        return [
+            LeaderboardEntry(1, "1", 60),
+            LeaderboardEntry(2, "2", 30),
+            LeaderboardEntry(3, "3", 10),
+        ]
+
+    async def get_period_leaderboard(self, since, limit=15):
+        self.period_since = since
+        return [LeaderboardEntry(1, "2", 12), LeaderboardEntry(2, "4", 3)]
 
     async def get_rank(self, uid):
         self.rank_calls.append(uid)
@@ -36,6 +48,16 @@ class DummyCog:
     def __init__(self):
         self.data = DummyData()
         self.roles = [DummyRole("Gold", 50), DummyRole("Silver", 20)]
+        self._leaderboard_cache = None
+
+    def cached_leaderboard(self):
+        cache = self._leaderboard_cache
+        if cache and cache[0] == self.data.version:
+            return cache[1]
+        return None
+
+    def cache_leaderboard(self, version, text):
+        self._leaderboard_cache = (version, text)
 
     def get_current_role(self, score):
         for role in self.roles:
@@ -128,6 +150,35 @@ async def test_leaderboard_groups_and_public():
     assert ephemeral is False
 
 
+@pytest.mark.asyncio
+async def test_leaderboard_is_cached_until_scores_change():
+    bot = DummyBot()
+    guild = DummyGuild()
+
+    for _ in range(2):
+        await leaderboard.callback(DummyInteractionBoard(bot, guild))
+    assert bot._cog.data.page_calls == 1
+
+    bot._cog.data.version += 1
+    inter = DummyInteractionBoard(bot, guild)
+    await leaderboard.callback(inter)
+    assert bot._cog.data.page_calls == 2
+    assert "Alice" in inter.followup.sent[0][0]
+
+
+@pytest.mark.asyncio
+async def test_top_period_board():
+    bot = DummyBot()
+    inter = DummyInteractionBoard(bot, DummyGuild())
+
+    await top.callback(inter, "month")
+
+    msg, _ = inter.followup.sent[0]
+    assert "diesem Monat" in msg
+    assert "Bob" in msg and "Unbekannt (4)" in msg
+    assert bot._cog.data.period_since.day == 1
+
+
 @pytest.mark.asyncio
 async def test_rank_self_and_other():
     bot = DummyBot()
@@ -1,3 +1,4 @@
+import discord
 import pytest
 
 from lotus_bot.cogs.champion.cog import ChampionCog
@@ -9,7 +10,14 @@ import lotus_bot.log_setup as log_setup
 
 class DummyBot:
     def __init__(self):
-        self.data = {"champion": {"roles": []}}
+        self.data = {
+            "champion": {
+                "roles": [
+                    {"name": "Gold", "threshold": 50, "id": 1},
+                    {"name": "Silver", "threshold": 20, "id": 2},
+                ]
+            }
+        }
         self.main_guild = None
         self.guilds = []
         self._cog = None
@@ -18,6 +26,51 @@ class DummyBot:
         return self._cog if name == "ChampionCog" else None
 
 
+class DummyRole:
+    def __init__(self, name, rid):
+        self.name = name
+        self.id = rid
+
+
+class DummyMember:
+    def __init__(self, uid, roles, calls, fail_once=False):
+        self.id = uid
+        self.roles = list(roles)
+        self.display_name = f"Member{uid}"
+        self.calls = calls
+        self.fail_once = fail_once
+
+    async def remove_roles(self, *roles):
+        self.calls.append(("remove", self.id, [r.name for r in roles]))
+
+    async def add_roles(self, *roles):
+        if self.fail_once:
+            self.fail_once = False
+            raise discord.RateLimited(0)
+        self.calls.append(("add", self.id, [r.name for r in roles]))
+
+
+class DummyGuild:
+    def __init__(self, members, roles, uncached=()):
+        self.members = {m.id: m for m in members}
+        self.uncached = {m.id: m for m in uncached}
+        self.roles = roles
+        self.fetched = []
+
+    def get_member(self, uid):
+        return self.members.get(uid)
+
+    def get_role(self, rid):
+        return next((r for r in self.roles if r.id == rid), None)
+
+    async def fetch_member(self, uid):
+        self.fetched.append(uid)
+        if uid not in self.uncached:
+            response = type("Response", (), {"status": 404, "reason": "Not Found"})()
+            raise discord.NotFound(response, "Unknown Member")
+        return self.uncached[uid]
+
+
 class DummyResponse:
     def __init__(self):
         self.deferred = False
@@ -43,31 +96,82 @@ class DummyInteraction:
         self.guild = None
 
 
-@pytest.mark.asyncio
-async def test_syncroles_processes_all_users(monkeypatch, tmp_path, patch_logged_task):
-    bot = DummyBot()
+@pytest.fixture
+def setup_cog(monkeypatch, tmp_path, patch_logged_task):
     patch_logged_task(champion_cog_mod, log_setup)
-    cog = ChampionCog(bot)
-    bot._cog = cog
-    cog.data = ChampionData(str(tmp_path / "points.db"))
+    monkeypatch.setattr(champion_cog_mod.discord, "Guild", DummyGuild)
+    monkeypatch.setattr(champion_cog_mod, "ROLE_SYNC_INTERVAL", 0)
+    monkeypatch.setattr(champion_cog_mod, "ROLE_SYNC_CHECKPOINT", 1)
 
-    await cog.data.add_delta("1", 5, "init")
-    await cog.data.add_delta("2", 3, "init")
+    bot = DummyBot()
+    gold, silver = DummyRole("Gold", 1), DummyRole("Silver", 2)
+    calls = []
 
-    called = []
+    def build(members, uncached=()):
+        bot.main_guild = DummyGuild(
+            [DummyMember(uid, roles, calls, **kw) for uid, roles, kw in members],
+            [gold, silver],
+            [DummyMember(uid, roles, calls) for uid, roles in uncached],
+        )
+        cog = ChampionCog(bot)
+        bot._cog = cog
+        cog.data = ChampionData(str(tmp_path / "points.db"))
+        return cog
 
-    async def fake_apply(uid, score):
-        called.append((uid, score))
+    return bot, build, calls, gold, silver
 
-    monkeypatch.setattr(cog, "_apply_champion_role", fake_apply)
 
-    inter = DummyInteraction(bot)
+@pytest.mark.asyncio
+async def test_syncroles_only_sends_needed_changes(setup_cog):
+    bot, build, calls, gold, silver = setup_cog
+    # Member 2 hat die Rolle bereits korrekt
+    cog = build([(1, [], {}), (2, [silver], {})])
 
+    await cog.data.add_delta("1", 60, "init")
+    await cog.data.add_delta("2", 30, "init")
+    await cog.data.add_delta("3", 25, "init")  # nicht mehr im Server
+
+    inter = DummyInteraction(bot)
     await syncroles.callback(inter)
 
-    assert set(called) == {("1", 5), ("2", 3)}
-    assert inter.followup.sent
+    assert calls == [("add", 1, ["Gold"])]
     msg, ephemeral = inter.followup.sent[0]
+    assert "3 Nutzer geprüft, 1 angepasst" in msg
+    assert "1 nicht im Server" in msg
     assert ephemeral is True
+    assert await cog.data.get_sync_cursor() is None
+    await cog.cog_unload()
+
+
+@pytest.mark.asyncio
+async def test_sync_resumes_after_cursor_and_retries_rate_limit(setup_cog):
+    bot, build, calls, gold, silver = setup_cog
+    cog = build([(1, [], {}), (2, [gold], {"fail_once": True})])
+
+    await cog.data.add_delta("1", 60, "init")
+    await cog.data.add_delta("2", 30, "init")
+    await cog.data.set_sync_cursor("1")
+
+    result = await cog.sync_all_roles()
+
+    assert result.checked == 1 and result.changed == 1
+    assert calls == [("remove", 2, ["Gold"]), ("add", 2, ["Silver"])]
+    assert await cog.data.get_sync_cursor() is None
+    await cog.cog_unload()
+
+
+@pytest.mark.asyncio
+async def test_sync_fetches_members_missing_from_cache(setup_cog):
+    bot, build, calls, gold, silver = setup_cog
+    cog = build([(1, [gold], {})], uncached=[(2, [])])
+
+    await cog.data.add_delta("1", 60, "init")
+    await cog.data.add_delta("2", 30, "init")
+    await cog.data.add_delta("3", 25, "init")  # hat den Server verlassen
+
+    result = await cog.sync_all_roles()
+
+    assert bot.main_guild.fetched == [2, 3]
+    assert calls == [("add", 2, ["Silver"])]
+    assert (result.checked, result.changed, result.missing) == (3, 1, 1)
     await cog.cog_unload()
-    await cog.wait_closed()
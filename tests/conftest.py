@@ -102,10 +102,10 @@ async def assert_no_tasks():
 
 
 @pytest_asyncio.fixture
-async def wcr_data(monkeypatch):
+async def wcr_data(monkeypatch, tmp_path):
     """Load WCR data from local JSON files and patch API fetcher."""
 
-    async def fake_fetch(base_url: str):
+    async def fake_fetch(base_url: str, validators=None):
         base = Path("tests/data")
         units = json.load(open(base / "wcr_units.json", encoding="utf-8"))
         categories = json.load(open(base / "wcr_categories.json", encoding="utf-8"))
@@ -125,6 +125,7 @@ async def wcr_data(monkeypatch):
         }
 
     monkeypatch.setattr("lotus_bot.cogs.wcr.utils.fetch_wcr_data", fake_fetch)
+    monkeypatch.setattr("lotus_bot.cogs.wcr.utils.CACHE_FILE", tmp_path / "wcr.json")
     from lotus_bot.cogs.wcr.utils import load_wcr_data
 
     return await load_wcr_data("http://test")
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from lotus_bot.utils.coalescing_queue import CoalescingQueue
+
+
+@pytest.mark.asyncio
+async def test_latest_value_wins_and_order_is_kept():
+    queue = CoalescingQueue()
+    queue.put("a", 1)
+    queue.put("b", 1)
+    queue.put("a", 3)
+
+    assert len(queue) == 2
+    assert await queue.get_batch(10) == [("a", 3), ("b", 1)]
+    assert queue.stats()["coalesced"] == 1
+    assert queue.stats()["in_flight"] == 2
+
+
+@pytest.mark.asyncio
+async def test_batches_and_join():
+    queue = CoalescingQueue()
+    for key in range(5):
+        queue.put(key, key)
+
+    first = await queue.get_batch(3)
+    assert [k for k, _ in first] == [0, 1, 2]
+    queue.task_done(len(first))
+
+    joiner = asyncio.create_task(queue.join())
+    await asyncio.sleep(0)
+    assert not joiner.done()
+
+    rest = await queue.get_batch(3)
+    assert [k for k, _ in rest] == [3, 4]
+    queue.task_done(len(rest))
+    await asyncio.wait_for(joiner, 1)
+    assert queue.stats()["processed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_get_batch_waits_for_put():
+    queue = CoalescingQueue()
+    getter = asyncio.create_task(queue.get_batch(10))
+    await asyncio.sleep(0)
+    assert not getter.done()
+
+    queue.put("x", 1)
+    assert await asyncio.wait_for(getter, 1) == [("x", 1)]
+
+
+def test_put_never_fails_and_tracks_high_water():
+    queue = CoalescingQueue(warn_size=2)
+    for key in range(5):
+        queue.put(key, 0)
+    assert queue.stats()["high_water"] == 5
@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from lotus_bot.utils.compute import ComputePool
+
+
+def current_thread_name():
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_small_work_runs_inline():
+    pool = ComputePool(inline_threshold=10)
+    name = await pool.run("job", current_thread_name, size=5)
+
+    assert name == threading.current_thread().name
+    assert pool.stats["job"].calls == 1
+    assert pool.stats["job"].inline == 1
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_large_work_runs_in_thread_pool():
+    pool = ComputePool(inline_threshold=10)
+    name = await pool.run("job", current_thread_name, size=50)
+    await pool.run("job", current_thread_name)
+
+    assert name.startswith("compute")
+    summary = pool.summary()["job"]
+    assert summary["calls"] == 2
+    assert summary["inline"] == 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_mode_keeps_unpicklable_calls_on_threads():
+    pool = ComputePool(mode="process")
+    name = await pool.run("job", current_thread_name)
+
+    assert name.startswith("compute")
+    assert pool._processes is None
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_errors_are_recorded_and_raised():
+    pool = ComputePool(mode="inline")
+
+    def boom():
+        raise ValueError("x")
+
+    with pytest.raises(ValueError):
+        await pool.run("boom", boom)
+    assert pool.stats["boom"].calls == 1
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        ComputePool(mode="gpu")
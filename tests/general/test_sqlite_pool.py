@@ -0,0 +1,123 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from lotus_bot.utils.sqlite_pool import SQLitePool
+
+
+@pytest.fixture
+async def pool(tmp_path):
+    pool = SQLitePool(str(tmp_path / "sub" / "test.db"))
+    db = await pool.writer()
+    await db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    await db.commit()
+    yield pool
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_readers_see_committed_rows_only(pool):
+    db = await pool.writer()
+    await db.execute("INSERT INTO t VALUES (1, 'a')")
+    assert await pool.fetchall("SELECT v FROM t") == []
+
+    await db.commit()
+    assert await pool.fetchone("SELECT v FROM t WHERE id = ?", (1,)) == ("a",)
+
+
+@pytest.mark.asyncio
+async def test_reader_is_query_only_and_tuned(pool):
+    async with pool.reader() as conn:
+        with pytest.raises(sqlite3.OperationalError):
+            await conn.execute("INSERT INTO t VALUES (2, 'b')")
+        cur = await conn.execute("PRAGMA synchronous")
+        assert (await cur.fetchone())[0] == 1
+        cur = await conn.execute("PRAGMA journal_mode")
+        assert (await cur.fetchone())[0] == "wal"
+
+
+@pytest.mark.asyncio
+async def test_parallel_reads_are_bounded(pool):
+    await asyncio.gather(*(pool.fetchall("SELECT * FROM t") for _ in range(10)))
+    assert len(pool._all_readers) <= pool.readers
+
+
+@pytest.mark.asyncio
+async def test_listener_and_timing(pool):
+    seen = []
+
+    def listener(sql, params, elapsed_ms):
+        seen.append((sql, params))
+
+    pool.add_listener(listener)
+    await pool.fetchall("SELECT v FROM t WHERE id = ?", (7,))
+    pool.remove_listener(listener)
+    await pool.fetchall("SELECT v FROM t")
+
+    assert seen == [("SELECT v FROM t WHERE id = ?", (7,))]
+    timing = pool.timing()
+    assert timing["SELECT v FROM t WHERE id = ?"]["count"] == 1
+    assert timing["SELECT v FROM t"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_close_and_reopen(pool):
+    await pool.fetchall("SELECT * FROM t")
+    await pool.close()
+    assert pool._writer is None and pool._all_readers == []
+    assert await pool.fetchall("SELECT * FROM t") == []
+
+
+@pytest.mark.asyncio
+async def test_writing_serialises_transactions(pool):
+    order = []
+
+    async def write(tag):
+        async with pool.writing() as db:
+            order.append(f"{tag}-start")
+            await db.execute("INSERT INTO t (v) VALUES (?)", (tag,))
+            await asyncio.sleep(0.01)
+            await db.commit()
+            order.append(f"{tag}-end")
+
+    await asyncio.gather(write("a"), write("b"))
+
+    assert order == ["a-start", "a-end", "b-start", "b-end"]
+    assert await pool.fetchall("SELECT v FROM t ORDER BY id") == [("a",), ("b",)]
+
+
+@pytest.mark.asyncio
+async def test_writing_rolls_back_on_error(pool):
+    with pytest.raises(RuntimeError):
+        async with pool.writing() as db:
+            await db.execute("INSERT INTO t VALUES (1, 'a')")
+            raise RuntimeError("boom")
+
+    async with pool.writing() as db:
+        await db.commit()
+    assert await pool.fetchall("SELECT * FROM t") == []
+
+
+@pytest.mark.asyncio
+async def test_writer_statements_reach_listeners(pool):
+    seen = []
+
+    def listener(sql, params, elapsed_ms):
+        seen.append((sql, params))
+
+    pool.add_listener(listener)
+    async with pool.writing() as db:
+        await db.execute("INSERT INTO t VALUES (?, ?)", (1, "a"))
+        await db.executemany("INSERT INTO t VALUES (?, ?)", [(2, "b")])
+        cur = await db.execute("SELECT v FROM t WHERE id = ?", (1,))
+        assert await cur.fetchone() == ("a",)
+        await db.commit()
+    pool.remove_listener(listener)
+
+    assert seen == [
+        ("INSERT INTO t VALUES (?, ?)", (1, "a")),
+        ("INSERT INTO t VALUES (?, ?)", ()),
+        ("SELECT v FROM t WHERE id = ?", (1,)),
+    ]
+    assert pool.timing()["SELECT v FROM t WHERE id = ?"]["count"] == 1
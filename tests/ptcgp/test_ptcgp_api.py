@@ -4,9 +4,10 @@ import lotus_bot.cogs.ptcgp.api as api_mod
 
 
 class DummyResponse:
-    def __init__(self):
-        self.status = 200
+    def __init__(self, payload=None, status=200):
+        self.status = status
         self.json_called = False
+        self.payload = payload or []
 
     async def __aenter__(self):
         return self
@@ -16,7 +17,7 @@ class DummyResponse:
 
     async def json(self):
         self.json_called = True
-        return []
+        return self.payload
 
 
 class DummySession:
@@ -38,6 +39,54 @@ class DummySession:
 async def test_fetch_respects_env(monkeypatch):
     called = {}
     monkeypatch.setenv("PTCGP_SKIP_SSL_VERIFY", "1")
-    monkeypatch.setattr(api_mod.aiohttp, "ClientSession", lambda: DummySession(called))
+    monkeypatch.setattr(
+        api_mod.aiohttp, "ClientSession", lambda **kw: DummySession(called)
+    )
     await api_mod.fetch_all_cards("en")
     assert called["ssl"] is False
+
+
+class PagedSession:
+    def __init__(self, pages, missing_status=200):
+        self.pages = pages
+        self.missing_status = missing_status
+        self.urls = []
+
+    def get(self, url, *, ssl=None):
+        self.urls.append(url)
+        page = int(url.rsplit("=", 1)[1])
+        if page not in self.pages and self.missing_status != 200:
+            return DummyResponse(status=self.missing_status)
+        return DummyResponse({"data": self.pages.get(page, [])})
+
+
+@pytest.mark.asyncio
+async def test_iter_card_pages_streams_in_order(monkeypatch):
+    monkeypatch.setattr(api_mod, "PAGE_CONCURRENCY", 2)
+    session = PagedSession({1: [{"id": "a"}], 2: [{"id": "b"}], 3: [{"id": "c"}]})
+
+    pages = [items async for items in api_mod.iter_card_pages(session, "de")]
+
+    assert pages == [[{"id": "a"}], [{"id": "b"}], [{"id": "c"}]]
+    assert len(session.urls) == 4
+    assert all("/de/" in url for url in session.urls)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [404, 500])
+async def test_iter_card_pages_ignores_errors_past_the_end(monkeypatch, status):
+    monkeypatch.setattr(api_mod, "PAGE_CONCURRENCY", 4)
+    session = PagedSession({1: [{"id": "a"}], 2: []}, missing_status=status)
+
+    pages = [items async for items in api_mod.iter_card_pages(session, "en")]
+
+    assert pages == [[{"id": "a"}]]
+
+
+@pytest.mark.asyncio
+async def test_iter_card_pages_raises_on_error_before_the_end(monkeypatch):
+    monkeypatch.setattr(api_mod, "PAGE_CONCURRENCY", 2)
+    session = PagedSession({2: [{"id": "b"}]}, missing_status=500)
+
+    with pytest.raises(RuntimeError):
+        [items async for items in api_mod.iter_card_pages(session, "en")]
@@ -1,7 +1,15 @@
 import pytest
 
 from lotus_bot.cogs.ptcgp.cog import PTCGPCog
-import lotus_bot.cogs.ptcgp.api as api_mod
+import lotus_bot.cogs.ptcgp.cog as cog_mod
+
+
+class DummySession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
 
 
 class DummyBot:
@@ -44,15 +52,11 @@ async def test_update_command(monkeypatch, tmp_path):
     bot._cog = cog
     cog.data = cog.data.__class__(str(tmp_path / "cards.db"))
 
-    async def fake_fetch(lang):
-        if lang == "en":
-            return [{"id": "1", "name": "Pika"}]
-        return [{"id": "1", "name": "Pika"}]
+    async def fake_pages(session, lang, semaphore=None):
+        yield [{"id": "1", "name": "Pika"}]
 
-    monkeypatch.setattr(api_mod, "fetch_all_cards", fake_fetch)
-    import lotus_bot.cogs.ptcgp.cog as cog_mod
-
-    monkeypatch.setattr(cog_mod, "fetch_all_cards", fake_fetch)
+    monkeypatch.setattr(cog_mod, "iter_card_pages", fake_pages)
+    monkeypatch.setattr(cog_mod, "create_session", DummySession)
 
     from lotus_bot.cogs.ptcgp.slash_commands import update
 
@@ -66,3 +70,65 @@ async def test_update_command(monkeypatch, tmp_path):
 
     cog.cog_unload()
     await cog.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_failed_update_keeps_old_cards(monkeypatch, tmp_path):
+    bot = DummyBot()
+    cog = PTCGPCog(bot)
+    cog.data = cog.data.__class__(str(tmp_path / "cards.db"))
+    await cog.data.replace_all([{"id": "old"}], [])
+
+    async def broken_pages(session, lang, semaphore=None):
+        yield [{"id": "new"}]
+        raise RuntimeError("HTTP 500")
+
+    monkeypatch.setattr(cog_mod, "iter_card_pages", broken_pages)
+    monkeypatch.setattr(cog_mod, "create_session", DummySession)
+
+    with pytest.raises(RuntimeError, match="Laden der Kartendaten"):
+        await cog.update_database()
+
+    assert await cog.data.count_cards() == {"en": 1}
+    assert await cog.get_card("new") == {}
+
+    cog.cog_unload()
+    await cog.wait_closed()
+
+
+class EmbedResponse:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, content=None, *, embed=None, ephemeral=False):
+        self.sent.append((content, embed))
+
+
+@pytest.mark.asyncio
+async def test_card_command_and_autocomplete(tmp_path):
+    from types import SimpleNamespace
+
+    from lotus_bot.cogs.ptcgp.slash_commands import card, card_autocomplete
+
+    bot = DummyBot()
+    cog = PTCGPCog(bot)
+    bot._cog = cog
+    cog.data = cog.data.__class__(str(tmp_path / "cards.db"))
+    await cog.data.replace_all(
+        [{"id": "7", "name": "Bulbasaur", "hp": 70, "image": "https://x/7"}],
+        [{"id": "7", "name": "Bisasam", "hp": 70, "image": "https://x/7"}],
+    )
+
+    inter = DummyInteraction(bot)
+    inter.namespace = SimpleNamespace(sprache="en")
+    choices = await card_autocomplete(inter, "bulb")
+    assert [(c.name, c.value) for c in choices] == [("Bulbasaur", "7")]
+
+    inter.response = EmbedResponse()
+    await card.callback(inter, "bisa", "de")
+    embed = inter.response.sent[0][1]
+    assert embed.title == "Bisasam"
+    assert embed.image.url == "https://x/7/high.png"
+
+    cog.cog_unload()
+    await cog.wait_closed()
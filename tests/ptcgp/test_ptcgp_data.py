@@ -40,3 +40,72 @@ async def test_replace_and_fetch(tmp_path):
     assert counts == {"en": 1, "de": 1}
 
     await data.close()
+
+
+@pytest.mark.asyncio
+async def test_staging_swap_replaces_cards(tmp_path):
+    data = PTCGPData(str(tmp_path / "cards.db"))
+    await data.replace_all([CARD_EN], [CARD_DE])
+
+    await data.begin_staging()
+    await data.stage_cards([{**CARD_EN, "id": "2"}], "en")
+    # Bis zum Tausch bleibt der alte Stand sichtbar
+    assert await data.count_cards() == {"en": 1, "de": 1}
+    await data.commit_staging()
+
+    assert await data.count_cards() == {"en": 1}
+    assert "en" in await data.get_card("2")
+    db = await data._get_db()
+    cur = await db.execute(
+        "SELECT name FROM sqlite_master WHERE name = 'cards_staging'"
+    )
+    assert await cur.fetchone() is None
+    await data.close()
+
+
+@pytest.mark.asyncio
+async def test_fts_search_filters_and_suggestions(tmp_path):
+    data = PTCGPData(str(tmp_path / "cards.db"))
+    glurak = {
+        "id": "2",
+        "name": "Glurak ex",
+        "hp": 180,
+        "types": ["Feuer"],
+        "attacks": [{"name": "Feuerwirbel", "effect": "Lege 2 Energien ab."}],
+        "rarity": "Vier Diamanten",
+        "set": {"name": "Unschlagbare Gene"},
+    }
+    await data.replace_all([CARD_EN], [CARD_DE, glurak])
+
+    assert [c["id"] for c in await data.search_cards("glu")] == ["2"]
+    assert [c["id"] for c in await data.search_cards("donner")] == ["1"]
+    assert [c["id"] for c in await data.search_cards("energien")] == ["2"]
+    assert [c["id"] for c in await data.search_cards("thunder", "en")] == ["1"]
+    assert await data.search_cards('pika"chu') == []
+
+    by_type = await data.search_cards(card_type="feuer")
+    assert [c["id"] for c in by_type] == ["2"]
+    assert [c["id"] for c in await data.search_cards(hp_max=100)] == ["1"]
+    assert [c["id"] for c in await data.search_cards(set_name="basis")] == ["1"]
+
+    assert await data.suggest_names("pik") == [("1", "Pikachu", "Basis")]
+    assert len(await data.suggest_names("")) == 2
+
+    first = await data.get_card("2")
+    first["de"]["name"] = "verändert"
+    first["de"]["attacks"].clear()
+    queries = []
+
+    def record(sql, params, elapsed_ms):
+        queries.append(sql)
+
+    data._pool.add_listener(record)
+    second = await data.get_card("2")
+    data._pool.remove_listener(record)
+    assert queries == []  # aus dem Cache
+    assert second["de"]["name"] != "verändert"
+    assert second["de"]["attacks"]
+    await data.replace_all([CARD_EN], [])
+    assert await data.get_card("2") == {}
+    assert await data.search_cards("glurak") == []
+    await data.close()
@@ -1,4 +1,4 @@
-from lotus_bot.cogs.quiz.utils import check_answer
+from lotus_bot.cogs.quiz.utils import check_answer, check_answer_async
 
 
 def test_exact_match():
@@ -27,3 +27,9 @@ def test_empty_normalized_input():
 
 def test_whitespace_input():
     assert check_answer("   ", ["Paris"]) is False
+
+
+async def test_check_answer_async_matches_sync():
+    long_answer = "a" * 3000
+    assert await check_answer_async("Paris", ["Paris"]) is True
+    assert await check_answer_async(long_answer, ["Paris"]) is False
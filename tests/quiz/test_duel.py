@@ -10,6 +10,7 @@ from lotus_bot.cogs.quiz.duel import (
     DuelQuestionView,
 )
 from lotus_bot.cogs.quiz.quiz_config import QuizAreaConfig
+from lotus_bot.cogs.quiz.scheduler import TimerWheel
 
 
 class DummyMember:
@@ -635,6 +636,27 @@ async def test_start_duel_blocks_active_players():
     view.stop()
 
 
+@pytest.mark.asyncio
+async def test_invite_timer_cancelled_when_view_stops():
+    bot = DummyBot()
+    cog = DummyCog(bot)
+    cog.active_duels.add(1)
+    cog.timers = TimerWheel(create_task=lambda coro: coro.close())
+    view = DuelInviteView(DummyMember(1), DuelConfig("area", 20, "bo3"), cog)
+    view.message = DummyMessage()
+    assert view.timer_key in cog.timers
+
+    await view.start_duel(DummyInteraction(DummyMember(2)))
+
+    assert view.timer_key not in cog.timers
+    assert (
+        cog.timers.dispatch_due(
+            datetime.datetime.utcnow() + datetime.timedelta(seconds=120)
+        )
+        == 0
+    )
+
+
 @pytest.mark.asyncio
 async def test_finish_removes_active_duels():
     bot = DummyBot()
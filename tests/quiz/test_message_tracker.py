@@ -1,7 +1,11 @@
+import asyncio
+import datetime
+
 from lotus_bot.cogs.quiz.message_tracker import MessageTracker
 import lotus_bot.cogs.quiz.message_tracker as msg_mod
 import pytest
 from lotus_bot.cogs.quiz.quiz_config import QuizAreaConfig
+from lotus_bot.cogs.quiz.scheduler import TimerWheel
 
 
 class DummyAuthor:
@@ -119,6 +123,9 @@ async def test_initialize_counts_history(monkeypatch):
         async def wait_until_ready(self):
             pass
 
+        def get_channel(self, cid):
+            return None
+
         async def fetch_channel(self, cid):
             return DummyChannel(cid, msgs)
 
@@ -159,6 +166,9 @@ async def test_initialize_uses_threshold_when_no_quiz(monkeypatch):
         async def wait_until_ready(self):
             pass
 
+        def get_channel(self, cid):
+            return None
+
         async def fetch_channel(self, cid):
             return DummyChannel(cid, msgs)
 
@@ -201,6 +211,9 @@ async def test_initialize_uses_threshold_as_history_limit(monkeypatch):
         async def wait_until_ready(self):
             pass
 
+        def get_channel(self, cid):
+            return None
+
         async def fetch_channel(self, cid):
             return DummyChannel(cid)
 
@@ -213,3 +226,123 @@ async def test_initialize_uses_threshold_as_history_limit(monkeypatch):
 
     assert used_limits == [25]
     assert tracker.get(123) == 25
+
+
+def test_register_message_aggregates_logging(monkeypatch):
+    bot = DummyBot()
+    tracker = MessageTracker(bot, None, summary_interval=3600)
+    logged = []
+    monkeypatch.setattr(msg_mod.logger, "info", lambda msg, **kw: logged.append(msg))
+
+    for _ in range(5):
+        tracker.register_message(DummyMessage(123))
+    tracker.register_message(DummyMessage(999))
+
+    assert tracker.get(123) == 5
+    assert logged == []
+
+    assert tracker.flush_summary() == {123: 5}
+    assert len(logged) == 1
+    assert "area1: +5 (5)" in logged[0]
+    assert tracker.flush_summary() == {}
+    assert len(logged) == 1
+
+
+def test_watched_channels_follow_mapping():
+    bot = DummyBot()
+    tracker = MessageTracker(bot, None)
+    assert tracker.watched == frozenset({123})
+
+    bot.quiz_data["area1"].channel_id = 456
+    tracker.update_mapping()
+    assert tracker.watched == frozenset({456})
+
+
+def test_unwatched_channels_are_skipped():
+    bot = DummyBot()
+    tracker = MessageTracker(bot, None, summary_interval=3600)
+    messages = [DummyMessage(123 if i % 10 == 0 else 1000 + i) for i in range(100)]
+
+    results = [tracker.register_message(msg) for msg in messages]
+
+    assert tracker.get(123) == 10
+    assert set(tracker.message_counter) == {123}
+    assert tracker.flush_summary() == {123: 10}
+    assert results.count("area1") == 10
+    assert results.count(None) == 90
+
+
+def test_summary_flushed_by_timer_on_idle_channel(monkeypatch):
+    started = []
+    wheel = TimerWheel(create_task=started.append)
+    bot = DummyBot()
+    tracker = MessageTracker(bot, None, summary_interval=60, timers=wheel)
+    logged = []
+    monkeypatch.setattr(msg_mod.logger, "info", lambda msg, **kw: logged.append(msg))
+
+    tracker.register_message(DummyMessage(123))
+    tracker.register_message(DummyMessage(123))
+    assert [e.key for e in wheel.upcoming()] == [msg_mod.SUMMARY_TIMER_KEY]
+
+    later = datetime.datetime.utcnow() + datetime.timedelta(seconds=61)
+    assert wheel.dispatch_due(later) == 1
+    asyncio.run(started.pop())
+
+    assert len(logged) == 1
+    assert "area1: +2 (2)" in logged[0]
+    assert len(wheel) == 0
+
+
+@pytest.mark.asyncio
+async def test_initialize_warms_channels_concurrently(monkeypatch):
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+    fetched = []
+
+    class DummyChannel:
+        def __init__(self, cid):
+            self.id = cid
+
+        def history(self, limit=20):
+            async def gen():
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return
+                yield
+
+            return gen()
+
+    class DummyBot:
+        def __init__(self):
+            self.quiz_data = {
+                f"area{i}": QuizAreaConfig(channel_id=i, activity_threshold=500)
+                for i in range(1, 9)
+            }
+            self.quiz_data["none"] = QuizAreaConfig(channel_id=None)
+            self.user = type("User", (), {"id": 999})()
+
+        async def wait_until_ready(self):
+            pass
+
+        def get_channel(self, cid):
+            return DummyChannel(cid) if cid % 2 else None
+
+        async def fetch_channel(self, cid):
+            fetched.append(cid)
+            return DummyChannel(cid)
+
+    monkeypatch.setattr(msg_mod.discord, "TextChannel", DummyChannel)
+
+    tracker = MessageTracker(DummyBot(), None)
+    await tracker.initialize()
+
+    assert 1 < peak <= msg_mod.WARMUP_CONCURRENCY
+    assert sorted(fetched) == [2, 4, 6, 8]
+    assert all(tracker.is_initialized(i) for i in range(1, 9))
+    # One history page at most, even with a huge threshold.
+    assert tracker.get(1) == 500
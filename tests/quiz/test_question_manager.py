@@ -52,8 +52,11 @@ class DummyState:
 
 
 class DummyCloser:
-    async def auto_close(self, area, delay):
-        pass
+    def __init__(self):
+        self.scheduled = []
+
+    def schedule_close(self, area, end_time):
+        self.scheduled.append((area, end_time))
 
 
 class DummyCog:
@@ -105,6 +108,7 @@ async def test_ask_question_posts_and_tracks(monkeypatch):
     assert cog.tracker.reset_called
     assert cog.state.recorded
     assert channel.sent
+    assert cog.closer.scheduled == [("area", cog.current_questions["area"].end_time)]
 
 
 @pytest.mark.asyncio
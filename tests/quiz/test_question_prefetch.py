@@ -0,0 +1,130 @@
+import random
+
+import pytest
+
+from lotus_bot.cogs.quiz.question_generator import QuestionGenerator
+from lotus_bot.cogs.quiz.question_prefetch import PreparedQuestion, QuestionPrefetcher
+from lotus_bot.cogs.quiz.quiz_config import QuizAreaConfig
+
+
+class DummyStateManager:
+    def __init__(self):
+        self.asked = {}
+
+    def filter_unasked_questions(self, area, questions):
+        asked = set(self.asked.get(area, []))
+        return [q for q in questions if q.get("id") not in asked]
+
+    async def mark_question_as_asked(self, area, question_id):
+        self.asked.setdefault(area, []).append(question_id)
+
+    def get_asked_questions(self, area):
+        return self.asked.get(area, [])
+
+
+class DummyBot:
+    def __init__(self, generator):
+        self.quiz_data = {"area": QuizAreaConfig(question_generator=generator)}
+
+
+def make_prefetcher(count=4):
+    questions = {
+        "de": {
+            "area": [
+                {"id": i, "frage": f"f{i}", "antwort": f"a{i}", "difficulty": "hard"}
+                for i in range(1, count + 1)
+            ]
+        }
+    }
+    state = DummyStateManager()
+    generator = QuestionGenerator(questions, state, {})
+    pending = []
+    prefetch = QuestionPrefetcher(DummyBot(generator), create_task=pending.append)
+    return prefetch, state, pending
+
+
+async def drain(pending):
+    while pending:
+        await pending.pop(0)
+
+
+@pytest.mark.asyncio
+async def test_refill_does_not_consume_history(monkeypatch):
+    monkeypatch.setattr(random, "choice", lambda seq: seq[0])
+    prefetch, state, pending = make_prefetcher()
+
+    prefetch.refill("area")
+    prefetch.refill("area")  # coalesced while a refill is running
+    assert len(pending) == 1
+    await drain(pending)
+
+    assert prefetch.size("area") == 2
+    assert [q.id for q in prefetch.queues[("area", "scheduled")]] == [1, 2]
+    assert state.asked == {}
+
+
+@pytest.mark.asyncio
+async def test_take_marks_asked_and_refills(monkeypatch):
+    monkeypatch.setattr(random, "choice", lambda seq: seq[0])
+    prefetch, state, pending = make_prefetcher()
+    prefetch.refill("area")
+    await drain(pending)
+
+    prepared = await prefetch.take("area")
+
+    assert prepared.id == 1
+    assert prepared.answers == ["a1"]
+    embed = prepared.embed("Quiz für AREA")
+    assert embed.title == "Quiz für AREA"
+    assert [f.name for f in embed.fields] == ["Kategorie", "Schwierigkeit"]
+    assert state.asked == {"area": [1]}
+    assert prefetch.hits == 1
+
+    await drain(pending)
+    assert [q.id for q in prefetch.queues[("area", "scheduled")]] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_take_skips_stale_entries_and_falls_back(monkeypatch):
+    monkeypatch.setattr(random, "choice", lambda seq: seq[0])
+    prefetch, state, pending = make_prefetcher()
+    prefetch.refill("area")
+    await drain(pending)
+
+    # Question 1 was asked elsewhere, question 2 is in the wrong language.
+    state.asked["area"] = [1]
+    prefetch.queues[("area", "scheduled")][1].language = "en"
+
+    prepared = await prefetch.take("area")
+    # Both queued entries are dropped; question 2 is regenerated inline.
+    assert prepared.id == 2
+    assert prefetch.size("area") == 0
+    assert prefetch.misses == 1
+    assert state.asked == {"area": [1, 2]}
+    await drain(pending)
+
+
+@pytest.mark.asyncio
+async def test_take_duel_set_uses_prepared_set():
+    class Provider:
+        def generate_all_types(self, context="scheduled"):
+            return [
+                {"id": 1, "frage": "f1", "antwort": "a1"},
+                {"id": 2, "frage": "f2", "antwort": ["a2", "b2"]},
+            ]
+
+    state = DummyStateManager()
+    state.asked = {"area": [1]}
+    generator = QuestionGenerator({}, state, {"area": Provider()})
+    pending = []
+    prefetch = QuestionPrefetcher(DummyBot(generator), create_task=pending.append)
+
+    prefetch.refill_duel_set("area")
+    await drain(pending)
+    questions = await prefetch.take_duel_set("area")
+
+    assert [q.id for q in questions] == [2]
+    assert isinstance(questions[0], PreparedQuestion)
+    assert questions[0].answers == ["a2", "b2"]
+    assert prefetch.hits == 1
+    await drain(pending)
@@ -18,13 +18,18 @@ class DummyBot:
             {
                 "current_questions": {},
                 "answered_users": {"area": set()},
-                "closer": type("Closer", (), {"auto_close": lambda *a, **k: None})(),
+                "closer": type(
+                    "Closer", (), {"schedule_close": lambda *a, **k: None}
+                )(),
             },
         )()
 
-    async def fetch_channel(self, cid):
+    def get_channel(self, cid):
         return self._channel
 
+    async def fetch_channel(self, cid):
+        raise AssertionError("cached channel should be used")
+
 
 class DummyMessage:
     def __init__(self, mid):
@@ -49,14 +54,15 @@ class DummyChannel:
 
 
 class DummyState:
-    def __init__(self):
+    def __init__(self, active=None):
         self.cleared = []
+        self.active = active
 
     async def clear_active_question(self, area):
         self.cleared.append(area)
 
     def get_active_question(self, area):
-        return None
+        return self.active
 
 
 def make_restorer(channel):
@@ -103,3 +109,22 @@ async def test_repost_question_missing_message():
     await rest.repost_question("area", qinfo)
 
     assert state.cleared == ["area"]
+
+
+@pytest.mark.asyncio
+async def test_restore_all_restores_and_clears_expired():
+    channel = DummyChannel()
+    rest, bot, state = make_restorer(channel)
+    state.active = QuestionInfo(
+        message_id=42,
+        end_time=datetime.datetime.utcnow() + datetime.timedelta(minutes=1),
+        answers=["a"],
+        frage="f",
+    )
+
+    await rest.restore_all()
+    assert bot.quiz_cog.current_questions["area"].message_id == 42
+
+    state.active.end_time = datetime.datetime.utcnow() - datetime.timedelta(seconds=1)
+    await rest.restore_all()
+    assert state.cleared == ["area"]
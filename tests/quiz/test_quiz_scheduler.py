@@ -45,9 +45,10 @@ async def test_scheduler_start_and_stop(monkeypatch, patch_logged_task, bot):
     monkeypatch.setattr(bot, "get_cog", lambda name: cog if name == "QuizCog" else None)
 
     assert list(cog.schedulers.keys()) == ["area1"]
-    assert len(cog.tasks) == 3  # tracker, restorer, scheduler
-    task = cog.schedulers["area1"].task
+    assert len(cog.tasks) == 3  # timer wheel, tracker, restorer
+    task = cog.timers.task
     assert not task.cancelled
+    assert [e.key for e in cog.timers.upcoming()] == ["area1:window"]
 
     cog.cog_unload()
     await cog.wait_closed()
@@ -100,12 +101,12 @@ async def test_enable_starts_and_disable_stops(monkeypatch, patch_logged_task, b
     await slash_mod.enable.callback(inter, "area1")
 
     assert "area1" in cog.schedulers
-    task = cog.schedulers["area1"].task
-    assert not task.cancelled
+    assert "area1:window" in cog.timers
+    assert len(cog.tasks) == 3
 
     await slash_mod.disable.callback(inter)
 
     assert "area1" not in cog.schedulers
-    assert task.cancelled
+    assert "area1:window" not in cog.timers
     cog.cog_unload()
     await cog.wait_closed()
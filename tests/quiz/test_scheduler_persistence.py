@@ -1,5 +1,4 @@
 import datetime
-import asyncio
 import pytest
 
 import lotus_bot.cogs.quiz.cog as quiz_cog_mod
@@ -26,11 +25,6 @@ async def test_scheduler_resume(monkeypatch, patch_logged_task, tmp_path):
 
     monkeypatch.setattr(quiz_cog_mod.QuestionRestorer, "restore_all", dummy_restore)
 
-    async def dummy_prepare(self, area, end):
-        raise asyncio.CancelledError()
-
-    monkeypatch.setattr(quiz_cog_mod.QuestionManager, "prepare_question", dummy_prepare)
-
     state_file = tmp_path / "state.json"
     manager = QuestionStateManager(str(state_file))
 
@@ -50,24 +44,12 @@ async def test_scheduler_resume(monkeypatch, patch_logged_task, tmp_path):
         bot, "get_cog", lambda name: cog if name == "QuizCog" else None, raising=False
     )
 
-    async def instant_sleep(delay):
-        return
-
-    async def dummy_prepare(area, end):
-        raise asyncio.CancelledError()
-
-    monkeypatch.setattr(scheduler_mod.asyncio, "sleep", instant_sleep)
     monkeypatch.setattr(scheduler_mod.random, "uniform", lambda a, b: 0)
 
-    async def wait_ready():
-        return
-
-    monkeypatch.setattr(bot, "wait_until_ready", wait_ready, raising=False)
-    monkeypatch.setattr(cog.closer, "close_question", lambda *a, **k: None)
-
     scheduler = cog.schedulers["area1"]
-    with pytest.raises(asyncio.CancelledError):
-        await scheduler.run()
+    await scheduler._begin_window()
+    assert "area1:post" in cog.timers
+    assert "area1:window" in cog.timers
 
     saved = manager.get_schedule("area1")
     assert saved is not None
@@ -95,6 +77,8 @@ async def test_scheduler_resume(monkeypatch, patch_logged_task, tmp_path):
     sched = cog2.schedulers["area1"]
     assert sched.post_time == post_time
     assert sched.window_end == window_end
+    assert cog2.timers.get("area1:post").when == post_time
+    assert cog2.timers.get("area1:window").when == window_end
     cog.cog_unload()
     cog2.cog_unload()
     await cog.wait_closed()
@@ -0,0 +1,155 @@
+import datetime
+
+import pytest
+
+from lotus_bot.cogs.quiz.question_state import QuestionInfo
+from lotus_bot.cogs.quiz.quiz_config import QuizAreaConfig
+from lotus_bot.cogs.quiz.scheduler import QuizScheduler, TimerWheel
+
+
+def make_wheel():
+    started = []
+
+    def create_task(coro):
+        started.append(coro)
+        coro.close()
+
+    return TimerWheel(create_task=create_task), started
+
+
+async def noop():
+    return None
+
+
+def test_upcoming_sorted_by_due_time():
+    wheel, _ = make_wheel()
+    now = datetime.datetime.utcnow()
+    wheel.schedule("b", now + datetime.timedelta(seconds=20), noop, kind="post")
+    wheel.schedule("a", now + datetime.timedelta(seconds=10), noop, kind="close")
+    wheel.schedule("c", now + datetime.timedelta(seconds=30), noop)
+
+    assert [e.key for e in wheel.upcoming()] == ["a", "b", "c"]
+    assert [e.key for e in wheel.upcoming(limit=2)] == ["a", "b"]
+    assert len(wheel) == 3
+
+
+def test_reschedule_and_cancel():
+    wheel, _ = make_wheel()
+    now = datetime.datetime.utcnow()
+    wheel.schedule("a", now + datetime.timedelta(seconds=10), noop)
+    wheel.schedule("b", now + datetime.timedelta(seconds=20), noop)
+
+    assert wheel.reschedule("a", now + datetime.timedelta(seconds=30))
+    assert [e.key for e in wheel.upcoming()] == ["b", "a"]
+    assert not wheel.reschedule("missing", now)
+
+    assert wheel.cancel("b")
+    assert not wheel.cancel("b")
+    assert [e.key for e in wheel.upcoming()] == ["a"]
+
+
+def test_dispatch_due_skips_cancelled_and_future():
+    wheel, started = make_wheel()
+    now = datetime.datetime.utcnow()
+    wheel.schedule("due", now - datetime.timedelta(seconds=1), noop)
+    wheel.schedule("gone", now - datetime.timedelta(seconds=1), noop)
+    wheel.schedule("later", now + datetime.timedelta(seconds=60), noop)
+    wheel.cancel("gone")
+
+    assert wheel.dispatch_due(now) == 1
+    assert len(started) == 1
+    assert "due" not in wheel
+    assert [e.key for e in wheel.upcoming()] == ["later"]
+    assert 59 <= wheel.next_delay(now) <= 60
+
+
+def test_cancel_area_and_compaction():
+    wheel, _ = make_wheel()
+    now = datetime.datetime.utcnow()
+    for i in range(100):
+        wheel.schedule(f"a{i}", now + datetime.timedelta(seconds=i), noop, area="a")
+    wheel.schedule("b", now, noop, area="b")
+
+    assert wheel.cancel_area("a") == 100
+    assert [e.key for e in wheel.upcoming()] == ["b"]
+    assert len(wheel._heap) < 100
+
+
+class DummyState:
+    def __init__(self):
+        self.schedules = []
+
+    async def set_schedule(self, area, post_time, window_end):
+        self.schedules.append((area, post_time, window_end))
+
+
+class DummyQuizCog:
+    def __init__(self):
+        self.state = DummyState()
+        self.awaiting_activity = {5: ("area", None)}
+        self.current_questions = {}
+
+
+class DummyBot:
+    def __init__(self):
+        self.quiz_data = {"area": QuizAreaConfig(channel_id=5, active=True)}
+        self.quiz_cog = DummyQuizCog()
+
+
+def make_scheduler():
+    wheel, _ = make_wheel()
+    bot = DummyBot()
+    closed = []
+
+    async def prepare(area, end):
+        return None
+
+    async def close(area, qinfo, timed_out=False):
+        closed.append(area)
+        bot.quiz_cog.current_questions.pop(area, None)
+
+    sched = QuizScheduler(bot, "area", prepare, close, timers=wheel)
+    return sched, wheel, bot, closed
+
+
+@pytest.mark.asyncio
+async def test_window_end_starts_next_window():
+    sched, wheel, bot, closed = make_scheduler()
+
+    await sched._on_window_end()
+
+    assert bot.quiz_cog.awaiting_activity == {}
+    assert "area:post" in wheel
+    assert wheel.get("area:window").kind == "window_end"
+    assert bot.quiz_cog.state.schedules
+    assert not closed
+
+
+@pytest.mark.asyncio
+async def test_window_end_waits_for_running_question():
+    sched, wheel, bot, closed = make_scheduler()
+    end = datetime.datetime.utcnow() + datetime.timedelta(minutes=2)
+    bot.quiz_cog.current_questions["area"] = QuestionInfo(
+        message_id=1, end_time=end, answers=["a"], frage="f"
+    )
+
+    await sched._on_window_end()
+
+    assert wheel.get("area:window").when == end
+    assert "area:post" not in wheel
+    assert not bot.quiz_cog.state.schedules
+
+    bot.quiz_cog.current_questions["area"].end_time = datetime.datetime.utcnow()
+    await sched._on_window_end()
+
+    assert closed == ["area"]
+    assert "area:post" in wheel
+
+
+def test_stop_cancels_area_events():
+    sched, wheel, _, _ = make_scheduler()
+    sched.start()
+    assert "area:window" in wheel
+
+    sched.stop()
+    assert len(wheel) == 0
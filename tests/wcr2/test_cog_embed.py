@@ -1,7 +1,9 @@
 import json
 import asyncio
+import tempfile
 from pathlib import Path
 from lotus_bot.cogs.wcr.cog import WCRCog
+import lotus_bot.cogs.wcr.cog as cog_mod
 from lotus_bot.cogs.wcr import utils
 
 
@@ -27,11 +29,11 @@ def create_cog():
     bot = DummyBot({"emojis": {}})
 
     # build wcr data using loader to populate locals
-    async def fake_fetch(url):
+    async def fake_fetch(url, validators=None):
         return data
 
     utils.fetch_wcr_data = fake_fetch
-    utils.CACHE_FILE = Path("tests/data/cache.json")
+    utils.CACHE_FILE = Path(tempfile.mkdtemp()) / "cache.json"
     wcr_data = asyncio.run(utils.load_wcr_data("http://test"))
     bot.data["wcr"] = wcr_data
     return WCRCog(bot)
@@ -41,3 +43,80 @@ def test_create_mini_embed():
     cog = create_cog()
     embed, _ = cog.create_mini_embed("abomination", "en")
     assert embed.title
+
+
+def test_create_mini_embed_uses_cache():
+    cog = create_cog()
+    first, logo_a = cog.create_mini_embed("abomination", "en")
+    second, logo_b = cog.create_mini_embed("Abomination", "en")
+
+    assert second.to_dict() == first.to_dict()
+    assert second is not first
+    if logo_a is not None:
+        assert logo_b is not logo_a
+        assert logo_b.fp.read() == logo_a.fp.read()
+    assert cog.embed_cache.hits == 1
+    assert cog.embed_cache.misses == 1
+
+
+def test_embed_cache_invalidated_on_emoji_and_data_reload():
+    cog = create_cog()
+    cog.create_mini_embed("abomination", "en")
+    assert len(cog.embed_cache) == 1
+
+    # Same content in a new dict keeps the cache.
+    cog.bot.data["emojis"] = {}
+    cog.create_mini_embed("abomination", "en")
+    assert cog.embed_cache.hits == 1
+
+    cog.bot.data["emojis"] = {"wcr_cost": "<:wcr_cost:1>"}
+    embed, _ = cog.create_mini_embed("abomination", "en")
+    assert "<:wcr_cost:1>" in embed.fields[0].name
+    assert cog.embed_cache.misses == 2
+
+    version = cog.data_version
+    cog.load_data(cog.bot.data["wcr"])
+    assert cog.data_version == version + 1
+    assert len(cog.embed_cache) == 0
+
+
+def test_apply_data_hot_swaps_units():
+    cog = create_cog()
+    data = dict(cog.bot.data["wcr"])
+    data["units"] = data["units"][:1]
+    data["version"] = "next"
+
+    cog.apply_data(data)
+
+    assert cog.bot.data["wcr"] is data
+    assert len(cog.store) == 1
+    assert cog.source_version == "next"
+
+
+def test_refresh_loop_survives_errors_with_backoff(monkeypatch):
+    cog = create_cog()
+    sleeps = []
+
+    class Stop(Exception):
+        pass
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        if len(sleeps) >= 8:
+            raise Stop
+
+    async def failing_refresh():
+        raise RuntimeError("API down")
+
+    monkeypatch.setattr(cog_mod.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(utils, "refresh_wcr_data", failing_refresh)
+    monkeypatch.setattr(utils, "refresh_delay", lambda: 0)
+    monkeypatch.setattr(utils, "RETRY_DELAY", 10)
+    monkeypatch.setattr(utils, "MAX_RETRY_DELAY", 30)
+
+    try:
+        asyncio.run(cog._refresh_loop())
+    except Stop:
+        pass
+
+    assert sleeps[1::2] == [10, 20, 30, 30]
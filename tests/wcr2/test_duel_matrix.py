@@ -0,0 +1,82 @@
+import itertools
+
+from lotus_bot.cogs.wcr.duel import DuelCalculator, DuelMatrix
+
+UNITS = [
+    {
+        "id": "footman",
+        "type_id": "1",
+        "trait_ids": ["13"],
+        "stats": {"damage": 40, "health": 600, "attack_speed": 1.0},
+    },
+    {
+        "id": "archer",
+        "type_id": "1",
+        "trait_ids": ["11"],
+        "stats": {"damage": 60, "health": 300, "attack_speed": 1.5},
+    },
+    {
+        "id": "gryphon",
+        "type_id": "1",
+        "trait_ids": ["15"],
+        "stats": {"area_damage": 90, "health": 500, "attack_speed": 2.0},
+    },
+    {
+        "id": "fireball",
+        "type_id": "2",
+        "trait_ids": [],
+        "stats": {"damage": 450},
+    },
+    {
+        "id": "blizzard",
+        "type_id": "2",
+        "trait_ids": [],
+        "stats": {"damage": 20, "attack_speed": 0.5, "duration": 10},
+    },
+]
+
+
+def test_matrix_matches_calculator_for_all_levels():
+    calculator = DuelCalculator()
+    matrix = DuelMatrix(UNITS, calculator)
+
+    for a, b in itertools.product(UNITS, repeat=2):
+        for level_a, level_b in [(1, 1), (5, 5), (1, 10), (20, 3)]:
+            expected = calculator.duel_result(a, level_a, b, level_b)
+            result = matrix.duel_result(a["id"], level_a, b["id"], level_b)
+            if expected is None:
+                assert result is None
+            else:
+                assert result[0] == expected[0]
+                assert abs(result[1] - expected[1]) < 1e-9
+
+            stats = calculator.scaled_stats(a, level_a)
+            dps, notes = matrix.dps_details(a["id"], b["id"], level_a)
+            exp_dps, exp_notes = calculator.compute_dps_details(a, stats, b)
+            assert abs(dps - exp_dps) < 1e-9
+            assert notes == exp_notes
+
+
+def test_flight_block_and_stats():
+    matrix = DuelMatrix(UNITS)
+
+    assert matrix.cell("footman", "gryphon").blocked is True
+    assert matrix.cell("archer", "gryphon").blocked is False
+    assert matrix.cell("fireball", "gryphon").blocked is False
+    assert matrix.stats("footman", 11) == {
+        "health": 1200.0,
+        "damage": 80.0,
+        "dps": 80.0,
+    }
+    assert "dps" not in matrix.stats("fireball")
+
+
+def test_best_counters_sorted_by_time():
+    matrix = DuelMatrix(UNITS)
+
+    counters = matrix.best_counters("archer")
+    assert [cid for cid, _ in counters] == ["gryphon", "footman"]
+    assert counters[0][1] < counters[1][1]
+    assert matrix.best_counters("archer", include_spells=True)[0] == ("fireball", 0.0)
+    # Higher counter level turns the gryphon into an even faster counter.
+    assert matrix.best_counters("archer", 1, 10)[0][1] < counters[0][1]
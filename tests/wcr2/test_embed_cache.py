@@ -0,0 +1,39 @@
+import discord
+
+from lotus_bot.cogs.wcr.embed_cache import CachedEmbed, EmbedCache
+
+
+def make_entry(title):
+    return CachedEmbed.from_rendered(discord.Embed(title=title), None)
+
+
+def test_lru_eviction_and_metrics():
+    cache = EmbedCache(maxsize=2)
+    cache.put("a", make_entry("A"))
+    cache.put("b", make_entry("B"))
+    assert cache.get("a") is not None  # "a" is now most recently used
+    cache.put("c", make_entry("C"))
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.stats() == {
+        "size": 2,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "hit_rate": 0.5,
+    }
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_materialize_returns_fresh_objects():
+    entry = CachedEmbed(discord.Embed(title="X").to_dict(), "logo.png", b"png")
+    embed_a, file_a = entry.materialize()
+    embed_b, file_b = entry.materialize()
+
+    assert embed_a.title == embed_b.title == "X"
+    assert embed_a is not embed_b
+    assert file_a.filename == "logo.png"
+    assert file_a.fp.read() == file_b.fp.read() == b"png"
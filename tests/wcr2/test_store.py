@@ -0,0 +1,69 @@
+from lotus_bot.cogs.wcr.store import WCRUnitStore
+
+UNITS = [
+    {
+        "id": "footman",
+        "cost": 2,
+        "speed_id": "slow",
+        "faction_ids": ["alliance"],
+        "type_id": "troop",
+        "trait_ids": ["melee"],
+    },
+    {
+        "id": "archer",
+        "cost": 3,
+        "speed_id": "fast",
+        "faction_ids": ["alliance", "blackrock"],
+        "type_id": "troop",
+        "trait_ids": ["ranged"],
+    },
+    {
+        "id": "fireball",
+        "cost": 3,
+        "faction_id": "blackrock",
+        "type_id": "spell",
+        "trait_ids": [],
+    },
+]
+LANGUAGES = {
+    "en": {
+        "units": [
+            {"id": "footman", "name": "Footman", "description": "d"},
+            {"id": "archer", "name": "Archer"},
+            {"id": "fireball", "name": "Fireball"},
+        ]
+    },
+    "de": {"units": [{"id": "footman", "name": "Fußsoldat"}]},
+}
+
+
+def test_lookup_and_texts():
+    store = WCRUnitStore(UNITS, LANGUAGES)
+
+    assert store.get("archer") is UNITS[1]
+    assert store.get("missing") is None
+    assert store.text("footman", "en") == ("Footman", "d", [])
+    assert store.name("footman", "de") == "Fußsoldat"
+    assert store.name("archer", "de") == "Unbekannt"
+    assert store.name("archer", "fr") == "Archer"
+
+
+def test_filter_intersects_bitsets():
+    store = WCRUnitStore(UNITS, LANGUAGES)
+
+    ids = lambda units: [u["id"] for u in units]  # noqa: E731
+    assert ids(store.filter(cost="3")) == ["archer", "fireball"]
+    assert ids(store.filter(cost=3, faction="alliance")) == ["archer"]
+    assert ids(store.filter(faction="blackrock", type="spell")) == ["fireball"]
+    assert ids(store.filter(speed=None, trait="melee")) == ["footman"]
+    assert store.filter(cost="9") == []
+    assert store.count(type="troop") == 2
+    assert len(store.filter()) == 3
+
+
+def test_match_names_across_languages():
+    store = WCRUnitStore(UNITS, LANGUAGES)
+
+    assert store.match_names("fuß") == ["footman"]
+    assert store.match_names("") == ["footman", "archer", "fireball"]
+    assert store.match_names("", limit=2) == ["footman", "archer"]
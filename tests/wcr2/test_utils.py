@@ -4,22 +4,88 @@ import pytest
 from lotus_bot.cogs.wcr import utils
 
 
-@pytest.mark.asyncio
-async def test_load_wcr_data(monkeypatch):
-    async def fake_fetch(url):
-        base = Path("tests/data")
-        return {
-            "units": {
-                "units": json.load(open(base / "wcr_units.json", encoding="utf-8"))
-            },
-            "categories": json.load(
-                open(base / "wcr_categories.json", encoding="utf-8")
-            ),
-            "faction_combinations": {},
-        }
+def api_payload():
+    base = Path("tests/data")
+    return {
+        "units": {"units": json.load(open(base / "wcr_units.json", encoding="utf-8"))},
+        "categories": json.load(open(base / "wcr_categories.json", encoding="utf-8")),
+        "faction_combinations": {},
+    }
+
+
+@pytest.fixture
+def fetcher(monkeypatch, tmp_path):
+    calls = []
+    responses = []
+
+    async def fake_fetch(url, validators=None):
+        calls.append(validators)
+        return responses.pop(0) if responses else api_payload()
 
     monkeypatch.setattr(utils, "fetch_wcr_data", fake_fetch)
-    monkeypatch.setattr(utils, "CACHE_FILE", Path("tests/data/cache.json"))
+    monkeypatch.setattr(utils, "CACHE_FILE", tmp_path / "cache.json")
+    return calls, responses
+
+
+@pytest.mark.asyncio
+async def test_load_wcr_data(fetcher):
     data = await utils.load_wcr_data("http://test")
     assert len(data["units"]) == 3
     assert "en" in data["locals"]
+    assert data["version"]
+
+
+@pytest.mark.asyncio
+async def test_load_serves_cache_without_fetching(fetcher, monkeypatch):
+    calls, _ = fetcher
+    first = await utils.load_wcr_data("http://test")
+    monkeypatch.setattr(utils, "CACHE_TTL", 1)
+
+    # Even a stale cache is returned instantly; revalidation runs later.
+    second = await utils.load_wcr_data("http://test")
+
+    assert len(calls) == 1
+    assert second == first
+    assert utils.refresh_delay() <= 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_keeps_cache_on_incomplete_response(fetcher):
+    calls, responses = fetcher
+    data = await utils.load_wcr_data("http://test")
+
+    responses.append({"units": api_payload()["units"]})  # categories failed
+    assert await utils.refresh_wcr_data("http://test") is None
+    assert utils.read_cache()["data"] == data
+
+
+@pytest.mark.asyncio
+async def test_refresh_revalidates_and_detects_changes(fetcher):
+    calls, responses = fetcher
+    await utils.load_wcr_data("http://test")
+    cache = utils.read_cache()
+    cache["validators"] = {"units": {"etag": '"abc"'}}
+    utils.write_cache({k: v for k, v in cache.items() if k != "format"})
+
+    # Both endpoints answer 304 -> cached raw payloads are reused.
+    responses.append({"validators": cache["validators"]})
+    assert await utils.refresh_wcr_data("http://test") is None
+    assert calls[-1] == {"units": {"etag": '"abc"'}}
+
+    changed = api_payload()
+    changed["units"]["units"] = changed["units"]["units"][:2]
+    responses.append(changed)
+    data = await utils.refresh_wcr_data("http://test")
+    assert len(data["units"]) == 2
+    assert data["version"] != cache["version"]
+    assert utils.read_cache()["version"] == data["version"]
+
+
+def test_read_legacy_cache(monkeypatch, tmp_path):
+    legacy = tmp_path / "cache.json"
+    legacy.write_text(json.dumps({"units": [], "locals": {}}), encoding="utf-8")
+    monkeypatch.setattr(utils, "CACHE_FILE", legacy)
+
+    cached = utils.read_cache()
+    assert cached["data"] == {"units": [], "locals": {}}
+    assert cached["raw"] is None
@@ -224,6 +224,9 @@ class DummyData:
     async def get_snapshot(self):
         return self.snapshot
 
+    async def roster_names(self):
+        return sorted({m.name for m in self.snapshot.values()}, key=str.casefold)
+
     async def ghost_members(self):
         return list(self.ghosts)
 
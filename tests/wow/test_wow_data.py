@@ -1,6 +1,16 @@
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+
 import pytest
 
-from lotus_bot.cogs.wow.data import RosterMember, WoWData, parse_roster_member
+from lotus_bot.cogs.wow.cog import WoWCog
+from lotus_bot.cogs.wow.data import (
+    SCHEMA_VERSION,
+    RosterMember,
+    WoWData,
+    parse_roster_member,
+)
 
 pytestmark = pytest.mark.asyncio
 
@@ -180,6 +190,62 @@ async def test_init_db_seeds_baseline_from_legacy_snapshot(tmp_path):
     await data.close()
 
 
+async def test_init_db_skips_schema_when_up_to_date(tmp_path):
+    db_path = str(tmp_path / "wow.db")
+    data = WoWData(db_path)
+    await data.init_db()
+    await data.close()
+
+    statements = []
+    data = WoWData(db_path)
+    data._pool.add_listener(lambda sql, params, ms: statements.append(sql))
+    await data.init_db()
+    await data.init_db()
+
+    assert not [sql for sql in statements if "CREATE" in sql or "ALTER" in sql]
+    assert len(statements) == 3  # BEGIN, user_version, baseline seed
+    assert data.init_ms > 0
+    await data.close()
+
+
+async def test_init_db_upgrades_legacy_database(tmp_path):
+    """A pre-runner database (user_version 0, old columns) is migrated once."""
+    db_path = tmp_path / "wow.db"
+    legacy = sqlite3.connect(db_path)
+    legacy.executescript("""
+        CREATE TABLE roster_snapshot (
+            character_key TEXT PRIMARY KEY, character_id INTEGER,
+            name TEXT NOT NULL, realm_slug TEXT NOT NULL, level INTEGER NOT NULL,
+            class_id INTEGER, race_id INTEGER, faction TEXT, guild_rank INTEGER,
+            updated_at TEXT NOT NULL
+        );
+        CREATE TABLE reputation_events (character_key TEXT);
+        INSERT INTO roster_snapshot VALUES
+            ('id:1', 1, 'Lyxendra', 'soulseeker', 44, 4, 8, 'HORDE', 1, 'now');
+        """)
+    legacy.close()
+
+    data = WoWData(str(db_path))
+    await asyncio.gather(data.init_db(), data.init_db(), data.init_db())
+
+    db = await data._get_db()
+    cur = await db.execute("PRAGMA user_version")
+    assert (await cur.fetchone())[0] == SCHEMA_VERSION
+    cur = await db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    tables = {row[0] for row in await cur.fetchall()}
+    assert "reputation_events" not in tables and "bank_characters" in tables
+    assert (await data.get_snapshot())["id:1"].is_ghost is False
+    assert set(await data.get_digest_baseline()) == {"id:1"}
+    await data.close()
+
+
+async def test_cog_load_runs_migrations(tmp_path):
+    data = WoWData(str(tmp_path / "wow.db"))
+    await WoWCog.cog_load(SimpleNamespace(data=data))
+    assert data._init_done
+    await data.close()
+
+
 async def test_ghost_members_filters_and_orders_by_level(tmp_path):
     data = WoWData(str(tmp_path / "wow.db"))
     alive = roster_member(name="Alive", key="id:alive")
@@ -0,0 +1,130 @@
+"""EXPLAIN QUERY PLAN regression tests for the hot ``WoWData`` lookups."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from lotus_bot.cogs.wow.data import SCHEMA_VERSION, WoWData
+
+pytestmark = pytest.mark.asyncio
+
+CHARACTERS = 3000
+NOW = datetime(2026, 1, 1)
+
+
+def _iso(offset_hours: int) -> str:
+    return (NOW + timedelta(hours=offset_hours)).isoformat()
+
+
+async def _seed(data: WoWData) -> None:
+    db = await data._get_db()
+    roster, claims, professions, recipes, cooldowns, deaths = [], [], [], [], [], []
+    for i in range(CHARACTERS):
+        key = f"id:{i}"
+        roster.append(
+            (key, i, f"Char{i}", "soulseeker", 10 + i % 50, i % 9, i % 8, "HORDE", 3)
+            + (int(i % 17 == 0), _iso(0))
+        )
+        if i % 3:
+            continue
+        status = "verified" if i % 2 else "unverified"
+        claims.append(
+            (key, f"Char{i}", "soulseeker", 1000 + i // 6, status, _iso(-i), 5000 + i)
+        )
+        professions.append((key, "alchemy" if i % 2 else "tailoring", i % 300 + 1))
+        recipes.append((key, str(1000 + i % 40), "alchemy", _iso(0)))
+        cooldowns.append((key, "transmute", "1", "Transmute", _iso(-24), _iso(i % 72)))
+        if i % 31 == 0:
+            deaths.append((key, _iso(0)))
+
+    await db.executemany(
+        "INSERT INTO roster_snapshot VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", roster
+    )
+    await db.executemany(
+        "INSERT INTO character_claims VALUES (?, ?, ?, ?, ?, ?, NULL, NULL, ?)", claims
+    )
+    await db.executemany(
+        "INSERT INTO character_professions VALUES (?, ?, ?, NULL, '')", professions
+    )
+    await db.executemany(
+        "INSERT INTO character_known_recipes VALUES (?, ?, ?, ?)", recipes
+    )
+    await db.executemany(
+        "INSERT INTO profession_cooldowns VALUES (?, ?, ?, ?, ?, ?)", cooldowns
+    )
+    await db.executemany("INSERT INTO death_events VALUES (?, ?)", deaths)
+    await db.commit()
+
+
+HOT_QUERIES = [
+    ("get_claim", ("id:42",)),
+    ("get_claim_by_name", ("Char42",)),
+    ("get_claim_by_review_message", (5042,)),
+    ("claims_for_user", (1007,)),
+    ("list_claims", ("verified",)),
+    ("professions_for_user", (1007,)),
+    ("professions_for_character", ("id:42",)),
+    ("find_crafters", ("alchemy", 250)),
+    ("find_crafters_with_known_recipe", ("alchemy", 250, "1005")),
+    ("known_recipes_for_character", ("id:42",)),
+    ("cooldowns_for_character", ("id:42",)),
+    ("cooldowns_for_user", (1007,)),
+    ("cooldowns_ready_in_window", (_iso(10), _iso(12))),
+    ("active_cooldown_count", ()),
+]
+
+
+@pytest.fixture
+async def seeded(tmp_path):
+    data = WoWData(str(tmp_path / "wow.db"))
+    await data.init_db()
+    await _seed(data)
+    yield data
+    await data.close()
+
+
+async def _capture(data: WoWData, method: str, args: tuple) -> list[tuple]:
+    statements: list[tuple] = []
+
+    def recording(sql, params, elapsed_ms):
+        statements.append((sql, params))
+
+    data._pool.add_listener(recording)
+    try:
+        await getattr(data, method)(*args)
+    finally:
+        data._pool.remove_listener(recording)
+    return [s for s in statements if s[0].lstrip().upper().startswith("SELECT")]
+
+
+@pytest.mark.parametrize("method,args", HOT_QUERIES, ids=[m for m, _ in HOT_QUERIES])
+async def test_hot_query_uses_indexes(seeded, method, args):
+    statements = await _capture(seeded, method, args)
+    assert statements, f"{method} issued no SELECT"
+
+    db = await seeded._get_db()
+    for sql, params in statements:
+        cur = await db.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        plan = [row[3] for row in await cur.fetchall()]
+        scans = [step for step in plan if step.startswith("SCAN")]
+        assert not scans, f"{method} regressed to a scan: {plan}"
+
+
+async def test_migrations_bump_user_version(seeded):
+    db = await seeded._get_db()
+    cur = await db.execute("PRAGMA user_version")
+    assert (await cur.fetchone())[0] == SCHEMA_VERSION
+
+    cur = await db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+    )
+    assert {"idx_roster_name", "idx_claims_user", "idx_cooldowns_ready"} <= {
+        row[0] for row in await cur.fetchall()
+    }
+
+
+async def test_hot_queries_return_seeded_rows(seeded):
+    member = await seeded.find_roster_member_by_name("char42")
+    assert member.character_key == "id:42"
+    crafters = await seeded.find_crafters("alchemy", 250)
+    assert crafters and all(c.skill_level >= 250 for c in crafters)